@@ -5,20 +5,62 @@ GitHub Actions에서 실행되어 대시보드 데이터를 업데이트합니
 
 데이터 흐름:
   Notion DB → Python Script → data/budget.json → Dashboard
+  (+ 경량 번들 data/budget.summary.json / budget.min.json / shards/budget/, data/manifest.json
+   - scripts/dashboard_bundle.py 참고, 스트리밍 모드에서는 manifest만)
+  (+ index.html 사전 렌더링 - scripts/render_dashboard.py 참고)
+  (+ data/history/budget_history.sqlite 집행 이력 스냅샷 - scripts/budget_history.py 참고, 스트리밍 모드에서는 생략)
+  (+ data/forecast.json 사업종료일 집행 전망 / 불용·초과 위험 - scripts/budget_forecast.py 참고, 스트리밍 모드에서는 생략)
+  (+ data/version.json, data/deltas/budget/: 이전 버전 → 현재 JSON Patch - scripts/data_versions.py 참고,
+   스트리밍 모드에서는 버전 해시만)
+
+data/budget.json에는 실행 시각을 넣지 않고(data/meta.json에 기록) 항목을 비목 / 세목 / 항목명
+순으로 정렬하므로, 데이터가 그대로면 파일도 바뀌지 않아 워크플로우가 커밋을 건너뜁니다.
+
+지난 실행의 스냅샷(.cache/fetch_snapshot.json)이 있으면 변경된 페이지만 조회합니다.
+(scripts/export_snapshot.py 참고)
+
+기본 모드는 스냅샷 / 경량 번들 / 이력 / 전망을 위해 항목 전체를 메모리에 둡니다.
+FETCH_STREAMING=1이면 스냅샷 대신 비목 파티션을 하나씩 조회해 변환·요약·저장하므로 메모리에는
+파티션 하나(+ 목록 밖 / 빈 비목 항목)만 둡니다. 항목 순서는 기본 모드와 같습니다(ITEM_ORDER).
+스트리밍 모드는 data/budget.json / manifest / version만 갱신하는 축소 모드입니다.
+경량 번들, 증분 패치, 집행 이력, 집행 전망은 만들지 않습니다. (README_BMS.md 참고)
+NOTION_SCAN_PARTITIONS=1이면 비목별 파티션으로 나눠 동시에 조회합니다. (scripts/notion_pager.py 참고)
 """
 
 import os
-import json
-import requests
-from datetime import datetime
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+from budget_cube import BudgetCube
+from budget_forecast import PROJECT_END_DATE, days_remaining, forecast_after_export
+from budget_history import record_history
+from dashboard_bundle import SHARD_FIELD, print_bundle, publish, sort_items, write_bundle
+from data_versions import print_version, read_base, update_versions
+from export_snapshot import load_items
+from http_client import get_client
+from json_stream import file_hash, write_json, write_json_stream
+from notion_pager import EMPTY_PARTITION, OTHER_PARTITION, iter_query, scan_database
+from notion_schema import extract_budget_item
+from render_dashboard import render_after_export
+from run_metrics import write_run_metrics
+from sync_budget_to_notion import bimok_partitions
 
 # 환경변수
 NOTION_API_KEY = os.environ.get("NOTION_API_KEY")
 DATABASE_ID = os.environ.get("NOTION_DATABASE_ID", "54bfedc3769e43e8bdbcd59f22008417")
 
-NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_API_URL = os.getenv("NOTION_API_URL", "https://api.notion.com/v1")
 NOTION_VERSION = "2022-06-28"
 
+OUTPUT_PATH = "data/budget.json"
+# 경량 번들 데이터셋 이름 (scripts/dashboard_bundle.py)
+BUNDLE_NAME = "budget"
+# 1이면 스냅샷 없이 조회 결과를 바로 파일로 흘려보냄 (DB가 커도 메모리 사용량 일정)
+FETCH_STREAMING = os.getenv("FETCH_STREAMING", "") == "1"
+# 스트리밍 요약에서 롤업 큐브로 한 번에 접는 항목 수
+SUMMARY_CHUNK = 5000
+
 def get_headers():
     return {
         "Authorization": f"Bearer {NOTION_API_KEY}",
@@ -26,115 +68,142 @@ def get_headers():
         "Notion-Version": NOTION_VERSION,
     }
 
-def extract_property(props, name, prop_type):
-    """Notion 속성에서 값 추출"""
-    prop = props.get(name, {})
-    
-    if prop_type == "title":
-        titles = prop.get("title", [])
-        return titles[0]["plain_text"] if titles else ""
-    elif prop_type == "rich_text":
-        texts = prop.get("rich_text", [])
-        return texts[0]["plain_text"] if texts else ""
-    elif prop_type == "number":
-        return prop.get("number") or 0
-    elif prop_type == "select":
-        sel = prop.get("select")
-        return sel["name"] if sel else ""
-    elif prop_type == "date":
-        date_obj = prop.get("date")
-        return date_obj["start"] if date_obj else ""
-    
-    return None
-
-def query_database():
-    """Notion 데이터베이스 전체 조회"""
-    url = f"{NOTION_API_URL}/databases/{DATABASE_ID}/query"
-    results = []
-    has_more = True
-    start_cursor = None
-    
-    while has_more:
-        payload = {"page_size": 100}
-        if start_cursor:
-            payload["start_cursor"] = start_cursor
-        
-        resp = requests.post(url, headers=get_headers(), json=payload)
-        if resp.status_code != 200:
-            print(f"❌ API 오류: {resp.status_code} - {resp.text}")
-            break
-            
-        data = resp.json()
-        results.extend(data.get("results", []))
-        has_more = data.get("has_more", False)
-        start_cursor = data.get("next_cursor")
-    
-    return results
-
-def transform_page(page):
-    """Notion 페이지를 JSON 객체로 변환"""
-    props = page.get("properties", {})
+def iter_database(query_filter=None, filter_properties=None):
+    """Notion 데이터베이스 조회 결과를 한 건씩 반환 (다음 커서 페이지는 미리 요청)
     
-    return {
-        "id": page["id"],
-        "항목명": extract_property(props, "항목명", "title"),
-        "비목": extract_property(props, "비목", "select"),
-        "세목": extract_property(props, "세목", "rich_text"),
-        "총예산": extract_property(props, "총예산", "number"),
-        "사용금액_공급가": extract_property(props, "사용금액(공급가)", "number"),
-        "사용금액_VAT": extract_property(props, "사용금액(VAT)", "number"),
-        "사용금액_합계": extract_property(props, "사용금액(합계)", "number"),
-        "잔액": extract_property(props, "잔액", "number"),
-        "집행률": extract_property(props, "집행률", "number"),
-        "상태": extract_property(props, "상태", "select"),
-        "2024년예산": extract_property(props, "2024년예산", "number"),
-        "2024년집행": extract_property(props, "2024년집행", "number"),
-        "2025년예산": extract_property(props, "2025년예산", "number"),
-        "2025년집행": extract_property(props, "2025년집행", "number"),
-        "최종동기화": extract_property(props, "최종동기화", "date"),
-    }
+    조회 실패 시 NotionQueryError - 일부 결과로 저장하면 대시보드 / 스냅샷에서 항목이 사라지므로 중단
+    """
+    url = f"{NOTION_API_URL}/databases/{DATABASE_ID}/query"
+    return scan_database(url, get_headers(), query_filter, filter_properties, partitions=bimok_partitions())
+
+def query_database(query_filter=None, filter_properties=None):
+    """Notion 데이터베이스 조회 (기본 전체, query_filter / filter_properties로 범위·속성 제한)"""
+    return list(iter_database(query_filter, filter_properties))
 
-def calculate_summary(items):
-    """요약 통계 계산"""
-    total_budget = sum(item["총예산"] for item in items)
-    total_used = sum(item["사용금액_합계"] for item in items)
-    total_remaining = sum(item["잔액"] for item in items)
-    
-    # 상태별 카운트
-    status_count = {"정상": 0, "주의": 0, "초과": 0, "미집행": 0}
-    for item in items:
-        status = item.get("상태", "")
-        if status in status_count:
-            status_count[status] += 1
-    
-    # 비목별 집계
-    bimok_summary = {}
-    for item in items:
-        bimok = item.get("비목", "기타")
-        if not bimok:
-            bimok = "기타"
-        if bimok not in bimok_summary:
-            bimok_summary[bimok] = {"예산": 0, "집행": 0, "잔액": 0, "항목수": 0}
-        bimok_summary[bimok]["예산"] += item["총예산"]
-        bimok_summary[bimok]["집행"] += item["사용금액_합계"]
-        bimok_summary[bimok]["잔액"] += item["잔액"]
-        bimok_summary[bimok]["항목수"] += 1
-    
-    # D-day 계산
-    end_date = datetime(2025, 12, 31)
-    today = datetime.now()
-    days_remaining = (end_date - today).days
+def iter_sorted_items():
+    """전체 항목을 sort_items와 같은 순서로 한 건씩 반환 (스트리밍 모드)
     
-    return {
-        "총예산": total_budget,
-        "총집행": total_used,
-        "총잔액": total_remaining,
-        "집행률": round(total_used / total_budget * 100, 1) if total_budget > 0 else 0,
-        "항목수": len(items),
-        "상태별": status_count,
-        "비목별": bimok_summary,
-        "남은일수": max(0, days_remaining),
-    }
+    비목 값 파티션을 값 순서대로 하나씩 조회해 파티션 안에서만 정렬합니다. 목록 밖 / 빈 비목
+    파티션(보통 소수)은 먼저 읽어 두었다가 정렬 위치에 끼워 넣습니다.
+    """
+    url = f"{NOTION_API_URL}/databases/{DATABASE_ID}/query"
+    partitions = bimok_partitions()
+    
+    def scan(partition):
+        return sort_items([transform_page(page) for page in iter_query(url, get_headers(), partition)])
+    
+    # 목록 밖 값 필터(does_not_equal)는 빈 값도 잡을 수 있으므로 page id로 중복 제거
+    rest = {item["id"]: item for name in (OTHER_PARTITION, EMPTY_PARTITION) for item in scan(partitions.pop(name))}
+    rest = sort_items(list(rest.values()))
+    position = 0
+    for value in sorted(partitions):
+        while position < len(rest) and str(rest[position].get(SHARD_FIELD) or "") < value:
+            yield rest[position]
+            position += 1
+        yield from scan(partitions[value])
+    yield from rest[position:]
+
+# Notion 페이지를 JSON 객체로 변환 (필드 목록은 scripts/notion_schema.py의 BUDGET_FIELDS)
+transform_page = extract_budget_item
+
+class SummaryAccumulator:
+    """항목을 한 번씩만 보며 요약 통계를 누적 (항목은 SUMMARY_CHUNK개씩 롤업 큐브로 접어 보관하지 않음)"""
+    
+    def __init__(self):
+        self.cube = BudgetCube.empty()
+        self.pending = []
+    
+    def _fold(self):
+        if self.pending:
+            self.cube = self.cube.merge(BudgetCube.from_items(self.pending))
+            self.pending = []
+    
+    def add(self, item):
+        self.pending.append(item)
+        if len(self.pending) >= SUMMARY_CHUNK:
+            self._fold()
+        return item
+    
+    def result(self):
+        self._fold()
+        total = self.cube.total()
+        
+        # 상태별 카운트
+        statuses = self.cube.by("상태")
+        status_count = {status: statuses.get(status, {}).get("항목수", 0) for status in ("정상", "주의", "초과", "미집행")}
+        
+        # 비목별 집계 (비목이 비어 있으면 기타)
+        bimok_summary = {}
+        for bimok, values in self.cube.by("비목").items():
+            group = bimok_summary.setdefault(bimok or "기타", {"예산": 0, "집행": 0, "잔액": 0, "항목수": 0})
+            for key in group:
+                group[key] += values[key]
+        
+        return {
+            "총예산": total["예산"],
+            "총집행": total["집행"],
+            "총잔액": total["잔액"],
+            "집행률": round(total["집행"] / total["예산"] * 100, 1) if total["예산"] > 0 else 0,
+            "항목수": total["항목수"],
+            "상태별": status_count,
+            "비목별": bimok_summary,
+            "남은일수": days_remaining(),
+            "사업종료일": PROJECT_END_DATE.isoformat(),
+            "롤업": self.cube.rollup(),
+        }
+
+def calculate_summary(items, cube=None):
+    """요약 통계 계산 (cube: 스냅샷이 변경분으로 갱신한 집계, 없으면 items로 새로 계산)"""
+    summary = SummaryAccumulator()
+    summary.cube = cube or BudgetCube.from_items(items)
+    return summary.result()
+
+def fetch_streaming(phases):
+    """비목 파티션별 조회 → 변환 → 요약 누적 → 파일 쓰기 (메모리에는 파티션 하나만)
+    
+    항목을 쓴 뒤에야 요약이 나오므로 파일 안에서 summary가 items 뒤에 옵니다.
+    """
+    mark = time.perf_counter()
+    summary = SummaryAccumulator()
+    items = (summary.add(item) for item in iter_sorted_items())
+    # 본문을 메모리에 두지 않으므로 증분 패치 없이 버전 해시만 갱신
+    base = (None, file_hash(OUTPUT_PATH) if os.path.exists(OUTPUT_PATH) else None)
+    write_json_stream(OUTPUT_PATH, {}, "items", items, lambda: {"summary": summary.result()})
+    digest = file_hash(OUTPUT_PATH)
+    publish(BUNDLE_NAME, {os.path.basename(OUTPUT_PATH): digest})
+    print_version(update_versions(BUNDLE_NAME, os.path.basename(OUTPUT_PATH), base, None, digest))
+    result = summary.result()
+    render_after_export(BUNDLE_NAME, result)
+    phases["stream"] = time.perf_counter() - mark
+    return result
+
+def fetch_snapshot(phases):
+    """스냅샷 + 변경분으로 항목 목록을 만들어 한 번에 저장"""
+    mark = time.perf_counter()
+    items, cube = load_items("fetch", DATABASE_ID, query_database, transform_page)
+    phases["query"] = time.perf_counter() - mark
+    
+    mark = time.perf_counter()
+    summary = calculate_summary(items, cube)
+    phases["transform"] = time.perf_counter() - mark
+    
+    mark = time.perf_counter()
+    document = {"summary": summary, "items": sort_items(items)}
+    base = read_base(OUTPUT_PATH)
+    digest = write_json(OUTPUT_PATH, document)
+    bundle = write_bundle(BUNDLE_NAME, document["items"], summary)
+    print_bundle(bundle)
+    if not publish(BUNDLE_NAME, {os.path.basename(OUTPUT_PATH): digest}, bundle):
+        print("   → 데이터 변경 없음 (파일 그대로)")
+    print_version(update_versions(BUNDLE_NAME, os.path.basename(OUTPUT_PATH), base, document, digest))
+    render_after_export(BUNDLE_NAME, summary)
+    record_history(document["items"], cube, "fetch")
+    phases["write"] = time.perf_counter() - mark
+    
+    mark = time.perf_counter()
+    forecast_after_export(document["items"])
+    phases["forecast"] = time.perf_counter() - mark
+    return summary
 
 def main():
     if not NOTION_API_KEY:
@@ -144,36 +213,26 @@ def main():
     print(f"📊 Notion 데이터 가져오기 시작...")
     print(f"   Database ID: {DATABASE_ID}")
     
-    # 1. 데이터 조회
-    pages = query_database()
-    print(f"   ✅ {len(pages)}개 항목 조회 완료")
-    
-    # 2. 데이터 변환
-    items = [transform_page(p) for p in pages]
-    
-    # 3. 요약 계산
-    summary = calculate_summary(items)
-    
-    # 4. JSON 파일 저장
-    os.makedirs("data", exist_ok=True)
-    
-    output = {
-        "generated_at": datetime.now().isoformat(),
-        "update_date": datetime.now().strftime("%Y-%m-%d"),
-        "update_time": datetime.now().strftime("%H:%M:%S"),
-        "summary": summary,
-        "items": items,
-    }
+    phases = {}
+    started = time.perf_counter()
     
-    with open("data/budget.json", "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    # 조회 → 변환 → 요약 → 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 죽어도 이전 파일 유지)
+    if FETCH_STREAMING:
+        print("   → 스트리밍 모드 (비목 파티션별 조회, 경량 번들 / 증분 패치 / 집행 이력 / 전망 생략)")
+        summary = fetch_streaming(phases)
+    else:
+        summary = fetch_snapshot(phases)
+    print(f"   ✅ {summary['항목수']}개 항목 저장 완료")
+    phases["total"] = time.perf_counter() - started
     
     print(f"\n📈 요약:")
     print(f"   총 예산: {summary['총예산']:,.0f}원")
     print(f"   총 집행: {summary['총집행']:,.0f}원")
     print(f"   집행률: {summary['집행률']}%")
     print(f"   남은일수: D-{summary['남은일수']}")
-    print(f"\n✅ data/budget.json 저장 완료!")
+    get_client().print_stats()
+    write_run_metrics("fetch", phases, {"items": summary["항목수"]}, summary["항목수"])
+    print(f"\n✅ {OUTPUT_PATH} 저장 완료!")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+집행 전망 벤치마크: 이력 전체 재계산(행렬 + 가중 최소제곱) vs 하루치 증분 갱신(budget_forecast)
+
+합성 사용금액 변경 기록(항목 × 일수, 하루에 항목 30%가 변경)으로
+  - 재계산: 변경 기록 → (항목 × 날짜) 행렬 → 가중 합계 → 기울기
+  - 증분: 저장된 가중 합계를 하루 감쇠 + 새 관측 추가 → 기울기 (내보내기마다 하는 일)
+시간을 비교하고, 첫날부터 증분으로 쌓은 기울기가 재계산과 같은지 확인합니다.
+SQLite 조회 시간은 포함하지 않습니다. 네트워크나 인증 정보는 필요 없습니다.
+
+사용법:
+  python benchmarks/bench_forecast.py [항목수x일수 ...]   # 예: 5000x1095
+"""
+
+import gc
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+from budget_forecast import advance, moments, slopes, used_matrix
+
+SIZES = [(1_000, 365), (5_000, 1_095)]
+REPEAT = 3
+CHANGE_RATE = 0.3
+
+
+def synthetic_history(items: int, days: int, seed: int = 0):
+    """(항목 id, 날짜 목록, 변경 기록 [(id, day, used)], 날짜별 사용금액 행렬)"""
+    rng = np.random.default_rng(seed)
+    ids = [f"item{i:06d}" for i in range(items)]
+    grid = [(date(2024, 1, 1) + timedelta(days=d)).isoformat() for d in range(days)]
+    spend = rng.uniform(0, 200_000, items)
+    increments = np.where(rng.random((items, days)) < CHANGE_RATE, spend[:, None] * rng.uniform(0, 3, (items, days)), 0)
+    increments[:, 0] = spend
+    used = np.round(np.cumsum(increments, axis=1))
+    
+    changed = np.argwhere(increments != 0)
+    changes = [(ids[i], grid[d], used[i, d]) for i, d in changed.tolist()]
+    return ids, grid, changes, used
+
+
+def rebuild(ids, grid, changes):
+    x = np.array([date.fromisoformat(day).toordinal() for day in grid], dtype=float)
+    return slopes(moments(x, used_matrix(ids, grid, changes)))
+
+
+def incremental(state, used_today):
+    state = advance(state, 1)
+    state[0] += 1
+    state[1] += 1
+    state[4] += used_today
+    return state, slopes(state)
+
+
+def timed(func, *args) -> tuple:
+    """REPEAT회 중 최단 시간 (timeit과 같이 측정 중 GC 비활성화)"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            result = func(*args)
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best, result
+
+
+def main():
+    sizes = [tuple(int(n) for n in arg.split("x")) for arg in sys.argv[1:]] or SIZES
+    print(f"{'항목수':>7} {'일수':>6} {'변경 기록':>10} {'재계산(ms)':>11} {'증분(ms)':>9}  일치")
+    for items, days in sizes:
+        ids, grid, changes, used = synthetic_history(items, days)
+        t_full, expected = timed(rebuild, ids, grid, changes)
+        
+        # 첫날부터 하루씩 증분으로 쌓은 가중 합계
+        state = moments(np.zeros(1), used[:, :1])
+        for d in range(1, days - 1):
+            state, _ = incremental(state, used[:, d])
+        t_step, (_, actual) = timed(incremental, state.copy(), used[:, -1])
+        
+        same = np.allclose(actual, expected, rtol=1e-9, equal_nan=True)
+        print(f"{items:>7,} {days:>6,} {len(changes):>10,} {t_full * 1000:>11.1f} {t_step * 1000:>9.2f}  {'✅' if same else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+예산 시트 파서 벤치마크: 행 단위(기존) vs 열 단위(columnar)
+
+합성 시트(1k / 10k / 100k 행)를 표시 문자열(get_all_values)과
+서식 없는 값(UNFORMATTED_VALUE) 두 형태로 만들어 두 파서의 결과 일치 여부와
+처리 시간을 비교합니다. columnar는 열 배열 생성까지, +dict는 기존과 같은
+항목 dict 목록으로 바꾸는 시간입니다. 네트워크나 인증 정보는 필요 없습니다.
+
+사용법:
+  python benchmarks/bench_sheet_parser.py [행수 ...]
+"""
+
+import gc
+import os
+import sys
+import time
+import json
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+from sync_budget_to_notion import BIMOK_CODES, GoogleSheetsClient
+from sheet_parser import columns_to_items, parse_budget_columns, rows_to_columns
+
+SIZES = [1_000, 10_000, 100_000]
+REPEAT = 3
+
+
+def synthetic_grid(n_rows: int, formatted: bool, seed: int = 42) -> list:
+    """비목 구간 / 항목 / 소계가 섞인 합성 시트 (헤더 제외)"""
+    rng = random.Random(seed)
+    bimoks = list(BIMOK_CODES)
+    rows = []
+    
+    def money(value):
+        return f"{value:,}" if formatted else value
+    
+    def rate(value):
+        return f"{value * 100:.1f}%" if formatted else value
+    
+    while len(rows) < n_rows:
+        rows.append([f"{len(rows) % 9 + 1}. {rng.choice(bimoks)}"] + [""] * 19)
+        for _ in range(rng.randint(5, 30)):
+            budget = rng.randint(0, 500_000_000)
+            used = rng.randint(0, budget + 10_000_000)
+            row = [
+                "", f"세목{rng.randint(1, 20)}", f"항목{len(rows)}",
+                money(budget), money(used * 10 // 11), money(used // 11), money(used),
+                money(budget - used), rate(used / budget if budget else 0),
+            ]
+            row += [money(rng.randint(0, 10 ** 8)) if rng.random() < 0.7 else "-" for _ in range(11)]
+            rows.append(row)
+        rows.append(["", "소 계", "", money(0)] + [""] * 16)
+    return rows[:n_rows]
+
+
+def timed(func, *args) -> tuple:
+    """REPEAT회 중 최단 시간 (timeit과 같이 측정 중 GC 비활성화)"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            result = func(*args)
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best, result
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    client = GoogleSheetsClient("benchmark")
+    
+    print(f"{'행수':>8} {'형식':<12} {'rows(ms)':>9} {'columnar(ms)':>13} {'+dict(ms)':>10} "
+          f"{'배속':>6} {'항목':>7}  일치")
+    for n in sizes:
+        for formatted in (True, False):
+            grid = synthetic_grid(n, formatted)
+            unformatted = not formatted
+            # 실제 API 응답처럼 JSON에서 새로 만든 객체로 측정 (메모리 배치 재현)
+            rows = json.loads(json.dumps(grid, ensure_ascii=False))
+            t_rows, expected = timed(client.parse_rows, rows, unformatted)
+            if formatted:
+                # get_all_values()는 행 우선으로만 오므로 열 변환 시간까지 포함
+                t_cols, columns = timed(
+                    lambda: parse_budget_columns(rows_to_columns(rows), unformatted)
+                )
+            else:
+                # bulk 읽기는 majorDimension=COLUMNS로 열 우선 응답을 받음
+                major = json.loads(json.dumps(rows_to_columns(grid), ensure_ascii=False))
+                t_cols, columns = timed(parse_budget_columns, major, unformatted)
+            t_dict, actual = timed(columns_to_items, columns)
+            label = "formatted" if formatted else "unformatted"
+            print(f"{n:>8,} {label:<12} {t_rows * 1000:>9.1f} {t_cols * 1000:>13.1f} {t_dict * 1000:>10.1f} "
+                  f"{t_rows / (t_cols + t_dict):>5.1f}x {len(actual):>7,}  {'✅' if actual == expected else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
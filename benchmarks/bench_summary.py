@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+대시보드 요약 집계 벤치마크: 파이썬 반복 요약(기존) vs 롤업 큐브(budget_cube)
+
+합성 항목(10k / 50k / 100k)으로 기존 calculate_summary 방식(합계 / 상태별 / 비목별만)과
+BudgetCube(같은 값 + 비목×세목×상태×연도 롤업, 전년대비) 시간을 비교하고,
+공통 값이 같은지 확인합니다. 네트워크나 인증 정보는 필요 없습니다.
+
+사용법:
+  python benchmarks/bench_summary.py [항목수 ...]
+"""
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+from bench_transform import synthetic_pages
+from budget_cube import BudgetCube
+from notion_schema import extract_budget_item
+
+SIZES = [10_000, 50_000, 100_000]
+REPEAT = 3
+
+
+def legacy_summary(items):
+    """기존 export_to_dashboard.calculate_summary의 집계 부분"""
+    total_budget = sum(item["총예산"] for item in items)
+    total_used = sum(item["사용금액_합계"] for item in items)
+    total_remaining = sum(item["잔액"] for item in items)
+    
+    status_count = {"정상": 0, "주의": 0, "초과": 0, "미집행": 0}
+    for item in items:
+        status = item.get("상태", "")
+        if status in status_count:
+            status_count[status] += 1
+    
+    bimok_summary = {}
+    for item in items:
+        bimok = item.get("비목", "기타")
+        if bimok not in bimok_summary:
+            bimok_summary[bimok] = {"예산": 0, "집행": 0, "잔액": 0}
+        bimok_summary[bimok]["예산"] += item["총예산"]
+        bimok_summary[bimok]["집행"] += item["사용금액_합계"]
+        bimok_summary[bimok]["잔액"] += item["잔액"]
+    return total_budget, total_used, total_remaining, status_count, bimok_summary
+
+
+def cube_summary(items):
+    cube = BudgetCube.from_items(items)
+    total = cube.total()
+    statuses = cube.by("상태")
+    status_count = {status: statuses.get(status, {}).get("항목수", 0) for status in ("정상", "주의", "초과", "미집행")}
+    bimok_summary = {bimok: {key: values[key] for key in ("예산", "집행", "잔액")}
+                     for bimok, values in cube.by("비목").items()}
+    cube.rollup()
+    return total["예산"], total["집행"], total["잔액"], status_count, bimok_summary
+
+
+def timed(func, *args) -> tuple:
+    """REPEAT회 중 최단 시간 (timeit과 같이 측정 중 GC 비활성화)"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            result = func(*args)
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best, result
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    print(f"{'항목수':>8} {'기존(ms)':>9} {'큐브+롤업(ms)':>14} {'셀 수':>7}  일치")
+    for n in sizes:
+        items = [extract_budget_item(page) for page in synthetic_pages(n)]
+        t_old, expected = timed(legacy_summary, items)
+        t_new, actual = timed(cube_summary, items)
+        cells = len(BudgetCube.from_items(items).codes)
+        print(f"{n:>8,} {t_old * 1000:>9.1f} {t_new * 1000:>14.1f} {cells:>7,}  {'✅' if actual == expected else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
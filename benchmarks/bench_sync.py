@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+동기화 / 내보내기 종단 간 처리량 벤치마크 (로컬 가짜 서버 사용)
+
+항목 수(100 / 1k / 10k)마다 가짜 Notion / Sheets 서버를 새로 띄우고 다음 시나리오를 실행합니다.
+  - sync 신규: 빈 DB에 전체 생성
+  - sync 변경없음: 같은 시트로 다시 실행 (쓰기 0건이어야 함)
+  - sync 10% 변경: 항목 10%의 사용금액을 바꾼 뒤 실행
+  - export: scripts/export_to_dashboard.py 조회 + 변환 + 요약
+  - api fetch: api/fetch_notion_data.py 조회 + 변환 + 요약
+
+시나리오마다 처리량(items/s), 엔드포인트별 호출 수, 429 횟수, 요청 지연 p50/p95를 출력합니다.
+
+사용법:
+  python benchmarks/bench_sync.py [항목수 ...] [--latency-ms 20] [--server-rate 0] [--failure-rate 0]
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "api"))
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+import export_to_dashboard
+import fetch_notion_data
+import sync_budget_to_notion
+from fake_services import FAKE_DATABASE_ID, FakeSheetsClient, start_fake_services
+from http_client import get_client, percentile
+from sync_budget_to_notion import SYNC_CONCURRENCY, BudgetSyncService, NotionClient
+
+SIZES = [100, 1_000, 10_000]
+
+
+def point_scripts_at(base_url: str):
+    """세 스크립트의 Notion 주소를 가짜 서버로 변경"""
+    for module in (sync_budget_to_notion, export_to_dashboard, fetch_notion_data):
+        module.NOTION_API_URL = f"{base_url}/v1"
+    export_to_dashboard.NOTION_DATABASE_ID = FAKE_DATABASE_ID
+    fetch_notion_data.DATABASE_ID = FAKE_DATABASE_ID
+    export_to_dashboard.NOTION_API_KEY = fetch_notion_data.NOTION_API_KEY = "fake"
+
+
+def run_sync(base_url: str, args) -> int:
+    notion = NotionClient("fake", FAKE_DATABASE_ID, rate_limit=args.client_rate)
+    sheets = FakeSheetsClient(base_url)
+    service = BudgetSyncService(notion, sheets, concurrency=args.concurrency)
+    stats = service.sync()
+    return stats["created"] + stats["updated"] + stats["unchanged"]
+
+
+def run_export(module) -> int:
+    pages = module.query_notion_database() if module is export_to_dashboard else module.query_database()
+    items = [module.transform_page(page) for page in pages]
+    module.calculate_summary(items)
+    return len(items)
+
+
+def measure(name: str, server, func, *args) -> dict:
+    """시나리오 실행 (스크립트 출력은 숨김) → 처리량 / 호출 / 지연 집계"""
+    get_client().reset_stats()
+    server.state.reset_counters()
+    started = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        count = func(*args)
+    elapsed = time.perf_counter() - started
+    
+    latencies = [ms for values in get_client().latencies().values() for ms in values]
+    return {
+        "name": name,
+        "items": count,
+        "seconds": elapsed,
+        "calls": dict(server.state.calls),
+        "throttled": server.state.throttled,
+        "injected": server.state.injected,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기화 / 내보내기 종단 간 벤치마크")
+    parser.add_argument("sizes", type=int, nargs="*", default=SIZES)
+    parser.add_argument("--latency-ms", type=float, default=20, help="가짜 서버 응답 지연")
+    parser.add_argument("--jitter-ms", type=float, default=10)
+    parser.add_argument("--server-rate", type=float, default=0, help="가짜 서버 초당 허용 요청 수 (0이면 무제한)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="가짜 서버 5xx 주입 비율")
+    parser.add_argument("--client-rate", type=float, default=1000, help="NotionClient 초당 요청 한도")
+    parser.add_argument("--concurrency", type=int, default=SYNC_CONCURRENCY)
+    args = parser.parse_args()
+    
+    print(f"지연 {args.latency_ms:.0f}±{args.jitter_ms:.0f}ms / 서버 한도 {args.server_rate or '∞'} req/s / "
+          f"5xx {args.failure_rate:.0%} / 동시 {args.concurrency}")
+    print(f"{'항목수':>7} {'시나리오':<14} {'시간(s)':>8} {'items/s':>9} {'호출':>6} {'429':>5} "
+          f"{'p50(ms)':>8} {'p95(ms)':>8}  엔드포인트별 호출")
+    for n in args.sizes:
+        server = start_fake_services(
+            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+            rate_limit=args.server_rate, failure_rate=args.failure_rate,
+        )
+        server.state.load_sheet(n)
+        point_scripts_at(server.base_url)
+        
+        results = [measure("sync 신규", server, run_sync, server.base_url, args),
+                   measure("sync 변경없음", server, run_sync, server.base_url, args)]
+        server.state.mutate_sheet(0.1)
+        results += [measure("sync 10% 변경", server, run_sync, server.base_url, args),
+                    measure("export", server, run_export, export_to_dashboard),
+                    measure("api fetch", server, run_export, fetch_notion_data)]
+        server.shutdown()
+        
+        for r in results:
+            calls = " ".join(f"{key}={value}" for key, value in sorted(r["calls"].items()))
+            print(f"{n:>7,} {r['name']:<14} {r['seconds']:>8.2f} {r['items'] / r['seconds']:>9,.0f} "
+                  f"{sum(r['calls'].values()):>6,} {r['throttled']:>5} {r['p50']:>8.1f} {r['p95']:>8.1f}  {calls}")
+
+
+if __name__ == "__main__":
+    main()
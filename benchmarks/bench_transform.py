@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Notion 속성 변환 벤치마크: 필드별 extract_property(기존) vs 스키마 컴파일 변환(notion_schema)
+
+합성 조회 응답 페이지(기본 100k)를 만들어
+  - 페이지 → 대시보드 항목: 기존 transform_page(필드마다 extract_property 호출)와
+    extract_budget_item 비교
+  - 시트 항목 → Notion 속성: 기존 BudgetSyncService.build_properties 방식과
+    build_budget_properties 비교
+결과 일치 여부와 처리 시간을 출력합니다. 네트워크나 인증 정보는 필요 없습니다.
+
+사용법:
+  python benchmarks/bench_transform.py [페이지수 ...]
+"""
+
+import gc
+import os
+import sys
+import time
+import json
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+from notion_schema import BUDGET_FIELDS, build_budget_properties, extract_budget_item
+from sync_budget_to_notion import BIMOK_CODES
+
+SIZES = [100_000]
+REPEAT = 3
+
+
+# --- 기존 구현 (비교 기준) ---
+
+def legacy_export_extract(page, prop_name, prop_type):
+    """scripts/export_to_dashboard.py의 기존 extract_property (text.content 대체 추가 전 원본)"""
+    prop = page.get("properties", {}).get(prop_name, {})
+    
+    if prop_type == "title":
+        titles = prop.get("title", [])
+        return titles[0]["plain_text"] if titles else ""
+    elif prop_type == "rich_text":
+        texts = prop.get("rich_text", [])
+        return texts[0]["plain_text"] if texts else ""
+    elif prop_type == "number":
+        return prop.get("number", 0) or 0
+    elif prop_type == "select":
+        sel = prop.get("select")
+        return sel["name"] if sel else ""
+    elif prop_type == "date":
+        date_obj = prop.get("date")
+        return date_obj["start"] if date_obj else ""
+    
+    return None
+
+
+def legacy_transform_page(page):
+    """기존 transform_page 그대로 (필드마다 extract_property 호출)"""
+    return {
+        "id": page["id"],
+        "항목명": legacy_export_extract(page, "항목명", "title"),
+        "비목": legacy_export_extract(page, "비목", "select"),
+        "세목": legacy_export_extract(page, "세목", "rich_text"),
+        "총예산": legacy_export_extract(page, "총예산", "number"),
+        "사용금액_공급가": legacy_export_extract(page, "사용금액(공급가)", "number"),
+        "사용금액_VAT": legacy_export_extract(page, "사용금액(VAT)", "number"),
+        "사용금액_합계": legacy_export_extract(page, "사용금액(합계)", "number"),
+        "잔액": legacy_export_extract(page, "잔액", "number"),
+        "집행률": legacy_export_extract(page, "집행률", "number"),
+        "상태": legacy_export_extract(page, "상태", "select"),
+        "2024년예산": legacy_export_extract(page, "2024년예산", "number"),
+        "2024년집행": legacy_export_extract(page, "2024년집행", "number"),
+        "2025년예산": legacy_export_extract(page, "2025년예산", "number"),
+        "2025년집행": legacy_export_extract(page, "2025년집행", "number"),
+        "최종동기화": legacy_export_extract(page, "최종동기화", "date"),
+    }
+
+
+def legacy_build_properties(item, status, today):
+    """BudgetSyncService.build_properties의 기존 구현"""
+    props = {
+        "항목명": {"title": [{"text": {"content": item["항목명"]}}]},
+        "세목": {"rich_text": [{"text": {"content": item.get("세목", "")}}]},
+        "총예산": {"number": item.get("총예산", 0)},
+        "사용금액(공급가)": {"number": item.get("사용금액(공급가)", 0)},
+        "사용금액(VAT)": {"number": item.get("사용금액(VAT)", 0)},
+        "사용금액(합계)": {"number": item.get("사용금액(합계)", 0)},
+        "잔액": {"number": item.get("잔액", 0)},
+        "집행률": {"number": item.get("집행률", 0)},
+        "2024년예산": {"number": item.get("2024년예산", 0)},
+        "2024년집행": {"number": item.get("2024년집행", 0)},
+        "2025년예산": {"number": item.get("2025년예산", 0)},
+        "2025년집행": {"number": item.get("2025년집행", 0)},
+        "상태": {"select": {"name": status}},
+        "최종동기화": {"date": {"start": today}},
+    }
+    
+    if item.get("비목"):
+        props["비목"] = {"select": {"name": item["비목"]}}
+    
+    return props
+
+
+# --- 합성 데이터 ---
+
+def _text(kind, content):
+    return {kind: [{
+        "type": "text", "text": {"content": content, "link": None},
+        "annotations": {"bold": False, "italic": False, "strikethrough": False,
+                        "underline": False, "code": False, "color": "default"},
+        "plain_text": content, "href": None,
+    }] if content else []}
+
+
+def synthetic_pages(n_pages: int, seed: int = 42) -> list:
+    """조회 응답 형식 페이지 (빈 텍스트 / null 숫자 / 빈 select 일부 포함)"""
+    rng = random.Random(seed)
+    bimoks = list(BIMOK_CODES.values())
+    pages = []
+    for i in range(n_pages):
+        budget = rng.randint(0, 500_000_000)
+        used = rng.randint(0, budget + 10_000_000)
+        number = lambda value: {"type": "number", "number": value if rng.random() < 0.95 else None}
+        props = {
+            "항목명": _text("title", f"항목{i}"),
+            "비목": {"type": "select", "select": {"name": rng.choice(bimoks)} if rng.random() < 0.9 else None},
+            "세목": _text("rich_text", f"세목{rng.randint(1, 20)}" if rng.random() < 0.8 else ""),
+            "총예산": number(budget),
+            "사용금액(공급가)": number(used * 10 // 11),
+            "사용금액(VAT)": number(used // 11),
+            "사용금액(합계)": number(used),
+            "잔액": number(budget - used),
+            "집행률": number(round(used / budget * 100, 1) if budget else 0),
+            "상태": {"type": "select", "select": {"name": rng.choice(["정상", "주의", "초과", "미집행"])}},
+            "2024년예산": number(rng.randint(0, 10 ** 8)),
+            "2024년집행": number(rng.randint(0, 10 ** 8)),
+            "2025년예산": number(rng.randint(0, 10 ** 8)),
+            "2025년집행": number(rng.randint(0, 10 ** 8)),
+            "최종동기화": {"type": "date", "date": {"start": "2025-06-01"} if rng.random() < 0.9 else None},
+        }
+        pages.append({"object": "page", "id": f"page-{i}", "properties": props})
+    # 실제 API 응답처럼 JSON에서 새로 만든 객체로 측정 (메모리 배치 재현)
+    return json.loads(json.dumps(pages, ensure_ascii=False))
+
+
+def sheet_items(pages: list) -> list:
+    """조회 페이지 → 시트 파서 형식 항목 (Notion 속성 이름 키)"""
+    return [
+        {prop: value for (key, prop, _), value in zip(BUDGET_FIELDS, list(item.values())[1:])
+         if prop not in ("상태", "최종동기화")}
+        for item in map(extract_budget_item, pages)
+    ]
+
+
+def build_properties(item, status, today):
+    """BudgetSyncService.build_properties와 같은 방식 (상태 / 최종동기화는 동기화가 계산해 덮어씀)"""
+    props = build_budget_properties(item)
+    props["상태"] = {"select": {"name": status}}
+    props["최종동기화"] = {"date": {"start": today}}
+    return props
+
+
+def timed(func, *args) -> tuple:
+    """REPEAT회 중 최단 시간 (timeit과 같이 측정 중 GC 비활성화)"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            result = func(*args)
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best, result
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    print(f"{'페이지수':>8} {'작업':<10} {'기존(ms)':>9} {'컴파일(ms)':>11} {'배속':>6}  일치")
+    for n in sizes:
+        pages = synthetic_pages(n)
+        t_old, expected = timed(lambda: [legacy_transform_page(page) for page in pages])
+        t_new, actual = timed(lambda: [extract_budget_item(page) for page in pages])
+        print(f"{n:>8,} {'변환':<10} {t_old * 1000:>9.1f} {t_new * 1000:>11.1f} {t_old / t_new:>5.1f}x  "
+              f"{'✅' if actual == expected else '❌'}")
+        
+        items = sheet_items(pages)
+        t_old, expected = timed(lambda: [legacy_build_properties(item, "정상", "2025-06-01") for item in items])
+        t_new, actual = timed(lambda: [build_properties(item, "정상", "2025-06-01") for item in items])
+        print(f"{n:>8,} {'속성 빌드':<10} {t_old * 1000:>9.1f} {t_new * 1000:>11.1f} {t_old / t_new:>5.1f}x  "
+              f"{'✅' if actual == expected else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
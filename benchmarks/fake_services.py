@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+로컬 가짜 Notion / Google Sheets 서버
+
+실제 인증 정보 없이 동기화·내보내기 스크립트를 실행하고 성능을 측정하기 위한 서버입니다.
+스크립트가 실제로 쓰는 엔드포인트만 흉내 냅니다.
+  - POST  /v1/databases/{id}/query   (page_size, start_cursor, last_edited_time 필터, filter_properties)
+  - POST  /v1/pages                  (페이지 생성)
+  - PATCH /v1/pages/{id}             (페이지 속성 업데이트)
+  - GET   /v4/spreadsheets/{id}      (시트 행 수)
+  - GET   /v4/spreadsheets/{id}/values/{range}  (valueRenderOption, majorDimension)
+
+옵션: 응답 지연(latency/jitter), 초당 요청 한도 초과 시 429 + Retry-After, 무작위 5xx 주입
+
+단독 실행:
+  python benchmarks/fake_services.py --items 1000 --port 8765 --rate-limit 3
+  NOTION_API_URL=http://127.0.0.1:8765/v1 NOTION_API_KEY=fake python scripts/export_to_dashboard.py
+
+Google Sheets는 gspread가 주소를 바꿀 수 없으므로 FakeSheetsClient로 연결합니다.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import random
+import socket
+import argparse
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+from http_client import get_client
+from sync_budget_to_notion import BIMOK_CODES, SHEET_COLUMNS, SHEET_HEADER_ROWS, GoogleSheetsClient
+
+FAKE_DATABASE_ID = "fakedb00-0000-0000-0000-000000000000"
+FAKE_SHEET_ID = "fake-sheet"
+
+_RANGE = re.compile(r"^([A-Z]+)(\d+)?:([A-Z]+)(\d+)?$")
+
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for char in letters:
+        index = index * 26 + ord(char) - ord("A") + 1
+    return index - 1
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def budget_sheet(n_items: int, seed: int = 42) -> Tuple[List[list], List[list]]:
+    """항목 n_items개짜리 예산 시트 → (표시 문자열 격자, 서식 없는 값 격자), 헤더 4행 포함"""
+    rng = random.Random(seed)
+    header = [[f"헤더{r + 1}"] + [""] * (SHEET_COLUMNS - 1) for r in range(SHEET_HEADER_ROWS)]
+    formatted, unformatted = [list(row) for row in header], [list(row) for row in header]
+    bimoks = list(BIMOK_CODES)
+    per_section = max(1, -(-n_items // len(bimoks)))
+    
+    for number in range(n_items):
+        if number % per_section == 0:
+            title = f"{number // per_section + 1}. {bimoks[number // per_section % len(bimoks)]}"
+            formatted.append([title] + [""] * (SHEET_COLUMNS - 1))
+            unformatted.append([title] + [""] * (SHEET_COLUMNS - 1))
+        
+        budget = rng.randint(1_000_000, 500_000_000)
+        used = rng.randint(0, budget + 10_000_000)
+        values = [budget, used * 10 // 11, used // 11, used, budget - used]
+        years = [rng.randint(0, 10 ** 8) for _ in range(4)]
+        rate = round(used / budget, 4)
+        
+        raw = ["", f"세목{rng.randint(1, 20)}", f"항목{number:05d}"] + values + [rate]
+        raw += [years[0], "", "", "", years[1], "", years[2], "", "", "", years[3]]
+        formatted.append([f"{v:,}" if isinstance(v, int) else v for v in raw[:8]] +
+                         [f"{rate * 100:.1f}%"] + [f"{v:,}" if isinstance(v, int) else v for v in raw[9:]])
+        unformatted.append(raw)
+        
+        if number % per_section == per_section - 1 or number == n_items - 1:
+            formatted.append(["", "소 계", ""] + [""] * (SHEET_COLUMNS - 3))
+            unformatted.append(["", "소 계", ""] + [""] * (SHEET_COLUMNS - 3))
+    return formatted, unformatted
+
+
+class FakeState:
+    """가짜 서버 상태 (페이지, 시트, 호출 집계) 및 장애 설정"""
+    
+    def __init__(self, latency_ms: float = 20, jitter_ms: float = 10, rate_limit: float = 0,
+                 failure_rate: float = 0.0, failure_statuses=(500, 502, 503),
+                 retry_after: float = 1, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit = rate_limit
+        self.failure_rate = failure_rate
+        self.failure_statuses = list(failure_statuses)
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        
+        self.pages: Dict[str, dict] = {}
+        self.formatted: List[list] = []
+        self.unformatted: List[list] = []
+        self.calls = Counter()
+        self.throttled = 0
+        self.injected = 0
+        
+        self.lock = threading.Lock()
+        self._tokens = rate_limit
+        self._updated = time.monotonic()
+    
+    def load_sheet(self, n_items: int, seed: int = 42):
+        self.formatted, self.unformatted = budget_sheet(n_items, seed)
+    
+    def mutate_sheet(self, fraction: float, seed: int = 7):
+        """항목 행의 fraction 비율만큼 사용금액 변경 (증분 동기화 측정용)"""
+        rng = random.Random(seed)
+        rows = [i for i, row in enumerate(self.unformatted) if str(row[2]).startswith("항목")]
+        for i in rng.sample(rows, int(len(rows) * fraction)):
+            row = self.unformatted[i]
+            row[6] = used = row[6] + 1000
+            row[7] = row[3] - used
+            row[8] = round(used / row[3], 4)
+            for col in (6, 7):
+                self.formatted[i][col] = f"{row[col]:,}"
+            self.formatted[i][8] = f"{row[8] * 100:.1f}%"
+    
+    def reset_counters(self):
+        with self.lock:
+            self.calls.clear()
+            self.throttled = 0
+            self.injected = 0
+    
+    def admit(self, endpoint: str) -> Optional[int]:
+        """요청 수락 여부 → None(수락) 또는 돌려줄 오류 상태 코드"""
+        with self.lock:
+            self.calls[endpoint] += 1
+            if self.rate_limit:
+                now = time.monotonic()
+                self._tokens = min(self.rate_limit, self._tokens + (now - self._updated) * self.rate_limit)
+                self._updated = now
+                if self._tokens < 1:
+                    self.throttled += 1
+                    return 429
+                self._tokens -= 1
+            if self.failure_rate and self.rng.random() < self.failure_rate:
+                self.injected += 1
+                return self.rng.choice(self.failure_statuses)
+        return None
+    
+    def delay(self):
+        jitter = random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        time.sleep(max(0.0, self.latency_ms + jitter) / 1000)
+    
+    # --- Notion ---
+    
+    @staticmethod
+    def _stored(properties: dict) -> dict:
+        """빌드 형식 속성 → 조회 응답 형식 (텍스트에 plain_text 추가)"""
+        stored = {}
+        for name, prop in properties.items():
+            prop = dict(prop)
+            for kind in ("title", "rich_text"):
+                if kind in prop:
+                    prop[kind] = [
+                        dict(t, type="text", plain_text=t.get("text", {}).get("content", ""))
+                        for t in prop[kind]
+                    ]
+            stored[name] = prop
+        return stored
+    
+    def create_page(self, body: dict) -> dict:
+        now = _now()
+        page = {
+            "object": "page", "id": str(uuid.uuid4()), "created_time": now, "last_edited_time": now,
+            "parent": body.get("parent", {}), "properties": self._stored(body.get("properties", {})),
+        }
+        with self.lock:
+            self.pages[page["id"]] = page
+        return page
+    
+    def update_page(self, page_id: str, body: dict) -> Optional[dict]:
+        with self.lock:
+            page = self.pages.get(page_id)
+            if page is None:
+                return None
+            page["properties"].update(self._stored(body.get("properties", {})))
+            page["last_edited_time"] = _now()
+            return page
+    
+    def archive_page(self, page_id: str):
+        """페이지 삭제 (Notion 휴지통 이동과 같이 조회 결과에서 빠짐)"""
+        with self.lock:
+            self.pages.pop(page_id, None)
+    
+    @classmethod
+    def _matches(cls, page: dict, query_filter: dict) -> bool:
+        """조회 필터 평가 (and / or, last_edited_time on_or_after, select equals / does_not_equal / is_empty)"""
+        if "and" in query_filter:
+            return all(cls._matches(page, part) for part in query_filter["and"])
+        if "or" in query_filter:
+            return any(cls._matches(page, part) for part in query_filter["or"])
+        if query_filter.get("timestamp") == "last_edited_time":
+            return page["last_edited_time"] >= query_filter["last_edited_time"]["on_or_after"]
+        if "select" in query_filter:
+            selected = (page["properties"].get(query_filter["property"], {}).get("select") or {}).get("name")
+            condition = query_filter["select"]
+            if "equals" in condition:
+                return selected == condition["equals"]
+            if "does_not_equal" in condition:
+                # 빈 값도 does_not_equal에 걸리는 것으로 가정 (실제 DB는 bms.py scan-check로 확인)
+                return selected != condition["does_not_equal"]
+            if condition.get("is_empty"):
+                return selected is None
+        raise ValueError(f"지원하지 않는 필터: {query_filter}")
+    
+    def query(self, body: dict, filter_properties: Optional[List[str]] = None) -> dict:
+        with self.lock:
+            pages = list(self.pages.values())
+        if body.get("filter"):
+            pages = [p for p in pages if self._matches(p, body["filter"])]
+        
+        start = 0
+        if body.get("start_cursor"):
+            ids = [p["id"] for p in pages]
+            start = ids.index(body["start_cursor"]) if body["start_cursor"] in ids else len(ids)
+        size = min(100, int(body.get("page_size", 100)))
+        chunk = pages[start:start + size]
+        if filter_properties:
+            # 제목 속성 id는 "title", 그 외 속성은 이름으로 지정한다고 가정
+            chunk = [dict(page, properties={
+                name: prop for name, prop in page["properties"].items()
+                if name in filter_properties or ("title" in prop and "title" in filter_properties)
+            }) for page in chunk]
+        has_more = start + size < len(pages)
+        return {
+            "object": "list", "results": chunk, "has_more": has_more,
+            "next_cursor": pages[start + size]["id"] if has_more else None,
+        }
+    
+    # --- Google Sheets ---
+    
+    def values(self, range_name: str, render: str, major: str) -> dict:
+        grid = self.unformatted if render == "UNFORMATTED_VALUE" else self.formatted
+        match = _RANGE.match(range_name.split("!")[-1])
+        first_col, first_row, last_col, last_row = match.groups()
+        rows = grid[int(first_row or 1) - 1:int(last_row) if last_row else len(grid)]
+        rows = [row[_column_index(first_col):_column_index(last_col) + 1] for row in rows]
+        if major == "COLUMNS":
+            rows = [list(column) for column in zip(*rows)] if rows else []
+        # Sheets API처럼 끝의 빈 셀 / 빈 행 생략
+        trimmed = []
+        for row in rows:
+            while row and row[-1] == "":
+                row = row[:-1]
+            trimmed.append(row)
+        while trimmed and not trimmed[-1]:
+            trimmed.pop()
+        return {"range": range_name, "majorDimension": major, "values": trimmed}
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    
+    def setup(self):
+        super().setup()
+        # 헤더와 본문을 따로 쓰므로 Nagle 지연(~40ms)이 측정에 섞이지 않도록
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    def log_message(self, *args):
+        pass
+    
+    def _reply(self, status: int, body: Optional[dict] = None, headers: Optional[dict] = None):
+        data = json.dumps(body or {}, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+    
+    def _handle(self, method: str):
+        state: FakeState = self.server.state
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        body = self._body() if method in ("POST", "PATCH") else {}
+        
+        if method == "POST" and re.fullmatch(r"/v1/databases/[^/]+/query", path):
+            properties = parse_qs(parts.query).get("filter_properties")
+            endpoint, handler = "query", lambda: state.query(body, properties)
+        elif method == "POST" and path == "/v1/pages":
+            endpoint, handler = "create", lambda: state.create_page(body)
+        elif method == "PATCH" and path.startswith("/v1/pages/"):
+            endpoint, handler = "update", lambda: state.update_page(path.rsplit("/", 1)[1], body)
+        elif method == "GET" and re.fullmatch(r"/v4/spreadsheets/[^/]+", path):
+            endpoint = "sheet"
+            handler = lambda: {"sheets": [{"properties": {"gridProperties": {
+                "rowCount": len(state.formatted), "columnCount": SHEET_COLUMNS}}}]}
+        elif method == "GET" and "/values/" in path:
+            query = parse_qs(parts.query)
+            endpoint = "values"
+            handler = lambda: state.values(
+                path.split("/values/", 1)[1],
+                query.get("valueRenderOption", ["FORMATTED_VALUE"])[0],
+                query.get("majorDimension", ["ROWS"])[0],
+            )
+        else:
+            return self._reply(404, {"object": "error", "message": f"{method} {path}"})
+        
+        state.delay()
+        status = state.admit(endpoint)
+        if status == 429:
+            return self._reply(429, {"object": "error", "code": "rate_limited"},
+                               {"Retry-After": str(state.retry_after)})
+        if status:
+            return self._reply(status, {"object": "error", "code": "injected_failure"})
+        
+        result = handler()
+        if result is None:
+            return self._reply(404, {"object": "error", "code": "object_not_found"})
+        self._reply(200, result)
+    
+    def do_GET(self):
+        self._handle("GET")
+    
+    def do_POST(self):
+        self._handle("POST")
+    
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+
+def start_fake_services(host: str = "127.0.0.1", port: int = 0, **options) -> ThreadingHTTPServer:
+    """백그라운드 스레드로 가짜 서버 시작 (server.state, server.base_url 사용)"""
+    server = ThreadingHTTPServer((host, port), FakeHandler)
+    server.daemon_threads = True
+    server.state = FakeState(**options)
+    server.base_url = f"http://{host}:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class FakeWorksheet:
+    """gspread Worksheet 중 GoogleSheetsClient가 쓰는 부분만 가짜 서버로 구현"""
+    
+    def __init__(self, base_url: str, sheet_id: str = FAKE_SHEET_ID):
+        self.url = f"{base_url}/v4/spreadsheets/{sheet_id}"
+    
+    @property
+    def row_count(self) -> int:
+        resp = get_client().get(self.url)
+        return resp.json()["sheets"][0]["properties"]["gridProperties"]["rowCount"]
+    
+    def get(self, range_name: str, value_render_option: str = "FORMATTED_VALUE",
+            major_dimension: str = "ROWS") -> List[list]:
+        resp = get_client().get(f"{self.url}/values/{range_name}", params={
+            "valueRenderOption": value_render_option, "majorDimension": major_dimension,
+        })
+        resp.raise_for_status()
+        return resp.json().get("values", [])
+    
+    def get_all_values(self) -> List[list]:
+        rows = self.get("A1:T")
+        width = max((len(row) for row in rows), default=0)
+        return [row + [""] * (width - len(row)) for row in rows]
+
+
+class FakeSheetsClient(GoogleSheetsClient):
+    """가짜 서버에서 시트를 읽는 GoogleSheetsClient"""
+    
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(FAKE_SHEET_ID, **kwargs)
+        self.base_url = base_url
+    
+    def _open_sheet(self):
+        return FakeWorksheet(self.base_url, self.sheet_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 Notion / Google Sheets 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--items", type=int, default=1000, help="시트 항목 수")
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--jitter-ms", type=float, default=10)
+    parser.add_argument("--rate-limit", type=float, default=0, help="초당 허용 요청 수 (0이면 무제한)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="5xx 주입 비율 (0~1)")
+    args = parser.parse_args()
+    
+    server = start_fake_services(
+        port=args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit, failure_rate=args.failure_rate,
+    )
+    server.state.load_sheet(args.items)
+    print(f"🧪 가짜 서버 실행 중: {server.base_url}")
+    print(f"   NOTION_API_URL={server.base_url}/v1 NOTION_DATABASE_ID={FAKE_DATABASE_ID}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,24 @@
 """
 대시보드 JSON 생성 스크립트
 저장 위치: scripts/generate_dashboard_json.py
+(저장소 루트에 둔 사본으로 실행해도 scripts/의 모듈을 찾습니다. 데이터 경로는 저장소 루트 기준)
+
+dashboard.json에는 생성 시각을 넣지 않습니다. 시각은 내용이 바뀐 실행에서만
+data/meta.json의 "dashboard" 항목에 기록되므로 데이터가 그대로면 커밋이 생기지 않습니다.
 """
 
 import os
+import sys
 import json
 from datetime import datetime
 import pytz
 
+# 파일 위치(scripts/ 또는 저장소 루트)와 실행 디렉터리에 관계없이 scripts/ 모듈 import
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [SCRIPT_DIR, os.path.join(SCRIPT_DIR, "scripts")]
+from dashboard_bundle import publish
+from json_stream import write_json
+
 KST = pytz.timezone('Asia/Seoul')
 
 def format_currency(amount):
@@ -23,10 +34,7 @@ def generate_dashboard_json():
     with open('data/project_data.json', 'r', encoding='utf-8') as f:
         project_data = json.load(f)
     
-    now = datetime.now(KST)
-    
     dashboard = {
-        'lastUpdated': now.strftime('%Y-%m-%d %H:%M:%S KST'),
         'syncStatus': 'active',
         'project': {
             'name': project_data['project']['name'],
@@ -45,13 +53,14 @@ def generate_dashboard_json():
         'risks': project_data['risks']
     }
     
-    with open('data/dashboard.json', 'w', encoding='utf-8') as f:
-        json.dump(dashboard, f, ensure_ascii=False, indent=2)
+    # 내용이 같으면 파일을 다시 쓰지 않음
+    digest = write_json('data/dashboard.json', dashboard)
+    write_json('dashboard.json', dashboard)
     
-    with open('dashboard.json', 'w', encoding='utf-8') as f:
-        json.dump(dashboard, f, ensure_ascii=False, indent=2)
-    
-    print("대시보드 JSON 생성 완료")
+    if publish('dashboard', {'dashboard.json': digest}):
+        print(f"대시보드 JSON 생성 완료 ({datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S KST')})")
+    else:
+        print("대시보드 데이터 변경 없음")
 
 if __name__ == '__main__':
     generate_dashboard_json()
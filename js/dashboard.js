@@ -4,6 +4,7 @@
  */
 const CONFIG = {
     dataUrl: 'data/budget.json',
+    metaUrl: 'data/meta.json',
     refreshInterval: 300000,
     projectEndDate: new Date('2026-12-31'),
     totalBudget: 24000000000
@@ -41,6 +42,9 @@ class BudgetDashboard {
             const r = await fetch(CONFIG.dataUrl + '?t=' + Date.now());
             if (!r.ok) throw new Error('로드 실패');
             this.data = await r.json();
+            // 생성 시각은 data/meta.json에만 기록됨 (없으면 budget.json 값 사용)
+            const m = await fetch(CONFIG.metaUrl + '?t=' + Date.now()).catch(() => null);
+            this.meta = m && m.ok ? (await m.json()).datasets?.budget : null;
         } catch (e) {
             document.getElementById('error-message').innerHTML = '<div class="error-alert">⚠️ 데이터 로드 오류</div>';
         }
@@ -60,8 +64,9 @@ class BudgetDashboard {
         if (!el) return;
         const d = Utils.getDaysRemaining();
         const ext = this.data.project_info?.extension_approved;
+        const u = this.meta || this.data;
         el.innerHTML = `<div class="header-status">
-            <span class="update-badge">📅 최종 업데이트: ${this.data.update_date} ${this.data.update_time}</span>
+            <span class="update-badge">📅 최종 업데이트: ${u.update_date} ${u.update_time}</span>
             <span class="days-badge ${d <= 90 ? 'urgent' : ''}">⏰ D-${d}</span>
             ${ext ? '<span class="extension-badge">✅ 연장승인 (12개월)</span>' : ''}
         </div>`;
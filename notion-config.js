@@ -146,7 +146,7 @@ const BudgetUtils = {
     },
 
     getDaysRemainingText: () => {
-        const endDate = new Date('2025-12-31');
+        const endDate = new Date('2026-12-31');
         const today = new Date();
         const diff = Math.ceil((endDate - today) / (1000 * 60 * 60 * 24));
         return diff > 0 ? `D-${diff}` : '종료';
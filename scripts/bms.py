@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+BMS 통합 실행 진입점
+
+사용법:
+  python scripts/bms.py sync [--stream] [--resume | --retry-failed]   # Google Sheets → Notion
+  python scripts/bms.py export                                          # Notion → 대시보드 JSON
+  python scripts/bms.py full [--stream] [--resume | --retry-failed]   # 둘 다, 한 프로세스에서
+  python scripts/bms.py scan-check                                      # 비목별 파티션 조회 검증
+  python scripts/bms.py history item|bimok|total [키] [--monthly]       # 집행 이력 조회 (budget_history.py)
+  python scripts/bms.py forecast                                        # 사업종료일 집행 전망 (budget_forecast.py)
+
+full은 동기화가 방금 확인·반영한 항목과 Notion이 돌려준 page id로 바로 대시보드 JSON을 만들므로
+Notion DB를 한 번만 조회합니다. 동기화 결과가 DB 전체와 같다고 확신할 수 없으면
+(쓰기 오류, 재개/재시도 실행, 시트에 없는 Notion 페이지) 내보내기 전에 DB를 다시 조회합니다.
+"""
+
+import time
+import argparse
+
+import budget_forecast
+import export_to_dashboard
+from budget_history import add_history_arguments, run_history
+from http_client import get_client
+from notion_pager import compare_partitioned_scan
+from sync_budget_to_notion import add_sync_arguments, bimok_partitions, run_sync
+
+
+def export_after_sync(service) -> None:
+    """full: 동기화 결과로 대시보드 JSON 생성 (필요할 때만 Notion 재조회)"""
+    print(f"\n📤 대시보드 데이터 내보내기...")
+    get_client().reset_stats()
+    phases = {}
+    started = time.perf_counter()
+    
+    cube = None
+    pages = service.synced_pages() if service else None
+    if pages is None:
+        print("   → 동기화 결과만으로는 DB 전체를 알 수 없어 Notion DB를 다시 조회합니다.")
+        items, cube = export_to_dashboard.load_items(
+            "export", export_to_dashboard.NOTION_DATABASE_ID,
+            export_to_dashboard.query_notion_database, export_to_dashboard.transform_page,
+        )
+    else:
+        print(f"   → 동기화한 {len(pages)}개 항목 사용 (Notion 재조회 없음)")
+        items = [export_to_dashboard.transform_page(page) for page in pages]
+    phases["query"] = time.perf_counter() - started
+    
+    export_to_dashboard.export_items(items, phases, started, cube)
+
+
+def scan_check() -> bool:
+    """비목별 파티션 조회(NOTION_SCAN_PARTITIONS=1)의 합집합이 단일 전체 조회와 같은지 확인"""
+    print("🔎 파티션 조회 검증...")
+    url = f"{export_to_dashboard.NOTION_API_URL}/databases/{export_to_dashboard.NOTION_DATABASE_ID}/query"
+    report = compare_partitioned_scan(url, export_to_dashboard.notion_headers(), bimok_partitions())
+    for name, count in report["partitions"].items():
+        print(f"   {name}: {count}건")
+    print(f"   전체 조회 {report['full']}건 ({report['full_seconds']:.2f}초) / "
+          f"파티션 합집합 {report['partitioned']}건 ({report['partitioned_seconds']:.2f}초), 중복 {report['overlap']}건")
+    if report["ok"]:
+        print("✅ 파티션 합집합이 전체 조회와 같습니다.")
+    else:
+        print(f"❌ 불일치: 누락 {report['missing'][:5]} / 초과 {report['extra'][:5]}")
+    return report["ok"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="아산시 스마트시티 예산관리 시스템(BMS)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add_sync_arguments(commands.add_parser("sync", help="Google Sheets → Notion 동기화"))
+    commands.add_parser("export", help="Notion → 대시보드 JSON 내보내기")
+    commands.add_parser("scan-check", help="비목별 파티션 조회 결과가 전체 조회와 같은지 확인")
+    add_sync_arguments(commands.add_parser("full", help="동기화 후 같은 데이터로 대시보드 JSON 생성"))
+    add_history_arguments(commands.add_parser("history", help="집행 이력 시계열 조회 (항목 / 비목 / 전체)"))
+    commands.add_parser("forecast", help="집행 이력으로 사업종료일 예상 집행 / 불용·초과 위험 계산")
+    args = parser.parse_args()
+    
+    if args.command == "export":
+        export_to_dashboard.main()
+        return
+    if args.command == "scan-check":
+        exit(0 if scan_check() else 1)
+    if args.command == "history":
+        run_history(args)
+        return
+    if args.command == "forecast":
+        budget_forecast.main()
+        return
+    
+    service = run_sync(args, collect=args.command == "full")
+    if args.command == "full":
+        if service and service.failure:
+            print(f"❌ 동기화 실패로 내보내기를 건너뜁니다: {service.failure}")
+        else:
+            export_after_sync(service)
+    exit(1 if service and service.stats["errors"] > 0 else 0)
+
+
+if __name__ == "__main__":
+    main()
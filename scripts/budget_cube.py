@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+대시보드 요약 집계 엔진 (비목 × 세목 × 상태 × 연도 롤업 큐브)
+
+대시보드 항목을 한 번만 열 배열(라벨 조합 번호 + 금액 행렬)로 옮긴 뒤, 값이 있는
+(비목, 세목, 상태) 조합별 합계를 측정값마다 bincount로 구합니다. 비목별 / 상태별 /
+연도별(2024·2025년 예산/집행) 롤업은 이 작은 셀 표를 다시 묶어 계산하므로 항목 수가
+수만 건이어도 항목 단위 파이썬 반복은 열 배열을 만들 때뿐입니다.
+
+사용법:
+  cube = BudgetCube.from_items(items)
+  cube.total()               # 전체 합계
+  cube.by("비목")            # 비목별 합계
+  cube.rollup()              # 대시보드 JSON용 롤업 (비목/세목/상태/연도별, 전년대비)
+  
+  스트리밍처럼 항목을 나눠 받을 때는 조각별 큐브를 merge로 합칩니다.
+"""
+
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+DIMENSIONS = ("비목", "세목", "상태")
+FISCAL_YEARS = ("2024", "2025")
+
+# 합계를 내는 항목 필드 → 측정값 이름
+MEASURE_FIELDS = [
+    ("총예산", "예산"),
+    ("사용금액_합계", "집행"),
+    ("잔액", "잔액"),
+] + [(f"{year}년{kind}", f"{year}년{kind}") for year in FISCAL_YEARS for kind in ("예산", "집행")]
+MEASURES = [name for _, name in MEASURE_FIELDS] + ["항목수"]
+
+# 라벨이 빈 값일 때 롤업에 표시할 이름
+EMPTY_LABEL = "미지정"
+
+# 측정값 / 셀 합계 반올림 자릿수
+# 항목 값을 이 자릿수로 맞춰 두면 참 합계가 같은 격자 위에 있으므로, 증분 반영과 전체 계산의
+# 부동소수점 합산 순서 차이(격자 간격보다 훨씬 작음)가 반올림 후 사라집니다.
+SUM_DECIMALS = 2
+# 증분 집계 검증에서 같다고 볼 셀 값 차이
+DRIFT_TOLERANCE = 1e-4
+
+
+def _number(value: float):
+    """JSON 출력용 (SUM_DECIMALS로 반올림, 정수로 떨어지는 합계는 int)"""
+    value = round(float(value), SUM_DECIMALS)
+    return int(value) if value.is_integer() else value
+
+
+def _rate(part: float, whole: float) -> float:
+    return round(float(part) / float(whole) * 100, 1) if whole > 0 else 0
+
+
+def _change(current: float, previous: float) -> Optional[float]:
+    return round((float(current) - float(previous)) / float(previous) * 100, 1) if previous else None
+
+
+class BudgetCube:
+    """값이 있는 (비목, 세목, 상태) 셀별 측정값 합계"""
+    
+    def __init__(self, labels: Dict[str, List[str]], codes: np.ndarray, values: np.ndarray):
+        self.labels = labels    # 차원 → 라벨 목록
+        self.codes = codes      # (셀 수, 3) 차원별 라벨 번호
+        self.values = values    # (셀 수, 측정값 수) 합계, 마지막 열은 항목수
+    
+    @classmethod
+    def empty(cls) -> "BudgetCube":
+        return cls({dim: [] for dim in DIMENSIONS},
+                   np.zeros((0, len(DIMENSIONS)), dtype=np.int64), np.zeros((0, len(MEASURES))))
+    
+    @classmethod
+    def from_items(cls, items: List[dict]) -> "BudgetCube":
+        """항목 목록 → 큐브 (라벨 조합 번호 매기기 + 금액 열 배열 생성이 유일한 파이썬 반복)"""
+        if not items:
+            return cls.empty()
+        cells = {}
+        inverse = np.fromiter((cells.setdefault(key, len(cells)) for key in map(itemgetter(*DIMENSIONS), items)),
+                              dtype=np.int64, count=len(items))
+        numbers = np.fromiter(chain.from_iterable(map(itemgetter(*[field for field, _ in MEASURE_FIELDS]), items)),
+                              dtype=float, count=len(items) * len(MEASURE_FIELDS)).reshape(len(items), -1)
+        numbers = np.round(numbers, SUM_DECIMALS)
+        sums = np.column_stack(
+            [np.bincount(inverse, weights=numbers[:, m], minlength=len(cells)) for m in range(numbers.shape[1])]
+            + [np.bincount(inverse, minlength=len(cells))]
+        )
+        
+        # 셀 라벨 조합 → 차원별 라벨 번호
+        labels = {}
+        keys = list(cells)
+        codes = np.empty((len(keys), len(DIMENSIONS)), dtype=np.int64)
+        for i, dim in enumerate(DIMENSIONS):
+            unique = sorted({key[i] for key in keys})
+            lookup = {label: code for code, label in enumerate(unique)}
+            codes[:, i] = [lookup[key[i]] for key in keys]
+            labels[dim] = unique
+        return cls(labels, codes, np.round(sums.astype(float), SUM_DECIMALS))
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["BudgetCube"]:
+        """to_dict 결과 → 큐브 (측정값 구성이 바뀌었으면 None)"""
+        if data.get("measures") != MEASURES:
+            return None
+        codes = np.array(data["codes"], dtype=np.int64).reshape(-1, len(DIMENSIONS))
+        values = np.array(data["values"], dtype=float).reshape(-1, len(MEASURES))
+        return cls({dim: list(data["labels"][dim]) for dim in DIMENSIONS}, codes, values)
+    
+    def to_dict(self) -> dict:
+        return {
+            "measures": MEASURES,
+            "labels": self.labels,
+            "codes": self.codes.tolist(),
+            "values": [[_number(value) for value in row] for row in self.values.tolist()],
+        }
+    
+    @classmethod
+    def _aggregate(cls, labels: Dict[str, List[str]], codes: np.ndarray, values: np.ndarray) -> "BudgetCube":
+        """행(항목 또는 셀)을 같은 라벨 조합끼리 합치고, 값이 모두 0이 된 셀과 쓰이지 않는 라벨은 제거"""
+        cells, inverse = np.unique(codes, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        sums = np.round(np.column_stack([
+            np.bincount(inverse, weights=values[:, m], minlength=len(cells)) for m in range(values.shape[1])
+        ]), SUM_DECIMALS)
+        keep = np.any(sums != 0, axis=1)
+        cells, sums = cells[keep], sums[keep]
+        
+        pruned = {}
+        for i, dim in enumerate(DIMENSIONS):
+            used, cells[:, i] = np.unique(cells[:, i], return_inverse=True)
+            pruned[dim] = [labels[dim][code] for code in used.tolist()]
+        return cls(pruned, cells, sums)
+    
+    def merge(self, other: "BudgetCube") -> "BudgetCube":
+        """두 큐브 합치기 (라벨 목록이 달라도 됨)"""
+        labels = {dim: sorted(set(self.labels[dim]) | set(other.labels[dim])) for dim in DIMENSIONS}
+        
+        def remap(cube: "BudgetCube") -> np.ndarray:
+            codes = np.empty_like(cube.codes)
+            for i, dim in enumerate(DIMENSIONS):
+                lookup = np.searchsorted(labels[dim], cube.labels[dim]) if cube.labels[dim] else np.zeros(0, int)
+                codes[:, i] = lookup[cube.codes[:, i]]
+            return codes
+        
+        return self._aggregate(labels, np.vstack([remap(self), remap(other)]),
+                               np.vstack([self.values, other.values]))
+    
+    def scaled(self, factor: float) -> "BudgetCube":
+        return BudgetCube(self.labels, self.codes, self.values * factor)
+    
+    def apply_changes(self, removed: List[dict], added: List[dict]) -> "BudgetCube":
+        """항목 변경분 반영 (수정은 이전 값을 removed, 새 값을 added에) - 변경 건수만큼만 계산"""
+        cube = self
+        if removed:
+            cube = cube.merge(BudgetCube.from_items(removed).scaled(-1))
+        if added:
+            cube = cube.merge(BudgetCube.from_items(added))
+        return cube
+    
+    def diff(self, other: "BudgetCube") -> "BudgetCube":
+        """self - other (같으면 셀이 없는 큐브)"""
+        return self.merge(other.scaled(-1))
+    
+    def drift(self, other: "BudgetCube", tolerance: float = DRIFT_TOLERANCE) -> int:
+        """self와 other의 값이 tolerance보다 크게 다른 셀 수"""
+        return int(np.any(np.abs(self.diff(other).values) > tolerance, axis=1).sum())
+    
+    def group(self, *dims: str) -> Tuple[List[tuple], np.ndarray]:
+        """dims 기준으로 셀을 묶은 (라벨 튜플 목록, 측정값 합계 행렬) - 셀 순서와 관계없이 같은 값이 되도록 반올림"""
+        if not dims:
+            return [()], np.round(self.values.sum(axis=0, keepdims=True), SUM_DECIMALS)
+        columns = [DIMENSIONS.index(dim) for dim in dims]
+        keys, inverse = np.unique(self.codes[:, columns], axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        sums = np.round(np.column_stack([
+            np.bincount(inverse, weights=self.values[:, m], minlength=len(keys)) for m in range(len(MEASURES))
+        ]), SUM_DECIMALS)
+        names = [tuple(self.labels[dim][code] for dim, code in zip(dims, key)) for key in keys.tolist()]
+        return names, sums
+    
+    @staticmethod
+    def measures(row: np.ndarray) -> Dict[str, float]:
+        """측정값 행 → {측정값 이름: 합계}"""
+        return {name: _number(value) for name, value in zip(MEASURES, row)}
+    
+    def total(self) -> Dict[str, float]:
+        return self.measures(self.group()[1][0])
+    
+    def by(self, dim: str) -> Dict[str, Dict[str, float]]:
+        names, sums = self.group(dim)
+        return {name: self.measures(row) for (name,), row in zip(names, sums)}
+    
+    @staticmethod
+    def _summary(row: np.ndarray) -> dict:
+        """롤업 노드: 예산 / 집행 / 잔액 / 집행률 / 항목수 + 연도별 + 전년대비"""
+        values = dict(zip(MEASURES, row))
+        years = {
+            year: {
+                "예산": _number(values[f"{year}년예산"]),
+                "집행": _number(values[f"{year}년집행"]),
+                "집행률": _rate(values[f"{year}년집행"], values[f"{year}년예산"]),
+            }
+            for year in FISCAL_YEARS
+        }
+        previous, current = FISCAL_YEARS[-2], FISCAL_YEARS[-1]
+        return {
+            "예산": _number(values["예산"]),
+            "집행": _number(values["집행"]),
+            "잔액": _number(values["잔액"]),
+            "집행률": _rate(values["집행"], values["예산"]),
+            "항목수": int(values["항목수"]),
+            "연도별": years,
+            "전년대비": {
+                "예산증감": _number(values[f"{current}년예산"] - values[f"{previous}년예산"]),
+                "예산증감률": _change(values[f"{current}년예산"], values[f"{previous}년예산"]),
+                "집행증감": _number(values[f"{current}년집행"] - values[f"{previous}년집행"]),
+                "집행증감률": _change(values[f"{current}년집행"], values[f"{previous}년집행"]),
+            },
+        }
+    
+    def rollup(self) -> dict:
+        """대시보드 JSON용 롤업 (빈 라벨은 EMPTY_LABEL)"""
+        def nest(*dims: str) -> dict:
+            names, sums = self.group(*dims)
+            tree = {}
+            for key, row in zip(names, sums):
+                node = tree
+                for label in key[:-1]:
+                    node = node.setdefault(label or EMPTY_LABEL, {})
+                node[key[-1] or EMPTY_LABEL] = self._summary(row)
+            return tree
+        
+        return {
+            "연도": list(FISCAL_YEARS),
+            "전체": self._summary(self.group()[1][0]),
+            "비목별": nest("비목"),
+            "비목_세목별": nest("비목", "세목"),
+            "상태별": nest("상태"),
+            "비목_상태별": nest("비목", "상태"),
+        }
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+예산 집행 전망 (집행 이력으로 사업종료일 예상 집행액 / 불용·초과 위험 판정)
+
+모든 항목의 집행 추세(원/일)를 스냅샷 날짜별 사용금액에 대한 지수 가중 최소제곱 기울기로
+구합니다. 최근 관측일수록 가중치가 큽니다(반감기 FORECAST_HALF_LIFE_DAYS일).
+
+최소제곱에 필요한 항목별 가중 합계(관측 수, Σw, Σwx, Σwx², Σwy, Σwxy)를 이력 DB의
+trend_state 표에 두고, 새 스냅샷 날짜마다 감쇠 + 새 관측 하나만 더합니다(같은 날 다시
+실행하면 그날 값만 교체). 따라서 내보내기마다 항목 수만큼의 배열 연산뿐이고, 이력 길이와
+관계없이 항목 수천 개도 (DB 읽기·쓰기 포함) 수십 ms 안에 끝납니다.
+합계가 없거나 반감기가 바뀌었으면 최근 FORECAST_WINDOW_DAYS일 이력을 (항목 × 날짜) 행렬로
+펼쳐(변경 사이 날짜는 직전 값 유지) 한 번에 다시 계산합니다.
+
+  예상집행 = 현재 집행 + max(추세, 0) × 남은일수
+
+판정:
+  - 초과위험: 예상집행 > 예산
+  - 불용위험: 예상집행률 < FORECAST_LAPSE_RATE (기본 90%)
+  - 관측일이 FORECAST_MIN_POINTS일 미만인 항목은 추세를 믿을 수 없으므로 전망과 판정을 내지 않고
+    (판정 null, 이력부족 true) 이력부족항목에 따로 둡니다. 새로 배포했거나 이력 DB를 잃은 직후에는
+    대부분의 항목이 여기에 해당합니다.
+비목 / 전체 전망은 이력이 충분한 항목의 합계입니다 (전망항목수 / 이력부족 건수 함께 표시).
+
+출력:
+  - data/forecast.json: 전체 / 비목별 전망, 위험 항목 목록 (예상 불용액 순), 이력부족 항목 목록
+
+사용법:
+  python scripts/bms.py forecast            # 이력 DB로 전망 계산 후 data/forecast.json 저장
+  내보내기(export_to_dashboard.py, api/fetch_notion_data.py)는 이력 기록 후 자동으로 실행합니다.
+
+환경변수:
+  - PROJECT_END_DATE: (선택) 사업종료일 (기본 2026-12-31)
+  - FORECAST_WINDOW_DAYS: (선택) 가중 합계를 다시 계산할 때 읽는 최근 이력 기간 (기본 365일)
+  - FORECAST_HALF_LIFE_DAYS: (선택) 가중치 반감기 (기본 30일)
+  - FORECAST_MIN_POINTS: (선택) 추세를 구하는 최소 관측일 수 (기본 3)
+  - FORECAST_LAPSE_RATE: (선택) 불용위험 기준 예상집행률 % (기본 90)
+"""
+
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from budget_cube import _number, _rate
+from budget_history import BUDGET_HISTORY_PATH, BudgetHistory
+from dashboard_bundle import publish
+from json_stream import write_json
+
+PROJECT_END_DATE = date.fromisoformat(os.getenv("PROJECT_END_DATE", "2026-12-31"))
+FORECAST_WINDOW_DAYS = int(os.getenv("FORECAST_WINDOW_DAYS", "365"))
+FORECAST_HALF_LIFE_DAYS = float(os.getenv("FORECAST_HALF_LIFE_DAYS", "30"))
+FORECAST_MIN_POINTS = int(os.getenv("FORECAST_MIN_POINTS", "3"))
+FORECAST_LAPSE_RATE = float(os.getenv("FORECAST_LAPSE_RATE", "90"))
+
+FORECAST_PATH = "data/forecast.json"
+
+NORMAL, LAPSE, OVERRUN = "정상", "불용위험", "초과위험"
+
+# 가중 합계 열 (trend_state 열 순서)
+MOMENTS = ("points", "s0", "sx", "sxx", "sy", "sxy")
+
+STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trend_state (
+    item_id TEXT PRIMARY KEY,
+    points REAL,
+    s0 REAL,
+    sx REAL,
+    sxx REAL,
+    sy REAL,
+    sxy REAL,
+    last REAL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trend_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def days_remaining(today: Optional[date] = None) -> int:
+    """사업종료일까지 남은 일수 (지났으면 0)"""
+    today = today or datetime.now().date()
+    return max(0, (PROJECT_END_DATE - today).days)
+
+
+def _ordinals(days: List[str]) -> np.ndarray:
+    return np.array([date.fromisoformat(day).toordinal() for day in days], dtype=float)
+
+
+def used_matrix(ids: List[str], grid: List[str], changes: List[tuple]) -> np.ndarray:
+    """사용금액 변경 [(item_id, day, used)] → (항목 × 날짜) 행렬 (첫 관측 전은 NaN, 그 뒤는 직전 값 유지)"""
+    matrix = np.full((len(ids), len(grid)), np.nan)
+    index = {item_id: i for i, item_id in enumerate(ids)}
+    changes = [change for change in changes if change[0] in index]
+    if not changes or not grid:
+        return matrix
+    rows = np.fromiter((index[item_id] for item_id, _, _ in changes), dtype=np.int64, count=len(changes))
+    # 기간 시작 전 값은 첫 날짜로
+    cols = np.maximum(np.searchsorted(np.array(grid), np.array([day for _, day, _ in changes]), side="right") - 1, 0)
+    values = np.array([used or 0 for _, _, used in changes], dtype=float)
+    
+    # 같은 날 여러 번 바뀌었으면 마지막 스냅샷 값 (뒤에서부터 첫 번째)
+    keys = rows * len(grid) + cols
+    _, last = np.unique(keys[::-1], return_index=True)
+    last = len(keys) - 1 - last
+    matrix[rows[last], cols[last]] = values[last]
+    
+    # 직전 관측 값으로 채우기
+    observed = ~np.isnan(matrix)
+    source = np.maximum.accumulate(np.where(observed, np.arange(len(grid)), -1), axis=1)
+    filled = np.take_along_axis(matrix, np.maximum(source, 0), axis=1)
+    filled[source < 0] = np.nan
+    return filled
+
+
+def moments(x: np.ndarray, y: np.ndarray, half_life: float = FORECAST_HALF_LIFE_DAYS) -> np.ndarray:
+    """행마다 가중 합계 (MOMENTS 순서, (6, 항목)) - x는 마지막 날짜 기준 일수로 바꿔 계산
+    
+    x: (날짜,) 일 단위 / y: (항목, 날짜), NaN은 관측 없음
+    """
+    observed = ~np.isnan(y)
+    xc = x - x[-1]
+    weights = np.where(observed, 0.5 ** (-xc / half_life), 0.0)
+    weighted = weights * np.where(observed, y, 0.0)
+    return np.array([
+        observed.sum(axis=1), weights.sum(axis=1), weights @ xc, weights @ (xc * xc),
+        weighted.sum(axis=1), weighted @ xc,
+    ], dtype=float)
+
+
+def advance(state: np.ndarray, days: float, half_life: float = FORECAST_HALF_LIFE_DAYS) -> np.ndarray:
+    """가중 합계의 기준 날짜를 days일 뒤로 옮김 (가중치 감쇠 + x 이동)"""
+    points, s0, sx, sxx, sy, sxy = state
+    decay = 0.5 ** (days / half_life)
+    return np.array([
+        points, decay * s0, decay * (sx - days * s0), decay * (sxx - 2 * days * sx + days * days * s0),
+        decay * sy, decay * (sxy - days * sy),
+    ])
+
+
+def slopes(state: np.ndarray, min_points: int = FORECAST_MIN_POINTS) -> np.ndarray:
+    """가중 합계 → 최소제곱 기울기 (관측이 부족하면 NaN)"""
+    points, s0, sx, sxx, sy, sxy = state
+    denominator = s0 * sxx - sx * sx
+    enough = (points >= min_points) & (denominator > 1e-9 * np.maximum(s0 * sxx, 1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(enough, (s0 * sxy - sx * sy) / denominator, np.nan)
+
+
+def _rebuild(history: BudgetHistory, ids: List[str], day: str) -> np.ndarray:
+    """최근 FORECAST_WINDOW_DAYS일 이력으로 가중 합계 전체 계산"""
+    start = (date.fromisoformat(day) - timedelta(days=FORECAST_WINDOW_DAYS)).isoformat()
+    grid = history.snapshot_days(start)
+    return moments(_ordinals(grid), used_matrix(ids, grid, history.used_changes(start)))
+
+
+def update_trends(history: BudgetHistory, ids: List[str], used: np.ndarray, day: str) -> np.ndarray:
+    """trend_state를 day(최근 스냅샷 날짜)의 사용금액까지 반영해 저장하고 (6, 항목) 가중 합계 반환"""
+    conn = history.conn
+    conn.executescript(STATE_SCHEMA)
+    meta = dict(conn.execute("SELECT key, value FROM trend_meta"))
+    previous = meta.get("day", "")
+    if meta.get("half_life") != str(FORECAST_HALF_LIFE_DAYS) or previous > day:
+        state = _rebuild(history, ids, day)
+    else:
+        rows = {row[0]: row[1:] for row in conn.execute(f"SELECT item_id, {', '.join(MOMENTS)}, last FROM trend_state")}
+        empty = (0.0,) * (len(MOMENTS) + 1)
+        stored = np.array([rows.get(item_id, empty) for item_id in ids], dtype=float).reshape(-1, len(MOMENTS) + 1)
+        state, last = stored[:, :-1].T, stored[:, -1]
+        # 같은 날 다시 내보냈는데 사용금액이 그대로면 쓰지 않음 (이력 DB 파일 유지)
+        if previous == day and rows.keys() >= set(ids) and np.array_equal(last, used):
+            return state
+        # 오늘 관측이 이미 있는 항목은 값만 교체, 나머지는 감쇠 후 오늘 관측 추가
+        seen_today = (state[0] > 0) & (previous == day)
+        if previous and previous < day:
+            state = advance(state, (date.fromisoformat(day) - date.fromisoformat(previous)).days)
+        state[4] += np.where(seen_today, used - last, used)
+        state[1] += ~seen_today
+        state[0] += ~seen_today
+    with conn:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO trend_state (item_id, {', '.join(MOMENTS)}, last) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(item_id,) + tuple(values) for item_id, values in zip(ids, np.vstack([state, used]).T.tolist())],
+        )
+        conn.executemany("INSERT OR REPLACE INTO trend_meta (key, value) VALUES (?, ?)",
+                         [("day", day), ("half_life", str(FORECAST_HALF_LIFE_DAYS))])
+    return state
+
+
+def classify(budget: np.ndarray, projected: np.ndarray) -> np.ndarray:
+    over = projected > budget
+    lapse = (budget > 0) & (projected < budget * FORECAST_LAPSE_RATE / 100)
+    return np.where(over, OVERRUN, np.where(lapse, LAPSE, NORMAL))
+
+
+def _node(budget: float, used: float, projected: Optional[float], trend: Optional[float]) -> dict:
+    """전망 노드 (projected / trend가 None이면 예상 값도 None)"""
+    node = {
+        "예산": _number(budget),
+        "집행": _number(used),
+        "집행률": _rate(used, budget),
+        "예상집행": None,
+        "예상집행률": None,
+        "예상불용액": None,
+        "일평균집행": None,
+    }
+    if projected is not None:
+        node.update({
+            "예상집행": _number(round(projected)),
+            "예상집행률": _rate(projected, budget),
+            "예상불용액": _number(round(max(budget - projected, 0))),
+            "일평균집행": _number(round(trend)),
+        })
+    return node
+
+
+def _group_node(mask: np.ndarray, budget: np.ndarray, used: np.ndarray, projected: np.ndarray,
+                trend: np.ndarray, verdicts: np.ndarray) -> dict:
+    """mask 항목 중 이력이 충분한 항목만 합친 전망 (그런 항목이 없으면 판정 None)"""
+    known = mask & ~np.isnan(projected)
+    if known.any():
+        node = _node(budget[known].sum(), used[known].sum(), projected[known].sum(), trend[known].sum())
+        node["판정"] = str(classify(budget[known].sum(keepdims=True), projected[known].sum(keepdims=True))[0])
+    else:
+        node = _node(budget[mask].sum(), used[mask].sum(), None, None)
+        node["판정"] = None
+    node["전망항목수"] = int(np.count_nonzero(known))
+    node["이력부족"] = int(np.count_nonzero(mask & ~known))
+    node["불용위험"] = int(np.count_nonzero(mask & (verdicts == LAPSE)))
+    node["초과위험"] = int(np.count_nonzero(mask & (verdicts == OVERRUN)))
+    return node
+
+
+def forecast(history: BudgetHistory) -> Optional[dict]:
+    """이력 DB → 전체 / 비목별 / 항목별 전망 (이력이 없으면 None)"""
+    latest = history.latest()
+    grid = history.snapshot_days()
+    if not latest or not grid:
+        return None
+    
+    ids = [row[0] for row in latest]
+    bimoks = np.array([row[1] or "" for row in latest])
+    budget = np.array([row[2] or 0 for row in latest], dtype=float)
+    used = np.array([row[3] or 0 for row in latest], dtype=float)
+    
+    # 관측이 FORECAST_MIN_POINTS일 미만인 항목은 추세 NaN → 전망 / 판정 없음
+    trend = np.maximum(slopes(update_trends(history, ids, used, grid[-1])), 0)
+    remaining = max((PROJECT_END_DATE - date.fromisoformat(grid[-1])).days, 0)
+    projected = used + trend * remaining
+    known = ~np.isnan(projected)
+    verdicts = np.where(known, classify(budget, np.nan_to_num(projected)), "")
+    
+    # 비목별 / 전체 (이력이 충분한 항목의 합계)
+    by_bimok = {}
+    for name in sorted(set(bimoks.tolist())):
+        by_bimok[name or "기타"] = _group_node(bimoks == name, budget, used, projected, trend, verdicts)
+    total = _group_node(np.ones(len(ids), dtype=bool), budget, used, projected, trend, verdicts)
+    
+    def entry(i: int) -> dict:
+        if known[i]:
+            node, verdict = _node(budget[i], used[i], projected[i], trend[i]), str(verdicts[i])
+        else:
+            node, verdict = _node(budget[i], used[i], None, None), None
+        return {"id": ids[i], "비목": str(bimoks[i]), **node, "판정": verdict, "이력부족": not known[i]}
+    
+    # 위험 항목 (예상 불용액 / 초과액이 큰 순)
+    risky = np.flatnonzero(known & (verdicts != NORMAL))
+    risky = risky[np.argsort(-np.abs(budget[risky] - projected[risky]), kind="stable")]
+    
+    return {
+        "기준일": grid[-1],
+        "사업종료일": PROJECT_END_DATE.isoformat(),
+        "남은일수": remaining,
+        "관측일수": len(grid),
+        "최소관측일수": FORECAST_MIN_POINTS,
+        "불용위험기준": FORECAST_LAPSE_RATE,
+        "전체": total,
+        "비목별": by_bimok,
+        "위험항목": [entry(i) for i in risky.tolist()],
+        "이력부족항목": [entry(i) for i in np.flatnonzero(~known).tolist()],
+    }
+
+
+def write_forecast(result: dict, items: Optional[List[dict]] = None, path: str = FORECAST_PATH) -> str:
+    """전망 저장 (items가 있으면 위험 / 이력부족 항목에 항목명 / 세목 추가), 내용 해시 반환"""
+    if items:
+        names: Dict[str, dict] = {item["id"]: item for item in items}
+        for entry in result["위험항목"] + result["이력부족항목"]:
+            item = names.get(entry["id"], {})
+            entry["항목명"] = item.get("항목명", "")
+            entry["세목"] = item.get("세목", "")
+    digest = write_json(path, result)
+    publish("forecast", {os.path.basename(path): digest})
+    return digest
+
+
+def print_forecast(result: dict, elapsed: float):
+    total = result["전체"]
+    outlook = f"예상집행률 {total['예상집행률']}%" if total["판정"] else "전망 없음"
+    print(f"   → 집행 전망 ({result['사업종료일']}): {outlook}, "
+          f"불용위험 {total['불용위험']}건 / 초과위험 {total['초과위험']}건 / 이력부족 {total['이력부족']}건 "
+          f"(관측 {result['관측일수']}일, {elapsed * 1000:.1f}ms)")
+
+
+def forecast_after_export(items: Optional[List[dict]] = None) -> Optional[dict]:
+    """내보내기 후 단계: 이력 DB로 전망 계산 후 data/forecast.json 저장 (이력 DB가 꺼져 있으면 건너뜀)"""
+    if not BUDGET_HISTORY_PATH or not os.path.exists(BUDGET_HISTORY_PATH):
+        return None
+    mark = time.perf_counter()
+    history = BudgetHistory()
+    try:
+        result = forecast(history)
+    finally:
+        history.close()
+    if result is None:
+        return None
+    write_forecast(result, items)
+    print_forecast(result, time.perf_counter() - mark)
+    return result
+
+
+def main():
+    if forecast_after_export() is None:
+        print("❌ 집행 이력이 없습니다. 먼저 내보내기를 실행하세요.")
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+예산 집행 이력 저장소 (내보내기마다 항목별 스냅샷을 SQLite에 추가만 함)
+
+data/budget.json은 매번 덮어써지므로, 내보내기 때마다 항목별 (총예산, 사용금액_합계, 잔액,
+집행률, 상태)를 이력 DB에 쌓아 git 기록을 뒤지지 않고 집행 추이를 조회합니다.
+
+저장 방식:
+  - item_history: 지난 스냅샷과 값이 달라진 항목만 한 행씩 추가 (값이 그대로인 항목은 행 없음,
+    사라진 항목은 상태 "삭제" 행) → 항목 시계열은 변경 시점 목록이고 그 사이는 직전 값 유지
+    (item_id, snapshot_id) 기본 키로 항목별 행이 붙어 있어 항목 시계열은 범위 조회 한 번입니다.
+  - item_latest: 항목별 최신 값 (다음 스냅샷 비교용)
+  - rollup_daily / rollup_monthly: 날짜(월) × 비목 합계 (그날 / 그달 마지막 스냅샷 기준, 전체는 비목 "*")
+    기본 키가 (비목, 날짜)라 비목 시계열도 범위 조회 한 번입니다.
+
+사용법:
+  python scripts/bms.py history item <page_id>          # 항목 시계열 (변경 시점)
+  python scripts/bms.py history bimok <비목> [--monthly] # 비목 일별 / 월별 합계
+  python scripts/bms.py history total [--monthly]       # 전체 합계
+
+환경변수:
+  - BUDGET_HISTORY_PATH: (선택) 이력 DB 경로 (기본 data/history/budget_history.sqlite, 빈 값이면 비활성화)
+
+이력은 다시 만들 수 없으므로 Actions 캐시(만료 / 삭제될 수 있음)가 아니라 data/와 함께 저장소에 커밋합니다.
+두 워크플로우(budget_sync.yml, sync.yml)는 같은 concurrency 그룹으로 한 번에 하나만 실행되어
+서로의 이력을 덮어쓰지 않습니다. 같은 날 바뀐 항목이 없는 실행은 DB에 쓰지 않아 커밋도 생기지 않습니다.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from budget_cube import BudgetCube
+
+BUDGET_HISTORY_PATH = os.getenv("BUDGET_HISTORY_PATH", "data/history/budget_history.sqlite")
+
+# 항목 필드 → 이력 열
+ITEM_COLUMNS = [
+    ("총예산", "budget"),
+    ("사용금액_합계", "used"),
+    ("잔액", "remaining"),
+    ("집행률", "rate"),
+    ("상태", "status"),
+]
+# 롤업 측정값 (BudgetCube 측정값 → 열)
+ROLLUP_COLUMNS = [("예산", "budget"), ("집행", "used"), ("잔액", "remaining"), ("항목수", "items")]
+
+TOTAL_KEY = "*"
+DELETED_STATUS = "삭제"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    snapshot_id INTEGER PRIMARY KEY,
+    taken_at TEXT NOT NULL,
+    day TEXT NOT NULL,
+    source TEXT,
+    items INTEGER,
+    changed INTEGER
+);
+CREATE TABLE IF NOT EXISTS item_history (
+    item_id TEXT NOT NULL,
+    snapshot_id INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    bimok TEXT,
+    budget REAL,
+    used REAL,
+    remaining REAL,
+    rate REAL,
+    status TEXT,
+    PRIMARY KEY (item_id, snapshot_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS item_history_snapshot ON item_history (snapshot_id, item_id);
+CREATE TABLE IF NOT EXISTS item_latest (
+    item_id TEXT PRIMARY KEY,
+    bimok TEXT,
+    budget REAL,
+    used REAL,
+    remaining REAL,
+    rate REAL,
+    status TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollup_daily (
+    bimok TEXT NOT NULL,
+    day TEXT NOT NULL,
+    budget REAL,
+    used REAL,
+    remaining REAL,
+    items INTEGER,
+    PRIMARY KEY (bimok, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollup_monthly (
+    bimok TEXT NOT NULL,
+    month TEXT NOT NULL,
+    budget REAL,
+    used REAL,
+    remaining REAL,
+    items INTEGER,
+    PRIMARY KEY (bimok, month)
+) WITHOUT ROWID;
+"""
+
+
+def _item_row(item: dict) -> Tuple:
+    """항목 → (비목, 총예산, 사용금액_합계, 잔액, 집행률, 상태)"""
+    return (item.get("비목", ""),) + tuple(item.get(field) or 0 for field, _ in ITEM_COLUMNS[:-1]) + (item.get("상태", ""),)
+
+
+class BudgetHistory:
+    """SQLite 기반 예산 집행 이력 (추가 전용)"""
+    
+    def __init__(self, path: str = BUDGET_HISTORY_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+    
+    def append(self, items: List[dict], cube: Optional[BudgetCube] = None, source: str = "",
+               taken_at: Optional[datetime] = None) -> Dict[str, int]:
+        """스냅샷 추가 (값이 바뀐 항목만 행 추가) 및 일별 / 월별 롤업 갱신
+        
+        cube: 내보내기가 이미 계산한 요약 집계 (없으면 items로 계산)
+        """
+        taken_at = taken_at or datetime.now()
+        day = taken_at.strftime("%Y-%m-%d")
+        latest = {row[0]: row[1:] for row in self.conn.execute(
+            "SELECT item_id, bimok, budget, used, remaining, rate, status FROM item_latest"
+        )}
+        
+        current = {item["id"]: _item_row(item) for item in items}
+        changed = [(item_id, row) for item_id, row in current.items() if latest.get(item_id) != row]
+        deleted = [
+            (item_id, (row[0], 0, 0, 0, 0, DELETED_STATUS))
+            for item_id, row in latest.items() if item_id not in current and row[-1] != DELETED_STATUS
+        ]
+        # 같은 날 바뀐 항목이 없으면 쓰지 않음 (DB 파일이 그대로여야 워크플로우가 커밋을 건너뜀)
+        if not changed and not deleted:
+            same_day = self.conn.execute("SELECT MAX(snapshot_id) FROM snapshots WHERE day = ?", (day,)).fetchone()[0]
+            if same_day is not None:
+                return {"snapshot": same_day, "changed": 0, "deleted": 0}
+        
+        with self.conn:
+            snapshot_id = self.conn.execute(
+                "INSERT INTO snapshots (taken_at, day, source, items, changed) VALUES (?, ?, ?, ?, ?)",
+                (taken_at.isoformat(timespec="seconds"), day, source, len(items), len(changed) + len(deleted)),
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO item_history (item_id, snapshot_id, day, bimok, budget, used, remaining, rate, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(item_id, snapshot_id, day) + row for item_id, row in changed + deleted],
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO item_latest (item_id, bimok, budget, used, remaining, rate, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(item_id,) + row for item_id, row in changed + deleted],
+            )
+            self._rollup(cube or BudgetCube.from_items(items), day)
+        return {"snapshot": snapshot_id, "changed": len(changed), "deleted": len(deleted)}
+    
+    def _rollup(self, cube: BudgetCube, day: str):
+        """그날 / 그달 롤업을 이번 스냅샷 값으로 교체 (사라진 비목 행은 삭제)"""
+        groups = {TOTAL_KEY: cube.total(), **cube.by("비목")}
+        rows = [(bimok,) + tuple(values[measure] for measure, _ in ROLLUP_COLUMNS) for bimok, values in groups.items()]
+        for table, period, key in (("rollup_daily", "day", day), ("rollup_monthly", "month", day[:7])):
+            self.conn.execute(f"DELETE FROM {table} WHERE {period} = ?", (key,))
+            self.conn.executemany(
+                f"INSERT INTO {table} (bimok, {period}, budget, used, remaining, items) VALUES (?, ?, ?, ?, ?, ?)",
+                [(row[0], key) + row[1:] for row in rows],
+            )
+    
+    # --- 조회 ---
+    
+    def item_series(self, item_id: str, start: Optional[str] = None, end: Optional[str] = None) -> List[dict]:
+        """항목 변경 시점 목록 [{day, 총예산, 사용금액_합계, 잔액, 집행률, 상태}] (start / end: YYYY-MM-DD)"""
+        rows = self.conn.execute(
+            "SELECT day, budget, used, remaining, rate, status FROM item_history "
+            "WHERE item_id = ? AND day >= ? AND day <= ? ORDER BY snapshot_id",
+            (item_id, start or "", end or "9999"),
+        )
+        return [dict(zip(["day"] + [field for field, _ in ITEM_COLUMNS], row)) for row in rows]
+    
+    def bimok_series(self, bimok: str = TOTAL_KEY, monthly: bool = False,
+                     start: Optional[str] = None, end: Optional[str] = None) -> List[dict]:
+        """비목(기본 전체) 일별 / 월별 합계 [{day|month, 예산, 집행, 잔액, 항목수}]"""
+        table, period = ("rollup_monthly", "month") if monthly else ("rollup_daily", "day")
+        rows = self.conn.execute(
+            f"SELECT {period}, budget, used, remaining, items FROM {table} "
+            f"WHERE bimok = ? AND {period} >= ? AND {period} <= ? ORDER BY {period}",
+            (bimok, start or "", end or "9999"),
+        )
+        return [dict(zip([period] + [measure for measure, _ in ROLLUP_COLUMNS], row)) for row in rows]
+    
+    def latest(self) -> List[Tuple]:
+        """현재 항목 [(item_id, 비목, 총예산, 사용금액_합계)] (삭제된 항목 제외)"""
+        return self.conn.execute(
+            "SELECT item_id, bimok, budget, used FROM item_latest WHERE status != ? ORDER BY item_id",
+            (DELETED_STATUS,),
+        ).fetchall()
+    
+    def snapshot_days(self, start: str = "") -> List[str]:
+        return [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT day FROM snapshots WHERE day >= ? ORDER BY day", (start,)
+        )]
+    
+    def used_changes(self, start: str = "") -> List[Tuple]:
+        """사용금액 변경 [(item_id, day, 사용금액_합계)] (항목별 스냅샷 순, 삭제 행 제외)
+        
+        start 이전 값은 항목별 마지막 행 하나만 맨 앞에 붙여 기간 시작 값으로 씁니다.
+        """
+        seeds = self.conn.execute(
+            "SELECT h.item_id, h.day, h.used FROM item_history h JOIN ("
+            "  SELECT item_id, MAX(snapshot_id) AS snapshot_id FROM item_history"
+            "  WHERE day < ? AND status != ? GROUP BY item_id"
+            ") s USING (item_id, snapshot_id)",
+            (start, DELETED_STATUS),
+        ).fetchall() if start else []
+        # 기본 키 순서 그대로 읽음 (항목 안에서는 스냅샷 순)
+        return seeds + self.conn.execute(
+            "SELECT item_id, day, used FROM item_history WHERE day >= ? AND status != ? ORDER BY item_id, snapshot_id",
+            (start, DELETED_STATUS),
+        ).fetchall()
+    
+    def snapshots(self) -> List[dict]:
+        rows = self.conn.execute("SELECT snapshot_id, taken_at, source, items, changed FROM snapshots ORDER BY snapshot_id")
+        return [dict(zip(("snapshot", "taken_at", "source", "items", "changed"), row)) for row in rows]
+    
+    def close(self):
+        self.conn.close()
+
+
+def record_history(items: List[dict], cube: Optional[BudgetCube], source: str):
+    """내보내기 후 단계: 이력 DB에 스냅샷 추가 (BUDGET_HISTORY_PATH가 비어 있으면 건너뜀)"""
+    if not BUDGET_HISTORY_PATH:
+        return
+    history = BudgetHistory()
+    try:
+        result = history.append(items, cube, source)
+    finally:
+        history.close()
+    print(f"   → 집행 이력 스냅샷 #{result['snapshot']} (변경 {result['changed']}건, 삭제 {result['deleted']}건)")
+
+
+def add_history_arguments(parser):
+    parser.add_argument("target", choices=["item", "bimok", "total", "snapshots"], help="조회 대상")
+    parser.add_argument("key", nargs="?", help="item: page id, bimok: 비목 이름")
+    parser.add_argument("--monthly", action="store_true", help="월별 롤업 (bimok / total)")
+    parser.add_argument("--start", help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", help="종료일 (YYYY-MM-DD)")
+
+
+def run_history(args) -> List[dict]:
+    """bms.py history: 시계열을 JSON으로 출력"""
+    history = BudgetHistory()
+    try:
+        if args.target == "item":
+            series = history.item_series(args.key, args.start, args.end)
+        elif args.target == "snapshots":
+            series = history.snapshots()
+        else:
+            bimok = args.key if args.target == "bimok" else TOTAL_KEY
+            series = history.bimok_series(bimok, args.monthly, args.start, args.end)
+    finally:
+        history.close()
+    print(json.dumps(series, ensure_ascii=False, indent=2))
+    return series
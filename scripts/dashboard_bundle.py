@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+대시보드 데이터 파일 게시 (경량 번들 + 내용 해시 manifest + meta.json)
+
+들여쓰기된 전체 JSON(data/budget.json 등)과 별도로, 모바일 회선에서 먼저 요약만 받고
+항목은 필요한 비목만 나중에 받을 수 있도록 다음 파일을 만듭니다.
+
+  data/{이름}.summary.json         요약 (공백 없는 JSON)
+  data/{이름}.min.json             전체 항목 (열 단위: 필드 이름 한 번 + 필드별 값 배열)
+  data/shards/{이름}/{비목}.json   비목별 항목 (열 단위, 파일 이름은 비목 코드)
+  data/manifest.json               데이터셋별 파일 경로 / 내용 해시 / 크기 / 항목 수
+  data/meta.json                   데이터셋별 생성 시각 (내용이 바뀐 실행에서만 갱신)
+
+각 파일 옆에 미리 압축한 .gz(항상)와 .br(brotli 설치 시)을 둡니다. gzip 헤더의
+시각은 0으로 고정해 내용이 같으면 압축 파일도 같습니다.
+
+데이터 파일에는 실행 시각을 넣지 않고 항목 순서도 고정(sort_items)하므로, 데이터가
+그대로면 모든 파일이 바이트 단위로 같아 다시 쓰지 않고 git 변경도 생기지 않습니다.
+
+열 단위 형식:
+  {"fields": ["id", "항목명", ...], "count": N, "columns": [[id...], [항목명...], ...]}
+  i번째 항목 = {fields[k]: columns[k][i]}
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from json_stream import content_hash, encode_json, write_bytes
+from notion_schema import BUDGET_FIELDS
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 - 없으면 .gz만 생성
+    brotli = None
+
+DATA_DIR = os.getenv("DASHBOARD_DATA_DIR", "data")
+MANIFEST_NAME = "manifest.json"
+META_NAME = "meta.json"
+SHARD_DIR = "shards"
+
+# 항목 필드 순서 (notion_schema.BUDGET_FIELDS 출력 키)
+ITEM_FIELDS = ["id"] + [key for key, _, _ in BUDGET_FIELDS]
+# 내보내는 항목 순서 (조회 / 파티션 / 스냅샷 순서와 관계없이 같은 데이터면 같은 파일)
+ITEM_ORDER = ("비목", "세목", "항목명", "id")
+SHARD_FIELD = "비목"
+EMPTY_SHARD = "none"
+
+
+def minify(data: Any) -> bytes:
+    return encode_json(data, indent=None)
+
+
+def sort_items(items: List[dict]) -> List[dict]:
+    return sorted(items, key=lambda item: tuple(str(item.get(key) or "") for key in ITEM_ORDER))
+
+
+def columnar(items: List[dict], fields: List[str] = ITEM_FIELDS) -> dict:
+    """항목 목록 → 열 단위 dict"""
+    return {
+        "fields": fields,
+        "count": len(items),
+        "columns": [[item.get(field) for item in items] for field in fields],
+    }
+
+
+def shard_key(bimok: str) -> str:
+    """비목 → 샤드 파일 이름 ("인건비(110)" → "110", 빈 값 → "none", 그 외 → 해시)"""
+    if not bimok:
+        return EMPTY_SHARD
+    match = re.search(r"\((\d+)\)\s*$", bimok)
+    if match:
+        return match.group(1)
+    return "x" + hashlib.sha1(bimok.encode("utf-8")).hexdigest()[:8]
+
+
+def write_variants(data_dir: str, name: str, raw: bytes, **extra) -> dict:
+    """data_dir/name에 raw와 미리 압축한 .gz / .br을 저장하고 manifest 항목 반환
+    
+    raw가 기존 파일과 같으면 압축본도 다시 만들지 않습니다.
+    """
+    path = os.path.join(data_dir, name)
+    changed = write_bytes(path, raw)
+    entry = {"path": name, "hash": content_hash(raw), "bytes": len(raw), **extra}
+    
+    if changed or not os.path.exists(path + ".gz"):
+        write_bytes(path + ".gz", gzip.compress(raw, compresslevel=9, mtime=0))
+    entry["gz"] = os.path.getsize(path + ".gz")
+    
+    if brotli is not None:
+        if changed or not os.path.exists(path + ".br"):
+            write_bytes(path + ".br", brotli.compress(raw, quality=11))
+        entry["br"] = os.path.getsize(path + ".br")
+    return entry
+
+
+def write_bundle(name: str, items: List[dict], summary: dict, data_dir: str = DATA_DIR) -> dict:
+    """데이터셋 이름(name)으로 요약 / 전체 항목 / 비목별 샤드와 압축본 저장 (manifest 항목 반환)"""
+    items = sort_items(items)
+    dataset = {
+        "summary": write_variants(data_dir, f"{name}.summary.json", minify(summary)),
+        "items": write_variants(data_dir, f"{name}.min.json", minify(columnar(items)), count=len(items)),
+        "shards": {},
+    }
+    
+    groups: Dict[str, List[dict]] = {}
+    for item in items:
+        groups.setdefault(item.get(SHARD_FIELD) or "", []).append(item)
+    for bimok in sorted(groups):
+        shard = f"{SHARD_DIR}/{name}/{shard_key(bimok)}.json"
+        dataset["shards"][bimok] = write_variants(data_dir, shard, minify(columnar(groups[bimok])),
+                                                  count=len(groups[bimok]))
+    return dataset
+
+
+def _load(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {"datasets": {}}
+    data.setdefault("datasets", {})
+    return data
+
+
+def _write_sorted(path: str, data: dict):
+    """키를 정렬해 저장 (같은 내용이면 같은 파일, 바뀌지 않았으면 쓰지 않음)"""
+    write_bytes(path, json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8"))
+
+
+def load_manifest(data_dir: str = DATA_DIR) -> dict:
+    return _load(os.path.join(data_dir, MANIFEST_NAME))
+
+
+def load_meta(data_dir: str = DATA_DIR) -> dict:
+    return _load(os.path.join(data_dir, META_NAME))
+
+
+def _entries(dataset: dict) -> List[dict]:
+    """번들 파일 manifest 항목 (전체 JSON 파일 제외)"""
+    entries = [dataset[key] for key in ("summary", "items") if key in dataset]
+    return entries + list(dataset.get("shards", {}).values())
+
+
+def _remove_stale(data_dir: str, old: Optional[dict], new: dict):
+    """지난 manifest에만 있던 번들 파일(사라진 비목의 샤드 등) 삭제"""
+    if not old:
+        return
+    keep = {entry["path"] for entry in _entries(new)}
+    for entry in _entries(old):
+        if entry["path"] not in keep:
+            for suffix in ("", ".gz", ".br"):
+                path = os.path.join(data_dir, entry["path"] + suffix)
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def publish(name: str, files: Dict[str, str], bundle: Optional[dict] = None,
+            data_dir: str = DATA_DIR) -> bool:
+    """데이터셋을 manifest에 기록하고, 내용이 바뀌었으면 meta.json 생성 시각 갱신
+    
+    files: data_dir 기준 전체 JSON 파일 경로 → 내용 해시 (write_json 반환값)
+    bundle: write_bundle 결과 (스트리밍처럼 번들이 없으면 None)
+    manifest / meta는 데이터셋별로 합쳐 쓰므로 여러 내보내기(budget, budget_data)가 data/를 공유해도 됩니다.
+    데이터셋 내용이 바뀌었는지 반환합니다.
+    """
+    dataset = dict(bundle or {})
+    dataset["files"] = {path: {"hash": digest} for path, digest in sorted(files.items())}
+    dataset["hash"] = content_hash(minify(
+        {"files": dataset["files"], "bundle": [entry["hash"] for entry in _entries(dataset)]}
+    ))
+    
+    manifest = load_manifest(data_dir)
+    _remove_stale(data_dir, manifest["datasets"].get(name), dataset)
+    manifest["datasets"][name] = dataset
+    _write_sorted(os.path.join(data_dir, MANIFEST_NAME), manifest)
+    
+    meta = load_meta(data_dir)
+    changed = meta["datasets"].get(name, {}).get("hash") != dataset["hash"]
+    if changed:
+        now = datetime.now()
+        meta["datasets"][name] = {
+            "hash": dataset["hash"],
+            "generated_at": now.isoformat(),
+            "update_date": now.strftime("%Y-%m-%d"),
+            "update_time": now.strftime("%H:%M:%S"),
+        }
+        _write_sorted(os.path.join(data_dir, META_NAME), meta)
+    return changed
+
+
+def print_bundle(dataset: dict):
+    """번들 크기 요약 출력"""
+    files = _entries(dataset)
+    raw = sum(entry["bytes"] for entry in files)
+    gz = sum(entry["gz"] for entry in files)
+    br = sum(entry.get("br", 0) for entry in files)
+    line = f"   → 경량 번들: 파일 {len(files)}개 ({len(dataset['shards'])}개 비목 샤드), {raw:,}B → gzip {gz:,}B"
+    if br:
+        line += f" / brotli {br:,}B"
+    print(line)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+대시보드 데이터 버전 / 증분 패치 (data/version.json + data/deltas/)
+
+상시 켜 둔 대시보드가 새로고침마다 전체 JSON을 받지 않도록, 데이터가 바뀐 실행에서
+  - data/version.json: 데이터셋별 현재 파일 해시 / 생성 시각 / 패치가 있는 이전 해시 목록
+  - data/deltas/{이름}/{이전 해시}.json: 이전 버전 → 현재 버전 JSON Patch (RFC 6902)
+를 씁니다. 클라이언트는 version.json만 주기적으로 받아 해시가 같으면 아무것도 하지 않고,
+자기 해시의 패치가 있으면 패치만, 없으면(패치 체인이 너무 길거나 오래된 버전) 전체 파일을 받습니다.
+
+이전 버전 → 현재 패치는 (이전 → 직전 버전 패치) + (직전 → 현재 패치)를 이어 붙여 만듭니다.
+직전 버전은 덮어쓰기 전 파일이므로 이전 버전 본문을 따로 보관하지 않습니다.
+최근 DATA_VERSION_DELTAS개(기본 10) 버전까지, 패치가 전체 파일의 DATA_DELTA_MAX_RATIO배
+(기본 0.5)를 넘으면 그 버전부터는 패치를 만들지 않습니다.
+
+배열은 요소(항목은 id) 단위로 맞춰 추가 / 삭제 / 변경 연산을 만들고, 같은 요소는 안쪽까지 비교합니다.
+"""
+
+import copy
+import json
+import os
+from datetime import datetime
+from difflib import SequenceMatcher
+from typing import Any, List, Optional, Tuple
+
+from json_stream import content_hash, encode_json, write_bytes
+
+DATA_DIR = os.getenv("DASHBOARD_DATA_DIR", "data")
+VERSION_NAME = "version.json"
+DELTA_DIR = "deltas"
+DATA_VERSION_DELTAS = int(os.getenv("DATA_VERSION_DELTAS", "10"))
+DATA_DELTA_MAX_RATIO = float(os.getenv("DATA_DELTA_MAX_RATIO", "0.5"))
+
+
+# --- JSON Patch ---
+
+def _pointer(path: str, key: Any) -> str:
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def _element_key(value: Any) -> Any:
+    """배열 요소 대응 기준 (id가 있는 dict는 id, 그 외는 값 전체)"""
+    if isinstance(value, dict) and "id" in value:
+        return ("id", value["id"])
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def _same(old: Any, new: Any) -> bool:
+    """타입까지 같은 JSON 값인지 (파이썬 == 는 1 == 1.0 == True 라 변경을 놓침)"""
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(_same(old[key], value) for key, value in new.items())
+    if isinstance(old, list):
+        return len(old) == len(new) and all(map(_same, old, new))
+    return old == new
+
+
+def _diff_list(old: list, new: list, path: str, ops: List[dict]):
+    # 앞에서부터 적용하므로 각 구간 처리 후 [0, j2)는 new와 같고 나머지는 old[i2:]
+    matcher = SequenceMatcher(None, [_element_key(v) for v in old], [_element_key(v) for v in new], autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        paired = min(i2 - i1, j2 - j1) if tag in ("equal", "replace") else 0
+        for k in range(paired):
+            diff(old[i1 + k], new[j1 + k], _pointer(path, j1 + k), ops)
+        for _ in range(i2 - i1 - paired):
+            ops.append({"op": "remove", "path": _pointer(path, j1 + paired)})
+        for k in range(paired, j2 - j1):
+            ops.append({"op": "add", "path": _pointer(path, j1 + k), "value": new[j1 + k]})
+
+
+def diff(old: Any, new: Any, path: str = "", ops: Optional[List[dict]] = None) -> List[dict]:
+    """old → new JSON Patch 연산 목록"""
+    if ops is None:
+        ops = []
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": _pointer(path, key)})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": _pointer(path, key), "value": value})
+            elif not _same(old[key], value):
+                diff(old[key], value, _pointer(path, key), ops)
+    elif isinstance(old, list) and isinstance(new, list):
+        if not _same(old, new):
+            _diff_list(old, new, path, ops)
+    elif not _same(old, new):
+        ops.append({"op": "replace", "path": path, "value": new})
+    return ops
+
+
+def apply_patch(doc: Any, ops: List[dict]) -> Any:
+    """JSON Patch 적용 (add / remove / replace, 대시보드 클라이언트 참고 구현)"""
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        if op["path"] == "":
+            doc = copy.deepcopy(op["value"])
+            continue
+        *parents, last = [part.replace("~1", "/").replace("~0", "~") for part in op["path"].split("/")[1:]]
+        target = doc
+        for part in parents:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        if isinstance(target, list):
+            index = len(target) if last == "-" else int(last)
+            if op["op"] == "add":
+                target.insert(index, copy.deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del target[index]
+            else:
+                target[index] = copy.deepcopy(op["value"])
+        elif op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = copy.deepcopy(op["value"])
+    return doc
+
+
+# --- 버전 / 패치 파일 ---
+
+def read_base(path: str) -> Tuple[Optional[Any], Optional[str]]:
+    """덮어쓰기 전 파일 (본문, 내용 해시) - 없거나 깨졌으면 (None, None)"""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return json.loads(raw), content_hash(raw)
+    except (OSError, ValueError):
+        return None, None
+
+
+def load_versions(data_dir: str = DATA_DIR) -> dict:
+    try:
+        with open(os.path.join(data_dir, VERSION_NAME), encoding="utf-8") as f:
+            versions = json.load(f)
+    except (OSError, ValueError):
+        return {"datasets": {}}
+    versions.setdefault("datasets", {})
+    return versions
+
+
+def _delta_path(data_dir: str, name: str, version: str) -> str:
+    return os.path.join(data_dir, DELTA_DIR, name, f"{version}.json")
+
+
+def _load_delta(data_dir: str, name: str, version: str) -> Optional[List[dict]]:
+    try:
+        with open(_delta_path(data_dir, name, version), encoding="utf-8") as f:
+            return json.load(f)["patch"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def update_versions(name: str, file: str, base: Tuple[Optional[Any], Optional[str]],
+                    doc: Any, digest: str, data_dir: str = DATA_DIR) -> Optional[dict]:
+    """데이터 파일을 새로 쓴 뒤 version.json과 이전 버전들의 패치 갱신
+    
+    file: data_dir 기준 전체 파일 경로, base: 쓰기 전 read_base 결과, doc / digest: 새 본문과 해시
+    내용이 그대로면 아무것도 하지 않고 None, 아니면 데이터셋 버전 항목을 반환합니다.
+    """
+    previous, previous_hash = base
+    versions = load_versions(data_dir)
+    current = versions["datasets"].get(name, {})
+    if current.get("hash") == digest and previous_hash == digest:
+        return None
+    
+    full_size = os.path.getsize(os.path.join(data_dir, file))
+    limit = full_size * DATA_DELTA_MAX_RATIO
+    deltas = []
+    if previous is not None and previous_hash != digest:
+        step = diff(previous, doc)
+        # 직전 버전부터, 그 전 버전들은 (그 버전 → 직전) 패치 뒤에 이어 붙임
+        chains = [(previous_hash, [])]
+        if current.get("hash") == previous_hash:
+            chains += [(version, _load_delta(data_dir, name, version)) for version in current.get("deltas", [])]
+        for version, chain in chains:
+            if chain is None or version == digest or len(deltas) >= DATA_VERSION_DELTAS:
+                continue
+            raw = encode_json({"from": version, "to": digest, "patch": chain + step}, indent=None)
+            if len(raw) > limit:
+                break
+            write_bytes(_delta_path(data_dir, name, version), raw)
+            deltas.append(version)
+    
+    # 목록에서 빠진 버전의 패치 파일 삭제
+    for version in current.get("deltas", []):
+        if version not in deltas and os.path.exists(_delta_path(data_dir, name, version)):
+            os.remove(_delta_path(data_dir, name, version))
+    
+    entry = {
+        "hash": digest,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "file": file,
+        "deltas": deltas,
+    }
+    versions["datasets"][name] = entry
+    write_bytes(os.path.join(data_dir, VERSION_NAME),
+                json.dumps(versions, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8"))
+    return entry
+
+
+def print_version(entry: Optional[dict]):
+    if entry:
+        print(f"   → 데이터 버전 {entry['hash']} (이전 {len(entry['deltas'])}개 버전 패치)")
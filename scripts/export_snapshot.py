@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+대시보드 내보내기 증분 스냅샷
+
+매번 Notion DB 전체를 내려받지 않도록 지난 내보내기의 변환된 항목(page id 기준)과
+기준 시각(high-water mark, 가장 최근 last_edited_time)을 보관합니다.
+
+갱신 방식:
+  - 스냅샷 없음 / DB 변경 / 변환 코드 변경 / 오래된 스냅샷 → 전체 조회
+  - 그 외 → last_edited_time 필터로 변경된 페이지만 조회해 id 기준으로 병합하고,
+            제목 속성만 받는 id 조회(sweep)로 삭제된 페이지를 제거
+
+요약 집계(budget_cube.BudgetCube)도 스냅샷에 함께 저장합니다. 증분 조회에서는
+추가·수정·삭제된 항목의 이전 값 / 새 값 차이만 반영하고(변경 건수에 비례),
+EXPORT_AGGREGATE_VERIFY_EVERY번마다 전체 항목으로 다시 계산해 어긋남이 없는지 확인합니다.
+
+환경변수:
+  - EXPORT_SNAPSHOT_DIR: (선택) 스냅샷 디렉토리 (기본 .cache, 빈 값이면 항상 전체 조회)
+  - EXPORT_SNAPSHOT_MAX_AGE_DAYS: (선택) 전체 조회 주기 (기본 7일)
+  - EXPORT_AGGREGATE_VERIFY_EVERY: (선택) 요약 집계 전체 재계산 검증 주기 (기본 24회 실행)
+"""
+
+import os
+import json
+import inspect
+import hashlib
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from budget_cube import BudgetCube
+
+EXPORT_SNAPSHOT_DIR = os.getenv("EXPORT_SNAPSHOT_DIR", ".cache")
+EXPORT_SNAPSHOT_MAX_AGE_DAYS = int(os.getenv("EXPORT_SNAPSHOT_MAX_AGE_DAYS", "7"))
+EXPORT_AGGREGATE_VERIFY_EVERY = int(os.getenv("EXPORT_AGGREGATE_VERIFY_EVERY", "24"))
+
+# 삭제 감지용 id 조회에서 받을 속성 (제목 속성의 id는 항상 "title")
+SWEEP_PROPERTIES = ["title"]
+
+
+def transform_fingerprint(transform: Callable) -> str:
+    """변환 함수가 정의된 모듈의 소스 해시 (코드가 바뀌면 캐시된 항목을 버리기 위해)"""
+    try:
+        source = inspect.getsource(inspect.getmodule(transform))
+    except (OSError, TypeError):
+        source = transform.__qualname__
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+
+
+class ExportSnapshot:
+    """JSON 파일 기반 내보내기 스냅샷 (page id → {last_edited_time, item})"""
+    
+    def __init__(self, name: str, directory: str = EXPORT_SNAPSHOT_DIR,
+                 max_age_days: int = EXPORT_SNAPSHOT_MAX_AGE_DAYS):
+        self.path = os.path.join(directory, f"{name}_snapshot.json")
+        self.max_age = timedelta(days=max_age_days)
+    
+    def load(self, database_id: str, fingerprint: str) -> Tuple[Optional[dict], str]:
+        """(스냅샷 또는 None, 전체 조회 사유)"""
+        if not os.path.exists(self.path):
+            return None, "스냅샷 없음"
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError) as e:
+            return None, f"스냅샷 읽기 실패 ({e})"
+        
+        if snapshot.get("database_id") != database_id:
+            return None, "DB 변경"
+        if snapshot.get("fingerprint") != fingerprint:
+            return None, "변환 코드 변경"
+        if not snapshot.get("high_water_mark"):
+            return None, "기준 시각 없음"
+        if datetime.now() - datetime.fromisoformat(snapshot["full_scan_at"]) > self.max_age:
+            return None, "전체 조회 주기 경과"
+        return snapshot, ""
+    
+    def save(self, database_id: str, fingerprint: str, pages: Dict[str, dict], full_scan_at: str,
+             aggregates: Optional[dict] = None):
+        """임시 파일에 쓴 뒤 교체 (중간에 죽어도 이전 스냅샷 유지)"""
+        times = [page["last_edited_time"] for page in pages.values() if page.get("last_edited_time")]
+        snapshot = {
+            "database_id": database_id,
+            "fingerprint": fingerprint,
+            "full_scan_at": full_scan_at,
+            "high_water_mark": max(times) if times else None,
+            "aggregates": aggregates,
+            "pages": pages,
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp = f"{self.path}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(temp, self.path)
+
+
+def _maintain_aggregates(snapshot: dict, items: List[dict], removed: List[dict],
+                        added: List[dict], verify_every: int) -> Tuple[BudgetCube, int]:
+    """저장된 집계에 변경분 반영 → (집계, 마지막 검증 이후 실행 횟수)
+    
+    저장된 집계가 없거나 형식이 바뀌었으면, 또는 검증 주기가 되면 전체 항목으로 다시 계산합니다.
+    """
+    stored = snapshot.get("aggregates") or {}
+    cube = BudgetCube.from_dict(stored["cube"]) if stored.get("cube") else None
+    if cube is None:
+        print("   → 요약 집계 새로 계산 (저장된 집계 없음)")
+        return BudgetCube.from_items(items), 0
+    
+    cube = cube.apply_changes(removed, added)
+    runs = stored.get("runs_since_verify", 0) + 1
+    if runs < verify_every:
+        return cube, runs
+    
+    full = BudgetCube.from_items(items)
+    drifted = full.drift(cube)
+    if drifted:
+        print(f"   ⚠️ 요약 집계 어긋남 {drifted}개 셀 → 전체 재계산 값으로 교체")
+    else:
+        print(f"   → 요약 집계 검증 완료 ({runs}회 증분 반영, 어긋남 없음)")
+    return full, 0
+
+
+def load_items(name: str, database_id: str, query: Callable[..., List[dict]],
+               transform: Callable[[dict], dict], directory: str = EXPORT_SNAPSHOT_DIR,
+               verify_every: int = EXPORT_AGGREGATE_VERIFY_EVERY) -> Tuple[List[dict], BudgetCube]:
+    """스냅샷 + 변경분으로 현재 DB 항목 목록과 요약 집계 구성
+    
+    query(query_filter=None, filter_properties=None): DB 조회 결과 페이지 목록
+        (조회 실패 시 예외를 내야 함 - 일부 결과로 삭제를 판단하지 않도록)
+    transform(page): 페이지 → 대시보드 항목
+    """
+    fingerprint = transform_fingerprint(transform)
+    snapshot, reason = (None, "스냅샷 비활성화")
+    store = ExportSnapshot(name, directory) if directory else None
+    if store:
+        snapshot, reason = store.load(database_id, fingerprint)
+    
+    if snapshot is None:
+        print(f"   → 전체 조회 ({reason})")
+        full_scan_at = datetime.now().isoformat()
+        pages = {
+            page["id"]: {"last_edited_time": page.get("last_edited_time"), "item": transform(page)}
+            for page in query()
+        }
+        items = [page["item"] for page in pages.values()]
+        cube, runs = BudgetCube.from_items(items), 0
+    else:
+        full_scan_at = snapshot["full_scan_at"]
+        pages = snapshot["pages"]
+        removed, added = [], []
+        changed = query(query_filter={
+            "timestamp": "last_edited_time",
+            "last_edited_time": {"on_or_after": snapshot["high_water_mark"]},
+        })
+        for page in changed:
+            if page["id"] in pages:
+                removed.append(pages[page["id"]]["item"])
+            pages[page["id"]] = {"last_edited_time": page.get("last_edited_time"), "item": transform(page)}
+            added.append(pages[page["id"]]["item"])
+        
+        live = {page["id"] for page in query(filter_properties=SWEEP_PROPERTIES)}
+        deleted = [page_id for page_id in pages if page_id not in live]
+        for page_id in deleted:
+            removed.append(pages.pop(page_id)["item"])
+        print(f"   → 증분 조회: 변경 {len(changed)}건, 삭제 {len(deleted)}건 (기준 {snapshot['high_water_mark']})")
+        items = [page["item"] for page in pages.values()]
+        cube, runs = _maintain_aggregates(snapshot, items, removed, added, verify_every)
+    
+    if store:
+        store.save(database_id, fingerprint, pages, full_scan_at,
+                   aggregates={"cube": cube.to_dict(), "runs_since_verify": runs})
+    return items, cube
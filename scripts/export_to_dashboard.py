@@ -8,18 +8,41 @@ Notion 예산 DB → GitHub Pages 대시보드 데이터 내보내기
 출력:
   - data/budget_data.json: 전체 예산 데이터
   - data/summary.json: 요약 통계
+  - data/budget_data.summary.json / budget_data.min.json / shards/budget_data/*.json (+ .gz/.br),
+    data/manifest.json: 모바일용 경량 번들 / 파일 내용 해시 (dashboard_bundle.py 참고)
+  - data/meta.json: 생성 시각 (데이터가 바뀐 실행에서만 갱신)
+  - data/history/budget_history.sqlite: 항목별 집행 이력 / 일별·월별 롤업 (budget_history.py 참고)
+  - data/forecast.json: 사업종료일 예상 집행 / 불용·초과 위험 항목 (budget_forecast.py 참고)
+  - data/version.json, data/deltas/budget_data/: 버전 해시와 이전 버전 → 현재 JSON Patch (data_versions.py 참고)
+  - metrics/export.json, metrics/export.prom: 실행 지표 (run_metrics.py)
+
+데이터 파일에는 실행 시각을 넣지 않고 항목 순서를 고정하므로 데이터가 그대로면 파일도 그대로입니다.
+지난 실행의 스냅샷(.cache/export_snapshot.json)이 있으면 변경된 페이지만 조회합니다.
+(export_snapshot.py 참고)
+NOTION_SCAN_PARTITIONS=1이면 비목별 파티션으로 나눠 동시에 조회합니다. (notion_pager.py 참고)
 """
 
 import os
-import json
-import requests
-from datetime import datetime
-from typing import Dict, List, Any
+import time
+from typing import Dict, List, Optional
+
+from budget_cube import BudgetCube
+from budget_forecast import PROJECT_END_DATE, days_remaining, forecast_after_export
+from budget_history import record_history
+from dashboard_bundle import print_bundle, publish, sort_items, write_bundle
+from data_versions import print_version, read_base, update_versions
+from export_snapshot import load_items
+from http_client import get_client
+from json_stream import write_json
+from notion_pager import scan_database
+from notion_schema import extract_budget_item
+from run_metrics import write_run_metrics
+from sync_budget_to_notion import bimok_partitions
 
 NOTION_API_KEY = os.getenv("NOTION_API_KEY")
 NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID", "54bfedc3769e43e8bdbcd59f22008417")
 
-NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_API_URL = os.getenv("NOTION_API_URL", "https://api.notion.com/v1")
 NOTION_VERSION = "2022-06-28"
 
 
@@ -31,152 +54,115 @@ def notion_headers():
     }
 
 
-def query_notion_database() -> List[dict]:
-    """Notion DB 전체 조회"""
+def query_notion_database(query_filter: Optional[dict] = None,
+                          filter_properties: Optional[List[str]] = None) -> List[dict]:
+    """Notion DB 조회 (기본 전체, query_filter / filter_properties로 범위·속성 제한)"""
     url = f"{NOTION_API_URL}/databases/{NOTION_DATABASE_ID}/query"
-    results = []
-    has_more = True
-    start_cursor = None
-    
-    while has_more:
-        payload = {"page_size": 100}
-        if start_cursor:
-            payload["start_cursor"] = start_cursor
-        
-        resp = requests.post(url, headers=notion_headers(), json=payload)
-        data = resp.json()
-        results.extend(data.get("results", []))
-        has_more = data.get("has_more", False)
-        start_cursor = data.get("next_cursor")
-    
-    return results
+    return list(scan_database(url, notion_headers(), query_filter, filter_properties,
+                              partitions=bimok_partitions()))
 
 
-def extract_property(page: dict, prop_name: str, prop_type: str) -> Any:
-    """Notion 속성 값 추출"""
-    prop = page.get("properties", {}).get(prop_name, {})
-    
-    if prop_type == "title":
-        titles = prop.get("title", [])
-        return titles[0]["plain_text"] if titles else ""
-    elif prop_type == "rich_text":
-        texts = prop.get("rich_text", [])
-        return texts[0]["plain_text"] if texts else ""
-    elif prop_type == "number":
-        return prop.get("number", 0) or 0
-    elif prop_type == "select":
-        sel = prop.get("select")
-        return sel["name"] if sel else ""
-    elif prop_type == "date":
-        date_obj = prop.get("date")
-        return date_obj["start"] if date_obj else ""
-    
-    return None
+# Notion 페이지 → JSON 객체 변환 (필드 목록은 notion_schema.BUDGET_FIELDS)
+transform_page = extract_budget_item
 
 
-def transform_page(page: dict) -> dict:
-    """Notion 페이지 → JSON 객체 변환"""
-    return {
-        "id": page["id"],
-        "항목명": extract_property(page, "항목명", "title"),
-        "비목": extract_property(page, "비목", "select"),
-        "세목": extract_property(page, "세목", "rich_text"),
-        "총예산": extract_property(page, "총예산", "number"),
-        "사용금액_공급가": extract_property(page, "사용금액(공급가)", "number"),
-        "사용금액_VAT": extract_property(page, "사용금액(VAT)", "number"),
-        "사용금액_합계": extract_property(page, "사용금액(합계)", "number"),
-        "잔액": extract_property(page, "잔액", "number"),
-        "집행률": extract_property(page, "집행률", "number"),
-        "상태": extract_property(page, "상태", "select"),
-        "2024년예산": extract_property(page, "2024년예산", "number"),
-        "2024년집행": extract_property(page, "2024년집행", "number"),
-        "2025년예산": extract_property(page, "2025년예산", "number"),
-        "2025년집행": extract_property(page, "2025년집행", "number"),
-        "최종동기화": extract_property(page, "최종동기화", "date"),
-    }
-
-
-def calculate_summary(items: List[dict]) -> dict:
-    """요약 통계 계산"""
-    total_budget = sum(item["총예산"] for item in items)
-    total_used = sum(item["사용금액_합계"] for item in items)
-    total_remaining = sum(item["잔액"] for item in items)
+def calculate_summary(items: List[dict], cube: Optional[BudgetCube] = None) -> dict:
+    """요약 통계 계산 (budget_cube 롤업 큐브 한 번으로 합계 / 상태별 / 비목별 / 연도별)
+    
+    cube: 스냅샷이 변경분으로 갱신한 집계 (없으면 items로 새로 계산)
+    """
+    cube = cube or BudgetCube.from_items(items)
+    total = cube.total()
+    statuses = cube.by("상태")
     
     # 상태별 카운트
-    status_count = {"정상": 0, "주의": 0, "초과": 0, "미집행": 0}
-    for item in items:
-        status = item.get("상태", "")
-        if status in status_count:
-            status_count[status] += 1
+    status_count = {status: statuses.get(status, {}).get("항목수", 0) for status in ("정상", "주의", "초과", "미집행")}
     
     # 비목별 집계
-    bimok_summary = {}
-    for item in items:
-        bimok = item.get("비목", "기타")
-        if bimok not in bimok_summary:
-            bimok_summary[bimok] = {"예산": 0, "집행": 0, "잔액": 0}
-        bimok_summary[bimok]["예산"] += item["총예산"]
-        bimok_summary[bimok]["집행"] += item["사용금액_합계"]
-        bimok_summary[bimok]["잔액"] += item["잔액"]
-    
-    # D-day 계산
-    end_date = datetime(2025, 12, 31)
-    today = datetime.now()
-    days_remaining = (end_date - today).days
+    bimok_summary = {
+        bimok: {"예산": values["예산"], "집행": values["집행"], "잔액": values["잔액"]}
+        for bimok, values in cube.by("비목").items()
+    }
     
     return {
-        "update_time": datetime.now().isoformat(),
-        "update_date": datetime.now().strftime("%Y-%m-%d"),
-        "총예산": total_budget,
-        "총집행": total_used,
-        "총잔액": total_remaining,
-        "집행률": round(total_used / total_budget * 100, 1) if total_budget > 0 else 0,
+        "총예산": total["예산"],
+        "총집행": total["집행"],
+        "총잔액": total["잔액"],
+        "집행률": round(total["집행"] / total["예산"] * 100, 1) if total["예산"] > 0 else 0,
         "항목수": len(items),
         "상태별": status_count,
         "비목별": bimok_summary,
-        "남은일수": max(0, days_remaining),
-        "사업종료일": "2025-12-31",
+        "남은일수": days_remaining(),
+        "사업종료일": PROJECT_END_DATE.isoformat(),
+        "롤업": cube.rollup(),
     }
 
 
-def main():
-    if not NOTION_API_KEY:
-        print("❌ NOTION_API_KEY 환경변수가 설정되지 않았습니다.")
-        exit(1)
-    
-    print("📊 Notion 데이터 내보내기 시작...")
-    
-    # 1. Notion DB 조회
-    print("   → Notion DB 조회 중...")
-    pages = query_notion_database()
-    print(f"   → {len(pages)}개 항목 조회 완료")
-    
-    # 2. 데이터 변환
-    items = [transform_page(p) for p in pages]
+def export_items(items: List[dict], phases: Dict[str, float], started: float,
+                 cube: Optional[BudgetCube] = None):
+    """대시보드 항목 → JSON 파일 저장 및 요약 출력
     
+    items: transform_page 결과 (Notion 조회 / 증분 스냅샷, 또는 bms full에서 동기화가 방금 쓴 페이지)
+    cube: 증분 스냅샷이 유지하는 요약 집계 (있으면 다시 계산하지 않음)
+    """
     # 3. 요약 계산
-    summary = calculate_summary(items)
-    
-    # 4. 디렉토리 생성 및 파일 저장
-    os.makedirs("data", exist_ok=True)
-    
-    with open("data/budget_data.json", "w", encoding="utf-8") as f:
-        json.dump({"items": items, "generated_at": datetime.now().isoformat()}, f, ensure_ascii=False, indent=2)
-    print("   → data/budget_data.json 저장 완료")
-    
-    with open("data/summary.json", "w", encoding="utf-8") as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
-    print("   → data/summary.json 저장 완료")
-    
-    # 5. notion-config.js 업데이트용 데이터 출력
+    mark = time.perf_counter()
+    summary = calculate_summary(items, cube)
+    phases["transform"] = time.perf_counter() - mark
+    
+    # 4. 파일 저장 (임시 파일 → 교체, 내용이 같으면 건너뜀 / 생성 시각은 data/meta.json)
+    mark = time.perf_counter()
+    document = {"items": sort_items(items)}
+    base = read_base("data/budget_data.json")
+    hashes = {
+        "budget_data.json": write_json("data/budget_data.json", document),
+        "summary.json": write_json("data/summary.json", summary),
+    }
+    bundle = write_bundle("budget_data", document["items"], summary)
+    print_bundle(bundle)
+    if publish("budget_data", hashes, bundle):
+        print("   → data/budget_data.json, data/summary.json 저장 완료")
+    else:
+        print("   → 데이터 변경 없음 (파일 그대로)")
+    print_version(update_versions("budget_data", "budget_data.json", base, document, hashes["budget_data.json"]))
+    record_history(items, cube, "export")
+    phases["write"] = time.perf_counter() - mark
+    
+    # 5. 집행 전망 (이력 DB → data/forecast.json)
+    mark = time.perf_counter()
+    forecast_after_export(items)
+    phases["forecast"] = time.perf_counter() - mark
+    phases["total"] = time.perf_counter() - started
+    
+    # 6. notion-config.js 업데이트용 데이터 출력
     print(f"\n📈 요약 통계:")
     print(f"   총 예산: {summary['총예산']:,.0f}원")
     print(f"   총 집행: {summary['총집행']:,.0f}원")
     print(f"   집행률: {summary['집행률']}%")
     print(f"   남은일수: D-{summary['남은일수']}")
     
+    get_client().print_stats()
+    write_run_metrics("export", phases, {"items": len(items)}, len(items))
     print("\n✅ 내보내기 완료!")
 
 
+def main():
+    if not NOTION_API_KEY:
+        print("❌ NOTION_API_KEY 환경변수가 설정되지 않았습니다.")
+        exit(1)
+    
+    print("📊 Notion 데이터 내보내기 시작...")
+    phases = {}
+    started = time.perf_counter()
+    
+    # 1~2. Notion DB 조회 (스냅샷이 있으면 변경분만) 및 변환
+    print("   → Notion DB 조회 중...")
+    items, cube = load_items("export", NOTION_DATABASE_ID, query_notion_database, transform_page)
+    print(f"   → {len(items)}개 항목 조회 완료")
+    phases["query"] = time.perf_counter() - started
+    
+    export_items(items, phases, started, cube)
+
+
 if __name__ == "__main__":
     main()
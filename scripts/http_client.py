@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+BMS 공용 HTTP 전송 계층
+
+Notion / Slack / GitHub 호출이 모두 이 모듈의 세션 하나를 공유합니다.
+  - keep-alive 커넥션 풀 (호스트별 TLS 핸드셰이크 1회)
+  - 요청별 타임아웃 (소켓 hang으로 Actions 작업이 멈추지 않도록)
+  - 멱등 요청의 지수 백오프 + 지터 재시도 (429는 Retry-After 준수)
+  - 엔드포인트별 호출 수 / 재시도 / 지연시간(평균, p50/p95) 집계
+
+사용법:
+  from http_client import get_client
+  resp = get_client().request("POST", url, headers=..., json=..., idempotent=True)
+
+환경변수:
+  - HTTP_TIMEOUT: (선택) 읽기 타임아웃 초 (기본 30)
+  - HTTP_MAX_RETRIES: (선택) 최대 재시도 횟수 (기본 5)
+"""
+
+import os
+import re
+import time
+import random
+import threading
+import requests
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "5"))
+HTTP_POOL_SIZE = 16
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# 지연시간 히스토그램 구간 상한 (ms, Prometheus 버킷과 같은 누적 방식)
+LATENCY_BUCKETS_MS = [25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# 엔드포인트 집계 시 경로의 ID 부분을 {id}로 묶기 위한 패턴
+_ID_SEGMENT = re.compile(r"/[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}(?=/|$)")
+
+
+class RateLimiter:
+    """토큰 버킷 요청 속도 제한기 (스레드 간 공유)"""
+    
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self):
+        # pause 중에는 updated가 재개 시각(미래)이므로 그때까지 토큰이 차지 않음
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = max(self.updated, now)
+    
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            with self.lock:
+                self._refill()
+                paused = self.updated - time.monotonic()
+                if paused <= 0 and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(0.0, paused) + max(0.0, 1 - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """429 응답 시 모든 작업자가 seconds 동안 대기하도록 버킷 비우기
+        
+        여러 작업자가 동시에 429를 받아도 대기 시간을 더하지 않고 가장 늦은 재개 시각을 따릅니다.
+        """
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, 0)
+            self.updated = max(self.updated, time.monotonic() + seconds)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """q 분위수 (nearest-rank, values가 비어 있으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered))) - 1))]
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """집계용 엔드포인트 이름 (예: POST api.notion.com/v1/databases/{id}/query)"""
+    parts = urlsplit(url)
+    return f"{method.upper()} {parts.netloc}{_ID_SEGMENT.sub('/{id}', parts.path)}"
+
+
+class HttpClient:
+    """커넥션 풀 + 타임아웃 + 재시도 + 지연시간 집계 HTTP 클라이언트"""
+    
+    def __init__(self, timeout: float = HTTP_TIMEOUT, max_retries: int = HTTP_MAX_RETRIES):
+        self.timeout = (HTTP_CONNECT_TIMEOUT, timeout)
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._stats: Dict[str, dict] = {}
+        self._latencies: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+    
+    def _record(self, key: str, elapsed: float, status: Optional[int], retried: bool):
+        with self._lock:
+            stat = self._stats.setdefault(key, {
+                "calls": 0, "errors": 0, "retries": 0, "throttled": 0, "total_ms": 0.0, "max_ms": 0.0,
+            })
+            stat["calls"] += 1
+            stat["retries"] += int(retried)
+            stat["throttled"] += int(status == 429)
+            if status is None or status >= 400:
+                stat["errors"] += 1
+            ms = elapsed * 1000
+            self._latencies.setdefault(key, []).append(ms)
+            stat["total_ms"] += ms
+            stat["max_ms"] = max(stat["max_ms"], ms)
+    
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """지수 백오프 + full jitter"""
+        return random.uniform(0, min(30.0, 0.5 * 2 ** attempt))
+    
+    @classmethod
+    def _retry_after(cls, value: Optional[str], attempt: int) -> float:
+        """Retry-After 헤더 → 대기 초 (초 단위 또는 HTTP-date, 해석할 수 없으면 백오프)"""
+        if value is None:
+            return 1.0
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return cls._backoff(attempt)
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    
+    def request(self, method: str, url: str, idempotent: bool = False,
+                limiter: Optional[RateLimiter] = None, **kwargs) -> requests.Response:
+        """HTTP 요청
+        
+        idempotent=True이면 연결 오류 / 타임아웃 / 429 / 5xx에서 재시도합니다.
+        멱등이 아닌 요청(페이지 생성, 알림 전송)은 서버가 처리하지 않았음이 확실한
+        경우(연결 타임아웃, 429)에만 재시도합니다.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        key = endpoint_key(method, url)
+        
+        for attempt in range(self.max_retries + 1):
+            last = attempt == self.max_retries
+            if limiter:
+                limiter.acquire()
+            
+            started = time.perf_counter()
+            try:
+                resp = self.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                self._record(key, time.perf_counter() - started, None, attempt > 0)
+                retryable = idempotent or isinstance(e, requests.ConnectTimeout)
+                if last or not retryable:
+                    raise
+                time.sleep(self._backoff(attempt))
+                continue
+            self._record(key, time.perf_counter() - started, resp.status_code, attempt > 0)
+            
+            if last or resp.status_code not in RETRY_STATUS:
+                return resp
+            if resp.status_code == 429:
+                wait = self._retry_after(resp.headers.get("Retry-After"), attempt)
+                if limiter:
+                    limiter.pause(wait)
+                else:
+                    time.sleep(wait)
+            elif idempotent:
+                time.sleep(self._backoff(attempt))
+            else:
+                return resp
+        return resp
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, idempotent=True, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+    
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, idempotent=True, **kwargs)
+    
+    def stats(self) -> Dict[str, dict]:
+        """엔드포인트별 집계 스냅샷"""
+        with self._lock:
+            return {
+                key: dict(
+                    stat,
+                    avg_ms=round(stat["total_ms"] / stat["calls"], 1),
+                    p50_ms=round(percentile(self._latencies[key], 50), 1),
+                    p95_ms=round(percentile(self._latencies[key], 95), 1),
+                )
+                for key, stat in self._stats.items()
+            }
+    
+    def latencies(self) -> Dict[str, List[float]]:
+        """엔드포인트별 요청 지연시간(ms) 목록 복사본"""
+        with self._lock:
+            return {key: list(values) for key, values in self._latencies.items()}
+    
+    def latency_histogram(self, buckets: List[float] = LATENCY_BUCKETS_MS) -> Dict[str, int]:
+        """전체 요청 지연시간 누적 히스토그램 {"25": n, ..., "+Inf": 전체}"""
+        samples = [ms for values in self.latencies().values() for ms in values]
+        histogram = {f"{bound:g}": sum(1 for ms in samples if ms <= bound) for bound in buckets}
+        histogram["+Inf"] = len(samples)
+        return histogram
+    
+    def reset_stats(self):
+        """집계 초기화 (벤치마크에서 구간별 측정용)"""
+        with self._lock:
+            self._stats.clear()
+            self._latencies.clear()
+    
+    def print_stats(self):
+        """엔드포인트별 호출 통계 출력"""
+        stats = self.stats()
+        if not stats:
+            return
+        print("🌐 API 호출 통계")
+        for key, stat in sorted(stats.items()):
+            print(f"   {key}: {stat['calls']}회 (재시도 {stat['retries']}, 오류 {stat['errors']}) "
+                  f"평균 {stat['avg_ms']:.0f}ms / p50 {stat['p50_ms']:.0f}ms / p95 {stat['p95_ms']:.0f}ms / "
+                  f"최대 {stat['max_ms']:.0f}ms")
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """프로세스 공용 HttpClient"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
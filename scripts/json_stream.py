@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+대시보드 JSON 파일 쓰기 도우미
+
+  - 임시 파일에 쓴 뒤 os.replace로 교체하므로 쓰는 도중 죽어도 대시보드가
+    잘린 JSON을 읽지 않습니다 (이전 파일 유지).
+  - write_json_stream은 항목 목록을 메모리에 모으지 않고 하나씩 인코딩해
+    json.dump(..., indent=2)와 같은 모양으로 씁니다.
+  - 새 내용이 기존 파일과 같으면 교체하지 않습니다 (수정 시각 / git 변경 없음).
+"""
+
+import filecmp
+import hashlib
+import os
+import json
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional
+
+
+@contextmanager
+def atomic_open(path: str, mode: str = "w") -> Iterator[IO]:
+    """path를 원자적으로 교체하는 쓰기용 파일 (예외 시 임시 파일 삭제, mode="wb"면 바이너리)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp = f"{path}.tmp"
+    try:
+        with open(temp, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path) and filecmp.cmp(temp, path, shallow=False):
+            os.remove(temp)
+        else:
+            os.replace(temp, path)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+
+
+# manifest 등에 적는 내용 해시 길이 (sha256 hex 앞부분)
+HASH_LENGTH = 16
+
+
+def content_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:HASH_LENGTH]
+
+
+def file_hash(path: str) -> str:
+    """파일 내용 해시 (content_hash와 같은 값, 큰 파일도 조각 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def encode_json(data: Any, indent: Optional[int] = 2) -> bytes:
+    """json.dump와 같은 UTF-8 바이트 (indent=None이면 공백 없는 JSON)"""
+    separators = None if indent is not None else (",", ":")
+    return json.dumps(data, ensure_ascii=False, indent=indent, separators=separators).encode("utf-8")
+
+
+def write_bytes(path: str, raw: bytes) -> bool:
+    """raw를 원자적으로 저장 (기존 파일과 같으면 건드리지 않고 False)"""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == raw:
+                return False
+    except OSError:
+        pass
+    with atomic_open(path, "wb") as f:
+        f.write(raw)
+    return True
+
+
+def write_json(path: str, data: Any, indent: int = 2) -> str:
+    """json.dump와 같은 결과를 원자적으로 저장 (내용이 같으면 건너뜀), 내용 해시 반환"""
+    raw = encode_json(data, indent)
+    write_bytes(path, raw)
+    return content_hash(raw)
+
+
+def _member(key: str, value: Any, indent: int) -> str:
+    encoded = json.dumps(value, ensure_ascii=False, indent=indent).replace("\n", "\n" + " " * indent)
+    return f"{' ' * indent}{json.dumps(key, ensure_ascii=False)}: {encoded}"
+
+
+def write_json_stream(path: str, head: Dict[str, Any], list_key: str, items: Iterable[dict],
+                      tail: Callable[[], Dict[str, Any]], indent: int = 2) -> int:
+    """{head..., list_key: [items...], tail()...} 문서를 항목 단위로 스트리밍 저장
+    
+    tail은 items를 모두 쓴 뒤 호출되므로 항목을 훑으며 누적한 요약을 넣을 수 있습니다.
+    쓴 항목 수를 반환합니다.
+    """
+    pad = " " * indent
+    count = 0
+    with atomic_open(path) as f:
+        f.write("{\n")
+        for key, value in head.items():
+            f.write(_member(key, value, indent) + ",\n")
+        
+        f.write(f"{pad}{json.dumps(list_key, ensure_ascii=False)}: [")
+        for item in items:
+            encoded = json.dumps(item, ensure_ascii=False, indent=indent).replace("\n", "\n" + pad * 2)
+            f.write(("\n" if count == 0 else ",\n") + pad * 2 + encoded)
+            count += 1
+        f.write(f"\n{pad}]" if count else "]")
+        
+        for key, value in tail().items():
+            f.write(",\n" + _member(key, value, indent))
+        f.write("\n}")
+    return count
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Notion DB 조회 페이지네이션 (다음 커서 미리 요청)
+
+next_cursor를 받는 즉시 다음 페이지 요청을 백그라운드 스레드로 보내고, 그동안
+호출한 쪽은 현재 페이지 묶음을 변환합니다. 페이지가 여러 개인 DB에서 변환 시간이
+요청 대기 시간 뒤에 숨어 전체 조회 시간이 "요청 시간의 합"에 가까워집니다.
+
+파티션 조회 (NOTION_SCAN_PARTITIONS=1):
+  커서는 순차적이라 큰 DB 전체 조회는 왕복 지연에 묶입니다. select 속성 값별로 겹치지 않는
+  필터(값마다 equals + 목록 밖 값 + 빈 값)로 나눠 공유 속도 제한기 아래에서 동시에 조회하고
+  page id 기준으로 합칩니다. 합집합이 단일 전체 조회와 같은지는 compare_partitioned_scan
+  (python scripts/bms.py scan-check)으로 확인합니다.
+
+사용법:
+  for page in iter_query(url, headers, query_filter=..., filter_properties=...):
+      ...
+  for page in scan_database(url, headers, partitions=select_partitions("비목", 값 목록), limiter=...):
+      ...
+
+환경변수:
+  - NOTION_QUERY_PREFETCH: (선택) 0이면 미리 요청하지 않고 순서대로 조회
+  - NOTION_SCAN_PARTITIONS: (선택) 1이면 전체 조회를 파티션별 동시 조회로 실행
+  - NOTION_SCAN_WORKERS: (선택) 파티션 동시 조회 수 (기본 4)
+  - NOTION_RATE_LIMIT: (선택) 파티션 조회가 공유하는 초당 요청 수 (기본 3)
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from http_client import RateLimiter, get_client
+
+NOTION_QUERY_PREFETCH = os.getenv("NOTION_QUERY_PREFETCH", "1") != "0"
+NOTION_SCAN_PARTITIONS = os.getenv("NOTION_SCAN_PARTITIONS", "") == "1"
+NOTION_SCAN_WORKERS = int(os.getenv("NOTION_SCAN_WORKERS", "4"))
+NOTION_RATE_LIMIT = float(os.getenv("NOTION_RATE_LIMIT", "3"))
+NOTION_PAGE_SIZE = 100
+
+OTHER_PARTITION = "(기타)"
+EMPTY_PARTITION = "(없음)"
+
+
+class NotionQueryError(RuntimeError):
+    """DB 조회 실패 (일부 결과로 판단하지 않도록 조회 전체를 중단)"""
+    
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        super().__init__(f"Notion 조회 실패: {status_code} - {text[:200]}")
+
+
+def iter_query(url: str, headers: Dict[str, str], query_filter: Optional[dict] = None,
+               filter_properties: Optional[List[str]] = None, limiter: Optional[RateLimiter] = None,
+               prefetch: bool = NOTION_QUERY_PREFETCH) -> Iterator[dict]:
+    """DB 조회 결과 페이지를 한 건씩 반환 (커서 페이지는 미리 요청)
+    
+    조회가 실패하면 NotionQueryError를 냅니다. 중간에 순회를 멈추면 진행 중인 요청이
+    끝날 때까지 기다린 뒤 정리합니다.
+    """
+    params = {"filter_properties": filter_properties} if filter_properties else None
+    
+    def fetch(cursor: Optional[str]) -> dict:
+        payload = {"page_size": NOTION_PAGE_SIZE}
+        if query_filter:
+            payload["filter"] = query_filter
+        if cursor:
+            payload["start_cursor"] = cursor
+        resp = get_client().request("POST", url, headers=headers, json=payload, params=params,
+                                    idempotent=True, limiter=limiter)
+        if resp.status_code != 200:
+            raise NotionQueryError(resp.status_code, resp.text)
+        return resp.json()
+    
+    def next_cursor(data: dict) -> Optional[str]:
+        return data.get("next_cursor") if data.get("has_more") else None
+    
+    if not prefetch:
+        data = fetch(None)
+        while True:
+            yield from data.get("results", [])
+            cursor = next_cursor(data)
+            if not cursor:
+                return
+            data = fetch(cursor)
+    
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notion-query")
+    pending: Optional[Future] = None
+    try:
+        pending = executor.submit(fetch, None)
+        while pending:
+            data = pending.result()
+            cursor = next_cursor(data)
+            pending = executor.submit(fetch, cursor) if cursor else None
+            yield from data.get("results", [])
+    finally:
+        if pending:
+            pending.cancel()
+        executor.shutdown(wait=True)
+
+
+def select_partitions(prop: str, values: Iterable[str]) -> Dict[str, dict]:
+    """select 속성 값별 조회 필터 (값마다 하나 + 목록 밖 값 + 빈 값)"""
+    values = list(values)
+    partitions = {value: {"property": prop, "select": {"equals": value}} for value in values}
+    partitions[OTHER_PARTITION] = {"and": [{"property": prop, "select": {"does_not_equal": value}}
+                                           for value in values]}
+    partitions[EMPTY_PARTITION] = {"property": prop, "select": {"is_empty": True}}
+    return partitions
+
+
+def _combine(query_filter: Optional[dict], partition: dict) -> dict:
+    """query_filter AND partition (Notion 복합 필터 중첩 한도 때문에 and는 펼쳐서 합침)"""
+    if not query_filter:
+        return partition
+    conditions = []
+    for part in (query_filter, partition):
+        conditions += part["and"] if "and" in part else [part]
+    return {"and": conditions}
+
+
+def _scan_partitions(url: str, headers: Dict[str, str], partitions: Dict[str, dict],
+                     query_filter: Optional[dict], filter_properties: Optional[List[str]],
+                     limiter: Optional[RateLimiter], workers: int) -> Iterator[Tuple[str, List[dict]]]:
+    """파티션별 조회를 동시에 실행해 끝나는 순서대로 (파티션 이름, 페이지 목록) 반환"""
+    def scan(partition: dict) -> List[dict]:
+        return list(iter_query(url, headers, _combine(query_filter, partition), filter_properties,
+                               limiter, prefetch=False))
+    
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notion-scan")
+    try:
+        pending = {executor.submit(scan, partition): name for name, partition in partitions.items()}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_partitioned(url: str, headers: Dict[str, str], partitions: Dict[str, dict],
+                     query_filter: Optional[dict] = None, filter_properties: Optional[List[str]] = None,
+                     limiter: Optional[RateLimiter] = None,
+                     workers: int = NOTION_SCAN_WORKERS) -> Iterator[dict]:
+    """파티션 조회를 동시에 실행해 합친 결과를 반환 (page id 기준 중복 제거)
+    
+    limiter는 모든 파티션 작업자가 공유합니다 (없으면 NOTION_RATE_LIMIT로 새로 만듦).
+    한 파티션이라도 실패하면 예외를 냅니다.
+    """
+    limiter = limiter or RateLimiter(NOTION_RATE_LIMIT)
+    seen = set()
+    for _, pages in _scan_partitions(url, headers, partitions, query_filter, filter_properties,
+                                     limiter, workers):
+        for page in pages:
+            if page["id"] not in seen:
+                seen.add(page["id"])
+                yield page
+
+
+def scan_database(url: str, headers: Dict[str, str], query_filter: Optional[dict] = None,
+                  filter_properties: Optional[List[str]] = None, limiter: Optional[RateLimiter] = None,
+                  partitions: Optional[Dict[str, dict]] = None,
+                  partitioned: bool = NOTION_SCAN_PARTITIONS) -> Iterator[dict]:
+    """DB 조회 (partitioned이고 partitions가 있으면 파티션 동시 조회, 아니면 단일 커서 조회)"""
+    if partitioned and partitions:
+        return iter_partitioned(url, headers, partitions, query_filter, filter_properties, limiter)
+    return iter_query(url, headers, query_filter, filter_properties, limiter)
+
+
+def compare_partitioned_scan(url: str, headers: Dict[str, str], partitions: Dict[str, dict],
+                             limiter: Optional[RateLimiter] = None,
+                             workers: int = NOTION_SCAN_WORKERS) -> dict:
+    """단일 전체 조회와 파티션 조회의 page id 합집합 비교
+    
+    missing이 있으면 파티션 필터가 DB를 빠짐없이 나누지 못한 것이고,
+    overlap은 두 파티션 이상에 잡힌 페이지 수입니다 (합칠 때 제거되지만 요청 낭비).
+    두 조회 모두 같은 limiter 아래에서 실행합니다.
+    """
+    limiter = limiter or RateLimiter(NOTION_RATE_LIMIT)
+    started = time.perf_counter()
+    full = {page["id"] for page in iter_query(url, headers, filter_properties=["title"], limiter=limiter)}
+    full_seconds = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    sizes = {}
+    union = set()
+    for name, pages in _scan_partitions(url, headers, partitions, None, ["title"], limiter, workers):
+        sizes[name] = len(pages)
+        union.update(page["id"] for page in pages)
+    partitioned_seconds = time.perf_counter() - started
+    
+    return {
+        "ok": full == union,
+        "full": len(full),
+        "partitioned": len(union),
+        "missing": sorted(full - union),
+        "extra": sorted(union - full),
+        "overlap": sum(sizes.values()) - len(union),
+        "partitions": {name: sizes[name] for name in partitions},
+        "full_seconds": round(full_seconds, 3),
+        "partitioned_seconds": round(partitioned_seconds, 3),
+    }
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+예산 DB 속성 스키마 (대시보드 변환 / Notion 속성 빌드 공용)
+
+필드 목록(출력 키, Notion 속성 이름, 타입)을 한 번만 코드로 컴파일해
+페이지 → 대시보드 항목 변환 함수와 그 역방향(항목 → Notion 속성) 빌더를 만듭니다.
+필드마다 속성 조회 + 타입 문자열 분기를 반복하지 않고, 필드가 고정된 dict 리터럴
+하나로 변환합니다.
+
+사용법:
+  from notion_schema import build_budget_properties, extract_budget_item
+  item = extract_budget_item(page)           # 조회 응답 페이지 → 대시보드 항목
+  props = build_budget_properties(sheet_item)  # 시트 항목(Notion 속성 이름 키) → 속성
+"""
+
+from typing import Callable, Dict, List, Tuple
+
+# (출력 키, Notion 속성 이름, 타입)
+Field = Tuple[str, str, str]
+
+BUDGET_FIELDS: List[Field] = [
+    ("항목명", "항목명", "title"),
+    ("비목", "비목", "select"),
+    ("세목", "세목", "rich_text"),
+    ("총예산", "총예산", "number"),
+    ("사용금액_공급가", "사용금액(공급가)", "number"),
+    ("사용금액_VAT", "사용금액(VAT)", "number"),
+    ("사용금액_합계", "사용금액(합계)", "number"),
+    ("잔액", "잔액", "number"),
+    ("집행률", "집행률", "number"),
+    ("상태", "상태", "select"),
+    ("2024년예산", "2024년예산", "number"),
+    ("2024년집행", "2024년집행", "number"),
+    ("2025년예산", "2025년예산", "number"),
+    ("2025년집행", "2025년집행", "number"),
+    ("최종동기화", "최종동기화", "date"),
+]
+
+# 타입별 추출 식 (prop: 속성 dict 조회 식)
+# 텍스트는 조회 응답의 plain_text, 동기화에서 빌드한 속성(bms full)의 text.content 모두 지원
+_EXTRACT = {
+    "title": '(_text(v[0]) if (v := {prop}.get("title")) else "")',
+    "rich_text": '(_text(v[0]) if (v := {prop}.get("rich_text")) else "")',
+    "number": '({prop}.get("number") or 0)',
+    "select": '(v["name"] if (v := {prop}.get("select")) else "")',
+    "date": '(v["start"] if (v := {prop}.get("date")) else "")',
+}
+
+# 타입별 빌드 식 (value: 항목 값 식)
+_BUILD = {
+    "title": '{{"title": [{{"text": {{"content": {value}}}}}]}}',
+    "rich_text": '{{"rich_text": [{{"text": {{"content": {value}}}}}]}}',
+    "number": '{{"number": {value}}}',
+    "select": '{{"select": {{"name": {value}}}}}',
+    "date": '{{"date": {{"start": {value}}}}}',
+}
+# 항목에 값이 없을 때 기본값 (select / date는 값이 비어 있으면 속성을 생략)
+_DEFAULT = {"title": '""', "rich_text": '""', "number": "0"}
+
+_EMPTY: dict = {}
+
+
+def _text(text: dict) -> str:
+    if "plain_text" in text:
+        return text["plain_text"]
+    return text.get("text", _EMPTY).get("content", "")
+
+
+def _compile(name: str, source: str) -> Callable:
+    namespace = {"__name__": __name__, "_text": _text, "_EMPTY": _EMPTY}
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    func = namespace[name]
+    func.source = source
+    return func
+
+
+def property_fields(fields: List[Field]) -> List[Field]:
+    """출력 키를 Notion 속성 이름으로 바꾼 필드 목록 (시트 항목처럼 속성 이름을 키로 쓰는 경우)"""
+    return [(prop, prop, kind) for _, prop, kind in fields]
+
+
+def compile_extractor(fields: List[Field], name: str = "extract") -> Callable[[dict], Dict]:
+    """필드 목록 → 조회 응답 페이지를 {"id", 출력 키...} dict로 바꾸는 함수"""
+    lines = [
+        f"def {name}(page):",
+        '    props = page.get("properties", _EMPTY)',
+        "    return {",
+        '        "id": page["id"],',
+    ]
+    for key, prop, kind in fields:
+        expr = _EXTRACT[kind].format(prop=f"props.get({prop!r}, _EMPTY)")
+        lines.append(f"        {key!r}: {expr},")
+    lines.append("    }")
+    return _compile(name, "\n".join(lines) + "\n")
+
+
+def compile_builder(fields: List[Field], name: str = "build") -> Callable[[dict], Dict]:
+    """필드 목록 → 항목(출력 키)을 Notion 페이지 properties dict로 바꾸는 함수 (extractor의 역방향)"""
+    lines = [f"def {name}(item):", "    get = item.get", "    props = {"]
+    for key, prop, kind in fields:
+        if kind in _DEFAULT:
+            value = f"get({key!r}, {_DEFAULT[kind]})"
+            lines.append(f"        {prop!r}: {_BUILD[kind].format(value=value)},")
+    lines.append("    }")
+    for key, prop, kind in fields:
+        if kind not in _DEFAULT:
+            lines.append(f"    if v := get({key!r}):")
+            lines.append(f"        props[{prop!r}] = {_BUILD[kind].format(value='v')}")
+    lines.append("    return props")
+    return _compile(name, "\n".join(lines) + "\n")
+
+
+extract_budget_item = compile_extractor(BUDGET_FIELDS, "extract_budget_item")
+build_budget_properties = compile_builder(property_fields(BUDGET_FIELDS), "build_budget_properties")
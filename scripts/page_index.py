@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Notion 페이지 로컬 인덱스 (항목명 → page_id)
+
+동기화 전 Notion DB 전체를 페이지네이션하지 않도록
+항목명, page_id, 마지막 동기화 내용 해시, 최종동기화 날짜, last_edited_time을 SQLite에 보관합니다.
+최종동기화는 변경 없는 항목을 쓰지 않고 내보낼 때(bms full) Notion에 남아 있는 값을 그대로 쓰기 위함입니다.
+
+갱신 방식:
+  - 최초 실행 / DB 변경 / 오래된 인덱스 / 드리프트 감지 → 전체 재구축
+  - 그 외 → last_edited_time 필터로 변경된 페이지만 증분 조회
+  - 보관 / 삭제된 페이지는 증분 조회에 나오지 않으므로
+    쓰기가 400/404로 실패하면 다음 실행에서 재구축 (invalidate),
+    NOTION_INDEX_SWEEP_DAYS(날짜 기준)마다 제목 속성만 받는 id 조회로 한 번 더 정리 (retain)
+
+환경변수:
+  - NOTION_INDEX_PATH: (선택) 인덱스 파일 경로 (기본 .cache/notion_index.sqlite, 빈 값이면 비활성화)
+  - NOTION_INDEX_MAX_AGE_DAYS: (선택) 전체 재구축 주기 (기본 7일)
+  - NOTION_INDEX_SWEEP_DAYS: (선택) 삭제된 페이지 id 조회 주기 (기본 1 = 하루 한 번, 0이면 증분 갱신마다)
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+NOTION_INDEX_PATH = os.getenv("NOTION_INDEX_PATH", ".cache/notion_index.sqlite")
+NOTION_INDEX_MAX_AGE_DAYS = int(os.getenv("NOTION_INDEX_MAX_AGE_DAYS", "7"))
+NOTION_INDEX_SWEEP_DAYS = int(os.getenv("NOTION_INDEX_SWEEP_DAYS", "1"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    title TEXT PRIMARY KEY,
+    page_id TEXT NOT NULL,
+    hash TEXT,
+    last_edited_time TEXT,
+    synced TEXT
+);
+CREATE INDEX IF NOT EXISTS pages_page_id ON pages (page_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class PageIndex:
+    """SQLite 기반 Notion 페이지 인덱스"""
+    
+    def __init__(self, path: str = NOTION_INDEX_PATH, max_age_days: int = NOTION_INDEX_MAX_AGE_DAYS,
+                 sweep_days: int = NOTION_INDEX_SWEEP_DAYS):
+        self.path = path
+        self.max_age = timedelta(days=max_age_days)
+        self.sweep_days = sweep_days
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(pages)")}
+        if "synced" not in columns:
+            # 이전 형식 인덱스: 최종동기화 값이 없으므로 다음 실행에서 전체 재구축
+            with self.conn:
+                self.conn.execute("ALTER TABLE pages ADD COLUMN synced TEXT")
+            self.invalidate("인덱스 형식 변경")
+    
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def _set_meta(self, key: str, value: Optional[str]):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+    
+    def needs_rebuild(self, database_id: str) -> Optional[str]:
+        """전체 재구축이 필요하면 사유 반환"""
+        if self._get_meta("database_id") != database_id:
+            return "인덱스 없음 또는 DB 변경"
+        if not self.high_water_mark:
+            return "기준 시각 없음"
+        if self._get_meta("invalid"):
+            return f"드리프트 감지 ({self._get_meta('invalid')})"
+        last_full = self._get_meta("last_full_scan")
+        if not last_full or datetime.now() - datetime.fromisoformat(last_full) > self.max_age:
+            return "재구축 주기 경과"
+        return None
+    
+    @property
+    def high_water_mark(self) -> Optional[str]:
+        """인덱스에 반영된 가장 최근 last_edited_time"""
+        return self._get_meta("high_water_mark")
+    
+    def _advance(self, entries: Dict[str, dict]):
+        times = [e["last_edited_time"] for e in entries.values() if e.get("last_edited_time")]
+        current = self.high_water_mark
+        if times and (current is None or max(times) > current):
+            self._set_meta("high_water_mark", max(times))
+    
+    def rebuild(self, database_id: str, entries: Dict[str, dict]):
+        """전체 조회 결과로 인덱스 교체"""
+        with self.conn:
+            self.conn.execute("DELETE FROM pages")
+            self.conn.execute("DELETE FROM meta")
+            self._upsert(entries)
+            self._set_meta("database_id", database_id)
+            self._set_meta("last_full_scan", datetime.now().isoformat())
+            self._set_meta("last_sweep", datetime.now().isoformat())
+            self._advance(entries)
+    
+    def apply_changes(self, entries: Dict[str, dict]):
+        """증분 조회 결과 반영 (항목명이 바뀐 페이지는 이전 행 제거)"""
+        with self.conn:
+            self._upsert(entries)
+            self._advance(entries)
+    
+    def needs_sweep(self) -> bool:
+        """삭제된 페이지 id 조회 주기가 지났는지 (날짜 기준이라 매일 실행 시각이 조금 달라도 하루 한 번, 전체 재구축도 sweep으로 침)"""
+        last_sweep = self._get_meta("last_sweep")
+        if not last_sweep:
+            return True
+        return (datetime.now().date() - datetime.fromisoformat(last_sweep).date()).days >= self.sweep_days
+    
+    def retain(self, page_ids: Set[str]) -> int:
+        """page_ids(살아 있는 페이지)에 없는 행 삭제, 삭제한 행 수 반환"""
+        stale = [(page_id,) for (page_id,) in self.conn.execute("SELECT page_id FROM pages") if page_id not in page_ids]
+        with self.conn:
+            self.conn.executemany("DELETE FROM pages WHERE page_id = ?", stale)
+            self._set_meta("last_sweep", datetime.now().isoformat())
+        return len(stale)
+    
+    def record_writes(self, writes: Iterable[Tuple[str, str, str, Optional[str]]]):
+        """이번 동기화에서 쓴 (항목명, page_id, hash, 최종동기화) 반영"""
+        with self.conn:
+            self._upsert({title: {"id": page_id, "hash": h, "synced": synced} for title, page_id, h, synced in writes})
+    
+    def _upsert(self, entries: Dict[str, dict]):
+        for title, entry in entries.items():
+            self.conn.execute("DELETE FROM pages WHERE page_id = ? AND title != ?", (entry["id"], title))
+            self.conn.execute(
+                "INSERT INTO pages (title, page_id, hash, last_edited_time, synced) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (title) DO UPDATE SET page_id = excluded.page_id, hash = excluded.hash, "
+                "last_edited_time = COALESCE(excluded.last_edited_time, pages.last_edited_time), "
+                "synced = excluded.synced",
+                (title, entry["id"], entry.get("hash"), entry.get("last_edited_time"), entry.get("synced")),
+            )
+    
+    def invalidate(self, reason: str):
+        """다음 실행에서 전체 재구축하도록 표시"""
+        with self.conn:
+            self._set_meta("invalid", reason)
+    
+    def pages(self) -> Dict[str, dict]:
+        """항목명 → {id, hash, last_edited_time, synced}"""
+        rows = self.conn.execute("SELECT title, page_id, hash, last_edited_time, synced FROM pages")
+        return {
+            title: {"id": page_id, "hash": h, "last_edited_time": edited, "synced": synced}
+            for title, page_id, h, edited, synced in rows
+        }
+    
+    def close(self):
+        self.conn.close()
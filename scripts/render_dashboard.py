@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+대시보드 index.html 사전 렌더링
+
+index.html을 템플릿으로 삼아 <!-- render:이름 --> ... <!-- /render:이름 --> 사이를
+내보내기 요약으로 채웁니다. 헤더(최종 업데이트 / D-day), KPI 카드(총예산 / 총집행·집행률 /
+잔액·남은일수), 비목별 집행 표, 그리고 요약 JSON(<script id="summary-data">)이
+HTML에 들어 있으므로 JS 실행이나 데이터 요청 전에 첫 화면이 보입니다.
+표시 자리는 표식 안쪽만 바꾸므로 렌더링을 반복해도 결과가 같고, 내용이 같으면 파일을 쓰지 않습니다.
+
+템플릿은 (고정 HTML 조각, 자리 이름) 목록으로 한 번만 나눠 두고(파일 크기 / 수정 시각이
+같으면 재사용) 렌더링은 조각을 이어 붙이기만 하므로 수 ms 안에 끝납니다.
+
+사용법:
+  python scripts/render_dashboard.py [데이터 JSON]   # 기본 data/budget.json의 summary
+  api/fetch_notion_data.py는 저장 후 자동으로 실행합니다. index.html은 이 데이터셋(budget)으로만
+  렌더링하므로 export_to_dashboard.py(budget_data)는 렌더링하지 않습니다.
+"""
+
+import html
+import json
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from dashboard_bundle import load_meta
+from json_stream import write_bytes
+
+INDEX_PATH = os.getenv("DASHBOARD_INDEX_PATH", "index.html")
+# index.html을 렌더링하는 데이터셋 (대시보드 JS가 읽는 data/budget.json - api/fetch_notion_data.py)
+# 다른 내보내기(budget_data)까지 렌더링하면 시각 / 요약이 달라 실행마다 index.html이 번갈아 바뀜
+RENDER_DATASET = "budget"
+RENDER_SOURCE = "data/budget.json"
+
+SLOT_PATTERN = re.compile(r"<!-- render:(\w+) -->.*?<!-- /render:\1 -->", re.S)
+
+# 인라인 요약에 넣는 키 (롤업은 크기가 커서 제외 - data/*.summary.json 참고)
+INLINE_KEYS = ("총예산", "총집행", "총잔액", "집행률", "항목수", "상태별", "비목별", "남은일수", "사업종료일")
+
+Template = List[Tuple[str, Optional[str]]]
+
+
+@lru_cache(maxsize=8)
+def _compile(path: str, size: int, mtime_ns: int) -> Template:
+    """템플릿 → [(고정 HTML, 뒤따르는 자리 이름 또는 None)]"""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    parts = []
+    position = 0
+    for match in SLOT_PATTERN.finditer(source):
+        parts.append((source[position:match.start()], match.group(1)))
+        position = match.end()
+    parts.append((source[position:], None))
+    return parts
+
+
+def load_template(path: str = INDEX_PATH) -> Template:
+    stat = os.stat(path)
+    return _compile(path, stat.st_size, stat.st_mtime_ns)
+
+
+# --- 자리별 HTML (js 렌더링과 같은 마크업) ---
+
+def format_currency(value: float) -> str:
+    """dashboard.js formatCurrency와 같은 표기"""
+    if not value:
+        return "0원"
+    if value >= 100000000:
+        return f"{value / 100000000:.1f}억원"
+    if value >= 10000:
+        return f"{value / 10000:.0f}만원"
+    return f"{value:,.0f}원"
+
+
+def _rate_color(rate: float) -> str:
+    return "#EF4444" if rate < 30 else "#F59E0B" if rate < 70 else "#10B981"
+
+
+def render_header(summary: dict, meta: dict) -> str:
+    days = summary.get("남은일수", 0)
+    updated = f"{meta.get('update_date', '')} {meta.get('update_time', '')}".strip()
+    return (
+        f'<span class="update-badge">📅 최종 업데이트: {html.escape(updated or "-")}</span>'
+        f'<span class="days-badge{" urgent" if days <= 90 else ""}">⏰ D-{days}</span>'
+    )
+
+
+def render_cards(summary: dict) -> Dict[str, str]:
+    """KPI 카드: 총예산 / 총집행·집행률 / 잔액·남은일수"""
+    rate = summary.get("집행률", 0)
+    return {
+        "card_budget": (
+            f'<div class="card-value">{format_currency(summary.get("총예산", 0))}</div>'
+            '<div class="card-label">배정예산</div>'
+            '<div class="card-sub">총 사업비의 100%</div>'
+        ),
+        "card_executed": (
+            f'<div class="card-value">{format_currency(summary.get("총집행", 0))}</div>'
+            '<div class="card-label">집행금액</div>'
+            '<div class="progress-bar"><div class="progress-fill" '
+            f'style="width:{min(rate, 100)}%;background:{_rate_color(rate)}"></div></div>'
+            f'<div class="card-sub">집행률 {rate}%</div>'
+        ),
+        "card_remaining": (
+            f'<div class="card-value">{format_currency(summary.get("총잔액", 0))}</div>'
+            '<div class="card-label">미집행 잔액</div>'
+            f'<div class="card-sub">{summary.get("남은일수", 0)}일 내 집행 필요</div>'
+        ),
+    }
+
+
+def render_unit_table(summary: dict) -> str:
+    """비목(예산 단위)별 예산 / 집행 / 집행률 / 잔액 표"""
+    rows = []
+    for bimok, values in summary.get("비목별", {}).items():
+        budget, used = values.get("예산", 0), values.get("집행", 0)
+        rate = round(used / budget * 100, 1) if budget > 0 else 0
+        rate_class = "rate-over" if rate > 100 else "rate-low" if rate < 10 else ""
+        rows.append(
+            f"<tr><td><strong>{html.escape(bimok or '기타')}</strong></td>"
+            f"<td>{format_currency(budget)}</td><td>{format_currency(used)}</td>"
+            f'<td class="{rate_class}">{rate}%</td><td>{format_currency(values.get("잔액", 0))}</td></tr>'
+        )
+    rows.append(
+        '<tr class="total-row"><td><strong>합계</strong></td>'
+        f"<td><strong>{format_currency(summary.get('총예산', 0))}</strong></td>"
+        f"<td><strong>{format_currency(summary.get('총집행', 0))}</strong></td>"
+        f"<td><strong>{summary.get('집행률', 0)}%</strong></td>"
+        f"<td><strong>{format_currency(summary.get('총잔액', 0))}</strong></td></tr>"
+    )
+    return (
+        '<table class="data-table"><thead><tr><th>비목</th><th>예산</th><th>집행</th><th>집행률</th>'
+        "<th>잔액</th></tr></thead><tbody>" + "".join(rows) + "</tbody></table>"
+    )
+
+
+def render_summary_json(summary: dict, meta: dict) -> str:
+    data = {
+        "summary": {key: summary[key] for key in INLINE_KEYS if key in summary},
+        "update_date": meta.get("update_date"),
+        "update_time": meta.get("update_time"),
+    }
+    encoded = json.dumps(data, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+    return f'<script id="summary-data" type="application/json">{encoded}</script>'
+
+
+def render_index(summary: dict, meta: Optional[dict] = None, path: str = INDEX_PATH) -> bool:
+    """index.html 표식 자리를 요약으로 채워 저장 (내용이 같으면 쓰지 않음), 파일이 바뀌었는지 반환
+    
+    meta: data/meta.json 데이터셋 항목 (update_date / update_time)
+    """
+    meta = meta or {}
+    slots = {
+        "header": render_header(summary, meta),
+        **render_cards(summary),
+        "unit_table": render_unit_table(summary),
+        "summary_json": render_summary_json(summary, meta),
+    }
+    out = []
+    for static, slot in load_template(path):
+        out.append(static)
+        if slot is not None:
+            out.append(f"<!-- render:{slot} -->{slots.get(slot, '')}<!-- /render:{slot} -->")
+    return write_bytes(path, "".join(out).encode("utf-8"))
+
+
+def render_after_export(dataset: str, summary: dict, path: str = INDEX_PATH):
+    """내보내기 후 단계: 데이터셋의 meta.json 시각으로 index.html 렌더링 (RENDER_DATASET만)"""
+    if dataset != RENDER_DATASET or not os.path.exists(path):
+        return
+    mark = time.perf_counter()
+    changed = render_index(summary, load_meta()["datasets"].get(dataset), path)
+    elapsed = (time.perf_counter() - mark) * 1000
+    print(f"   → {path} 사전 렌더링 {'완료' if changed else '(변경 없음)'} ({elapsed:.1f}ms)")
+
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else RENDER_SOURCE
+    with open(source, encoding="utf-8") as f:
+        data = json.load(f)
+    render_after_export(RENDER_DATASET, data["summary"])
+
+
+if __name__ == "__main__":
+    main()
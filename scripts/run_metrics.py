@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+실행별 성능 지표 리포트 (JSON + Prometheus 텍스트)
+
+동기화 / 내보내기 스크립트가 끝날 때 단계별 소요시간, 처리량, API 호출 집계를
+기계가 읽을 수 있는 파일로 남깁니다. 워크플로는 로그 대신 이 파일을 읽습니다.
+
+출력 (BMS_METRICS_DIR 아래):
+  - {이름}.json: 이번 실행 리포트
+  - {이름}.prom: 같은 내용의 Prometheus 텍스트 형식 (node_exporter textfile 수집용)
+  - history.jsonl: 실행마다 한 줄씩 누적되는 요약 (추세 확인용)
+
+환경변수:
+  - BMS_METRICS_DIR: (선택) 리포트 디렉토리 (기본 metrics, 빈 값이면 비활성화)
+"""
+
+import os
+import json
+from datetime import datetime
+from typing import Dict, Optional
+
+from http_client import get_client
+
+BMS_METRICS_DIR = os.getenv("BMS_METRICS_DIR", "metrics")
+
+
+def build_report(name: str, phases: Dict[str, float], counters: Dict[str, int],
+                 items: int, failure: Optional[str] = None) -> dict:
+    """실행 리포트 구성 (API 집계는 공용 HttpClient에서 가져옴)"""
+    client = get_client()
+    endpoints = client.stats()
+    total = phases.get("total") or sum(phases.values())
+    return {
+        "run": name,
+        "finished_at": datetime.now().isoformat(timespec="seconds"),
+        "ok": failure is None and counters.get("errors", 0) == 0,
+        "failure": failure,
+        "phases": {phase: round(seconds, 3) for phase, seconds in phases.items()},
+        "counters": dict(counters),
+        "throughput": {
+            "items": items,
+            "seconds": round(total, 3),
+            "items_per_sec": round(items / total, 1) if total else 0,
+        },
+        "api": {
+            "calls": sum(stat["calls"] for stat in endpoints.values()),
+            "retries": sum(stat["retries"] for stat in endpoints.values()),
+            "errors": sum(stat["errors"] for stat in endpoints.values()),
+            "throttled": sum(stat["throttled"] for stat in endpoints.values()),
+            "latency_histogram_ms": client.latency_histogram(),
+            "endpoints": {
+                key: {field: round(stat[field], 1) if field.endswith("_ms") else stat[field] for field in (
+                    "calls", "retries", "errors", "throttled", "avg_ms", "p50_ms", "p95_ms", "max_ms",
+                )}
+                for key, stat in sorted(endpoints.items())
+            },
+        },
+    }
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def to_prometheus(report: dict) -> str:
+    """리포트 → Prometheus 텍스트 노출 형식"""
+    run = _label(report["run"])
+    lines = [
+        "# TYPE bms_run_ok gauge",
+        f'bms_run_ok{{run="{run}"}} {int(report["ok"])}',
+        "# TYPE bms_phase_seconds gauge",
+    ]
+    lines += [f'bms_phase_seconds{{run="{run}",phase="{_label(phase)}"}} {seconds}'
+              for phase, seconds in report["phases"].items()]
+    lines.append("# TYPE bms_items gauge")
+    lines += [f'bms_items{{run="{run}",result="{_label(key)}"}} {value}'
+              for key, value in report["counters"].items()]
+    lines += [
+        "# TYPE bms_items_per_second gauge",
+        f'bms_items_per_second{{run="{run}"}} {report["throughput"]["items_per_sec"]}',
+    ]
+    
+    endpoints = report["api"]["endpoints"]
+    for metric, field in (("calls", "calls"), ("retries", "retries"),
+                          ("errors", "errors"), ("throttled", "throttled")):
+        lines.append(f"# TYPE bms_api_{metric}_total counter")
+        lines += [f'bms_api_{metric}_total{{run="{run}",endpoint="{_label(key)}"}} {stat[field]}'
+                  for key, stat in endpoints.items()]
+    
+    histogram = report["api"]["latency_histogram_ms"]
+    total_ms = sum(stat["avg_ms"] * stat["calls"] for stat in endpoints.values())
+    lines.append("# TYPE bms_api_latency_ms histogram")
+    lines += [f'bms_api_latency_ms_bucket{{run="{run}",le="{bound}"}} {count}'
+              for bound, count in histogram.items()]
+    lines += [
+        f'bms_api_latency_ms_sum{{run="{run}"}} {round(total_ms, 1)}',
+        f'bms_api_latency_ms_count{{run="{run}"}} {histogram["+Inf"]}',
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def write_run_metrics(name: str, phases: Dict[str, float], counters: Dict[str, int],
+                      items: int, failure: Optional[str] = None,
+                      directory: str = BMS_METRICS_DIR) -> Optional[dict]:
+    """리포트를 {name}.json / {name}.prom으로 저장하고 history.jsonl에 요약 추가"""
+    if not directory:
+        return None
+    report = build_report(name, phases, counters, items, failure)
+    os.makedirs(directory, exist_ok=True)
+    
+    with open(os.path.join(directory, f"{name}.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    with open(os.path.join(directory, f"{name}.prom"), "w", encoding="utf-8") as f:
+        f.write(to_prometheus(report))
+    
+    summary = {key: report[key] for key in ("run", "finished_at", "ok", "phases", "counters", "throughput")}
+    summary["api"] = {key: report["api"][key] for key in ("calls", "retries", "errors", "throttled")}
+    with open(os.path.join(directory, "history.jsonl"), "a", encoding="utf-8") as f:
+        f.write(json.dumps(summary, ensure_ascii=False) + "\n")
+    
+    print(f"📈 실행 지표 저장: {os.path.join(directory, name)}.json / .prom")
+    return report
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+예산 시트 구조 상수
+
+동기화 스크립트(sync_budget_to_notion.py)와 열 단위 파서(sheet_parser.py)가 함께 쓰는
+비목 코드 / 데이터 영역 정의입니다. 두 모듈이 서로를 import하지 않도록 여기 둡니다.
+"""
+
+# 비목 코드 매핑
+BIMOK_CODES = {
+    "인건비": "인건비(110)",
+    "운영비": "운영비(210)", 
+    "여비": "여비(220)",
+    "연구개발비": "연구개발비(260)",
+    "유형자산": "유형자산(430)",
+    "무형자산": "무형자산(440)",
+    "건설비": "건설비(420)",
+    "사업비배분": "사업비배분(320)",
+}
+
+# 시트 데이터 영역: 5행부터, _parse_row가 사용하는 A~T열
+SHEET_HEADER_ROWS = 4
+SHEET_DATA_RANGE = f"A{SHEET_HEADER_ROWS + 1}:T"
+SHEET_COLUMNS = 20
@@ -7,7 +7,7 @@ GitHub Actions workflow_dispatch를 트리거합니다.
 
 사용법:
 1. Slack App에서 Outgoing Webhook 또는 Event Subscriptions 설정
-2. 이 스크립트를 서버리스 함수(Lambda, Cloud Functions)로 배포
+2. 이 스크립트를 서버리스 함수(Lambda, Cloud Functions)로 배포 (http_client.py 포함)
 3. GITHUB_TOKEN 환경변수 설정
 
 또는 GitHub Actions의 repository_dispatch 이벤트 사용:
@@ -22,9 +22,10 @@ import os
 import json
 import hmac
 import hashlib
-import requests
 from datetime import datetime
 
+from http_client import get_client
+
 # 환경변수
 SLACK_SIGNING_SECRET = os.getenv("SLACK_SIGNING_SECRET")
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
@@ -61,7 +62,11 @@ def trigger_github_workflow():
         }
     }
     
-    resp = requests.post(url, headers=headers, json=payload)
+    try:
+        resp = get_client().post(url, headers=headers, json=payload)
+    except Exception as e:
+        print(f"⚠️ GitHub API 요청 실패: {e}")
+        return False
     return resp.status_code == 204
 
 
@@ -14,13 +14,48 @@ Google Sheets → Notion 자동 동기화 스크립트
   - GOOGLE_SHEETS_ID: 스프레드시트 ID
   - GOOGLE_CREDENTIALS_JSON: 서비스 계정 JSON
   - SLACK_WEBHOOK_URL: (선택) Slack 알림 웹훅
+  - SYNC_FORCE_UPDATE: (선택) "1"이면 변경 여부와 관계없이 전체 업데이트
+  - SYNC_CONCURRENCY: (선택) Notion 동시 쓰기 수 (기본 4)
+  - NOTION_RATE_LIMIT: (선택) 초당 Notion 요청 수 (기본 3, Notion 공식 평균 한도)
+  - NOTION_API_URL: (선택) Notion API 주소 (기본 https://api.notion.com/v1, 로컬 가짜 서버 테스트용)
+  - NOTION_SCAN_PARTITIONS: (선택) "1"이면 기존 페이지를 비목별 파티션으로 동시 조회 (notion_pager.py)
+  - NOTION_INDEX_PATH: (선택) 로컬 페이지 인덱스 경로 (기본 .cache/notion_index.sqlite)
+  - NOTION_INDEX_SWEEP_DAYS: (선택) 인덱스에서 삭제된 페이지를 찾는 id 조회 주기 (기본 1일)
+  - SYNC_JOURNAL_PATH: (선택) 항목별 처리 결과 저널 경로 (기본 .cache/sync_journal.jsonl)
+  - SHEETS_BULK_READ: (선택) "0"이면 기존 get_all_values() 방식으로 시트 읽기
+  - SHEETS_PARSER: (선택) "rows"면 기존 행 단위 파서 사용 (기본 columnar)
+  - SHEETS_CHUNK_ROWS: (선택) 스트리밍 모드 시트 청크 행 수 (기본 500)
+
+스트리밍 모드 (시트를 청크 단위로 읽으면서 바로 Notion에 쓰기):
+  python scripts/sync_budget_to_notion.py --stream
+
+중단된 실행 이어서 / 지난 실행의 실패 항목만 재전송:
+  python scripts/sync_budget_to_notion.py --resume
+  python scripts/sync_budget_to_notion.py --retry-failed
+
+시트 읽기 방식 비교:
+  python scripts/sync_budget_to_notion.py --compare-sheets
 """
 
 import os
 import json
+import argparse
+import hashlib
+import threading
+import time
 import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from queue import Queue
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+
+from http_client import HTTP_TIMEOUT, RateLimiter, get_client
+from page_index import NOTION_INDEX_PATH, PageIndex
+from notion_pager import NOTION_SCAN_PARTITIONS, NotionQueryError, scan_database, select_partitions
+from notion_schema import build_budget_properties
+from run_metrics import write_run_metrics
+from sheet_layout import BIMOK_CODES, SHEET_COLUMNS, SHEET_DATA_RANGE, SHEET_HEADER_ROWS
+from sync_journal import SYNC_JOURNAL_PATH, SyncJournal
 
 # ============ 환경 설정 ============
 NOTION_API_KEY = os.getenv("NOTION_API_KEY")
@@ -28,27 +63,73 @@ NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID", "54bfedc3769e43e8bdbcd59f22
 GOOGLE_SHEETS_ID = os.getenv("GOOGLE_SHEETS_ID", "1w9IwMI8B96AfdUDe31SfByOy67oYzvjv")
 GOOGLE_CREDENTIALS_JSON = os.getenv("GOOGLE_CREDENTIALS_JSON")
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
+SYNC_FORCE_UPDATE = os.getenv("SYNC_FORCE_UPDATE") == "1"
+SHEETS_BULK_READ = os.getenv("SHEETS_BULK_READ", "1") != "0"
+SHEETS_PARSER = os.getenv("SHEETS_PARSER", "columnar")
+SHEETS_CHUNK_ROWS = int(os.getenv("SHEETS_CHUNK_ROWS", "500"))
+SYNC_CONCURRENCY = int(os.getenv("SYNC_CONCURRENCY", "4"))
+NOTION_RATE_LIMIT = float(os.getenv("NOTION_RATE_LIMIT", "3"))
+SYNC_QUEUE_SIZE = 200
+SYNC_PROGRESS_EVERY = 100
+# 삭제 감지용 id 조회에서 받을 속성 (제목 속성의 id는 항상 "title")
+INDEX_SWEEP_PROPERTIES = ["title"]
 
-NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_API_URL = os.getenv("NOTION_API_URL", "https://api.notion.com/v1")
 NOTION_VERSION = "2022-06-28"
 
-# 비목 코드 매핑
-BIMOK_CODES = {
-    "인건비": "인건비(110)",
-    "운영비": "운영비(210)", 
-    "여비": "여비(220)",
-    "연구개발비": "연구개발비(260)",
-    "유형자산": "유형자산(430)",
-    "무형자산": "무형자산(440)",
-    "건설비": "건설비(420)",
-    "사업비배분": "사업비배분(320)",
-}
+# 변경 감지 비교 대상 속성 (최종동기화는 매 실행마다 바뀌므로 제외)
+SYNC_FIELDS = [
+    "항목명", "비목", "세목", "총예산",
+    "사용금액(공급가)", "사용금액(VAT)", "사용금액(합계)", "잔액", "집행률",
+    "2024년예산", "2024년집행", "2025년예산", "2025년집행", "상태",
+]
+
+
+def property_value(prop: dict) -> Any:
+    """Notion 속성(조회 응답 / 빌드 결과 공통) → 비교용 값"""
+    for kind in ("title", "rich_text", "number", "select", "date"):
+        if kind in prop:
+            value = prop[kind]
+            break
+    else:
+        return None
+    
+    if kind in ("title", "rich_text"):
+        return "".join(
+            t.get("plain_text", t.get("text", {}).get("content", "")) for t in value or []
+        )
+    if kind == "number":
+        return None if value is None else float(value)
+    if kind == "select":
+        return value["name"] if value else None
+    return value["start"] if value else None
+
+
+def bimok_partitions() -> Dict[str, dict]:
+    """비목별 파티션 조회 필터 (BIMOK_CODES 값마다 하나 + 그 외 / 빈 값)"""
+    return select_partitions("비목", BIMOK_CODES.values())
+
+
+def properties_hash(properties: dict) -> str:
+    """SYNC_FIELDS 기준 속성 내용 해시"""
+    canonical = {name: property_value(properties.get(name, {})) for name in SYNC_FIELDS}
+    raw = json.dumps(canonical, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class NotionAPIError(Exception):
+    """Notion API 오류 응답"""
+    
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"{status_code} - {message}")
+        self.status_code = status_code
 
 
 class NotionClient:
     """Notion API 클라이언트"""
     
-    def __init__(self, api_key: str, database_id: str):
+    def __init__(self, api_key: str, database_id: str, rate_limit: float = NOTION_RATE_LIMIT,
+                 partitioned: bool = NOTION_SCAN_PARTITIONS):
         self.api_key = api_key
         self.database_id = database_id
         self.headers = {
@@ -56,41 +137,89 @@ class NotionClient:
             "Content-Type": "application/json",
             "Notion-Version": NOTION_VERSION,
         }
+        self.limiter = RateLimiter(rate_limit)
+        self.partitioned = partitioned
+    
+    def _request(self, method: str, url: str, payload: dict,
+                 idempotent: bool = True) -> requests.Response:
+        """공용 세션 요청 (속도 제한 + 재시도, 429는 Retry-After 준수)"""
+        return get_client().request(
+            method, url, headers=self.headers, json=payload,
+            idempotent=idempotent, limiter=self.limiter,
+        )
+    
+    def _write(self, method: str, url: str, payload: dict, idempotent: bool = True) -> dict:
+        resp = self._request(method, url, payload, idempotent)
+        if resp.status_code != 200:
+            raise NotionAPIError(resp.status_code, resp.text[:200])
+        return resp.json()
     
-    def get_existing_pages(self) -> Dict[str, str]:
-        """기존 페이지 조회 (항목명 → page_id)"""
+    def _scan(self, query_filter: Optional[dict] = None,
+              filter_properties: Optional[List[str]] = None) -> Iterator[dict]:
         url = f"{NOTION_API_URL}/databases/{self.database_id}/query"
+        return scan_database(url, self.headers, query_filter, filter_properties, limiter=self.limiter,
+                             partitions=bimok_partitions(), partitioned=self.partitioned)
+    
+    def _scan_pages(self, query_filter: Optional[dict] = None) -> Dict[str, dict]:
+        """DB 조회 → 항목명 → {id, hash, last_edited_time, synced(최종동기화)}
+        
+        조회가 중간에 실패하면 NotionQueryError를 그대로 올립니다. 일부 결과를 기존 페이지
+        목록으로 쓰면 빠진 항목을 모두 신규로 보고 중복 페이지를 만들기 때문입니다.
+        """
         pages = {}
-        has_more = True
-        start_cursor = None
+        for page in self._scan(query_filter):
+            title_prop = page["properties"].get("항목명", {})
+            if title_prop.get("title"):
+                title = title_prop["title"][0]["plain_text"]
+                pages[title] = {
+                    "id": page["id"],
+                    "hash": properties_hash(page["properties"]),
+                    "last_edited_time": page.get("last_edited_time"),
+                    "synced": property_value(page["properties"].get("최종동기화", {})),
+                }
+        return pages
+    
+    def get_existing_pages(self, index: Optional[PageIndex] = None) -> Dict[str, dict]:
+        """기존 페이지 조회 (항목명 → {id, hash, last_edited_time, synced})
         
-        while has_more:
-            payload = {"page_size": 100}
-            if start_cursor:
-                payload["start_cursor"] = start_cursor
-            
-            resp = requests.post(url, headers=self.headers, json=payload)
-            if resp.status_code != 200:
-                print(f"❌ Notion 조회 실패: {resp.status_code}")
-                break
-                
-            data = resp.json()
-            for page in data.get("results", []):
-                title_prop = page["properties"].get("항목명", {})
-                if title_prop.get("title"):
-                    title = title_prop["title"][0]["plain_text"]
-                    pages[title] = page["id"]
-            
-            has_more = data.get("has_more", False)
-            start_cursor = data.get("next_cursor")
+        index가 주어지면 전체 조회 대신 last_edited_time 이후 변경분만 조회해
+        로컬 인덱스를 갱신하고, 재구축이 필요할 때만 전체 조회합니다.
+        보관(archive) / 삭제된 페이지는 변경분 조회에 나오지 않으므로 쓰기 실패(400/404) 때
+        인덱스를 무효화하고, sweep 주기(NOTION_INDEX_SWEEP_DAYS)가 지났을 때만 제목 속성만 받는
+        id 조회로 살아 있는 페이지를 확인해 인덱스에서 뺍니다.
+        전체 조회가 실패하면 NotionQueryError (동기화 중단)
+        """
+        if index is None:
+            return self._scan_pages()
         
+        reason = index.needs_rebuild(self.database_id)
+        if reason is None:
+            try:
+                changed = self._scan_pages({
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": index.high_water_mark},
+                })
+                live = None
+                if index.needs_sweep():
+                    live = {page["id"] for page in self._scan(filter_properties=INDEX_SWEEP_PROPERTIES)}
+            except NotionQueryError as e:
+                print(f"❌ Notion 조회 실패: {e.status_code}")
+                reason = "증분 조회 실패"
+            else:
+                index.apply_changes(changed)
+                removed = f", {index.retain(live)}건 삭제" if live is not None else ""
+                print(f"   📇 인덱스 증분 갱신: {len(changed)}건 변경{removed}")
+                return index.pages()
+        
+        print(f"   📇 인덱스 전체 재구축: {reason}")
+        pages = self._scan_pages()
+        index.rebuild(self.database_id, pages)
         return pages
     
     def update_page(self, page_id: str, properties: dict) -> dict:
         """페이지 업데이트"""
         url = f"{NOTION_API_URL}/pages/{page_id}"
-        resp = requests.patch(url, headers=self.headers, json={"properties": properties})
-        return resp.json()
+        return self._write("PATCH", url, {"properties": properties})
     
     def create_page(self, properties: dict) -> dict:
         """새 페이지 생성"""
@@ -99,16 +228,55 @@ class NotionClient:
             "parent": {"database_id": self.database_id},
             "properties": properties
         }
-        resp = requests.post(url, headers=self.headers, json=payload)
-        return resp.json()
+        return self._write("POST", url, payload, idempotent=False)
+    
+    def write_pages(self, jobs: Iterable[Tuple[str, Optional[str], dict]],
+                    concurrency: int = SYNC_CONCURRENCY) -> Iterator[tuple]:
+        """페이지 생성/업데이트 병렬 실행
+        
+        jobs: (항목명, page_id 또는 None, properties). page_id가 없으면 생성.
+        제너레이터를 넘기면 필요한 만큼만 꺼내며, 진행 중인 작업은 concurrency * 2개로 제한됩니다.
+        완료 순서대로 (항목명, page_id, 응답, 오류)를 반환합니다.
+        """
+        def run(job):
+            _, page_id, properties = job
+            if page_id:
+                return self.update_page(page_id, properties)
+            return self.create_page(properties)
+        
+        workers = max(1, concurrency)
+        jobs = iter(jobs)
+        exhausted = False
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = {}
+            while True:
+                while not exhausted and len(pending) < workers * 2:
+                    job = next(jobs, None)
+                    if job is None:
+                        exhausted = True
+                    else:
+                        pending[pool.submit(run, job)] = job
+                if not pending:
+                    return
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, page_id, _ = pending.pop(future)
+                    try:
+                        yield name, page_id, future.result(), None
+                    except Exception as e:
+                        yield name, page_id, None, e
 
 
 class GoogleSheetsClient:
     """Google Sheets API 클라이언트"""
     
-    def __init__(self, sheet_id: str, credentials_json: str = None):
+    def __init__(self, sheet_id: str, credentials_json: str = None, bulk_read: bool = SHEETS_BULK_READ,
+                 parser: str = SHEETS_PARSER):
         self.sheet_id = sheet_id
         self.credentials_json = credentials_json
+        self.bulk_read = bulk_read
+        self.parser = parser
         self._client = None
     
     def _get_client(self):
@@ -129,48 +297,126 @@ class GoogleSheetsClient:
                     scopes=["https://www.googleapis.com/auth/spreadsheets.readonly"]
                 )
             self._client = gspread.authorize(creds)
+            if hasattr(self._client, "set_timeout"):
+                self._client.set_timeout(HTTP_TIMEOUT)
         return self._client
     
-    def get_budget_data(self) -> List[dict]:
+    def _open_sheet(self):
+        return self._get_client().open_by_key(self.sheet_id).get_worksheet(0)
+    
+    @staticmethod
+    def _pad_rows(rows: List[list]) -> List[list]:
+        """API는 행 끝의 빈 셀을 생략하므로 get_all_values()와 같은 폭으로 채움"""
+        return [list(row) + [""] * (SHEET_COLUMNS - len(row)) if row else [] for row in rows]
+    
+    def _fetch_rows(self, bulk_read: bool) -> List[list]:
+        """시트 데이터 행 조회 (헤더 4행 제외)
+        
+        bulk_read: A~T열만 서식 없는 값(UNFORMATTED_VALUE)으로 한 번에 요청.
+                   숫자는 int/float으로 오므로 문자열 정리가 거의 필요 없습니다.
+        그 외: 전체 셀을 표시 문자열로 조회 (기존 방식)
+        """
+        sheet = self._open_sheet()
+        if not bulk_read:
+            return sheet.get_all_values()[SHEET_HEADER_ROWS:]
+        return self._pad_rows(sheet.get(SHEET_DATA_RANGE, value_render_option="UNFORMATTED_VALUE"))
+    
+    def _iter_row_chunks(self, bulk_read: bool, chunk_rows: int) -> Iterator[Tuple[int, List[list]]]:
+        """(시작 행 번호, 행 목록)을 chunk_rows 단위로 조회 (bulk_read가 아니면 한 번에)"""
+        if not bulk_read:
+            yield SHEET_HEADER_ROWS, self._fetch_rows(False)
+            return
+        
+        sheet = self._open_sheet()
+        for first in range(SHEET_HEADER_ROWS + 1, sheet.row_count + 1, chunk_rows):
+            last = min(first + chunk_rows - 1, sheet.row_count)
+            rows = sheet.get(f"A{first}:T{last}", value_render_option="UNFORMATTED_VALUE")
+            yield first - 1, self._pad_rows(rows)
+    
+    def _fetch_columns(self) -> List[list]:
+        """시트 데이터 영역(A~T)을 열 우선(majorDimension=COLUMNS) 서식 없는 값으로 조회"""
+        sheet = self._open_sheet()
+        return [list(column) for column in sheet.get(
+            SHEET_DATA_RANGE, major_dimension="COLUMNS", value_render_option="UNFORMATTED_VALUE"
+        )]
+    
+    def get_budget_data(self, bulk_read: Optional[bool] = None) -> List[dict]:
         """예산 데이터 파싱"""
-        client = self._get_client()
-        sheet = client.open_by_key(self.sheet_id).get_worksheet(0)
-        all_values = sheet.get_all_values()
+        if bulk_read is None:
+            bulk_read = self.bulk_read
         
+        if self.parser == "columnar":
+            from sheet_parser import columns_to_items, parse_budget_columns, rows_to_columns
+            columns = self._fetch_columns() if bulk_read else rows_to_columns(self._fetch_rows(False))
+            return columns_to_items(parse_budget_columns(columns, unformatted=bulk_read))
+        return self.parse_rows(self._fetch_rows(bulk_read), bulk_read)
+    
+    def iter_budget_data(self, bulk_read: Optional[bool] = None,
+                         chunk_rows: int = SHEETS_CHUNK_ROWS) -> Iterator[dict]:
+        """예산 항목을 시트 청크 단위로 읽으며 하나씩 반환 (스트리밍 모드)"""
+        if bulk_read is None:
+            bulk_read = self.bulk_read
+        
+        current_bimok = None
+        for start, rows in self._iter_row_chunks(bulk_read, chunk_rows):
+            for i, row in enumerate(rows, start=start):
+                current_bimok, item = self._parse_line(i, row, current_bimok, bulk_read)
+                if item:
+                    yield item
+    
+    def parse_rows(self, rows: List[list], unformatted: bool = False) -> List[dict]:
+        """행 단위 파싱 (기존 방식)"""
         budget_items = []
         current_bimok = None
         
-        for i, row in enumerate(all_values):
-            if i < 4 or not row or len(row) < 10:
-                continue
-            
-            cell_a = str(row[0]).strip()
-            cell_b = str(row[1]).strip() if len(row) > 1 else ""
-            cell_c = str(row[2]).strip() if len(row) > 2 else ""
-            
-            # 소계/총계 건너뛰기
-            if "소 계" in cell_a or "소 계" in cell_b or "총 계" in cell_a:
-                continue
-            
-            # 비목 업데이트
-            for key, code in BIMOK_CODES.items():
-                if key in cell_a:
-                    current_bimok = code
-                    break
-            
-            # 실제 예산 항목 파싱
-            if current_bimok and cell_c and cell_c not in ["소 계", "소계"]:
-                try:
-                    item = self._parse_row(row, cell_c, cell_b, current_bimok)
-                    if item["항목명"] and item["총예산"] > 0:
-                        budget_items.append(item)
-                except Exception as e:
-                    print(f"   ⚠️ 행 {i} 파싱 스킵: {e}")
+        for i, row in enumerate(rows, start=SHEET_HEADER_ROWS):
+            current_bimok, item = self._parse_line(i, row, current_bimok, unformatted)
+            if item:
+                budget_items.append(item)
         
         return budget_items
     
-    def _parse_row(self, row: list, item_name: str, semok: str, bimok: str) -> dict:
+    def _parse_line(self, i: int, row: list, current_bimok: Optional[str],
+                    unformatted: bool) -> Tuple[Optional[str], Optional[dict]]:
+        """한 행 처리 → (현재 비목, 예산 항목 또는 None)"""
+        if not row or len(row) < 10:
+            return current_bimok, None
+        
+        cell_a = str(row[0]).strip()
+        cell_b = str(row[1]).strip() if len(row) > 1 else ""
+        cell_c = str(row[2]).strip() if len(row) > 2 else ""
+        
+        # 소계/총계 건너뛰기
+        if "소 계" in cell_a or "소 계" in cell_b or "총 계" in cell_a:
+            return current_bimok, None
+        
+        # 비목 업데이트
+        for key, code in BIMOK_CODES.items():
+            if key in cell_a:
+                current_bimok = code
+                break
+        
+        # 실제 예산 항목 파싱
+        if current_bimok and cell_c and cell_c not in ["소 계", "소계"]:
+            try:
+                item = self._parse_row(row, cell_c, cell_b, current_bimok, unformatted)
+                if item["항목명"] and item["총예산"] > 0:
+                    return current_bimok, item
+            except Exception as e:
+                print(f"   ⚠️ 행 {i} 파싱 스킵: {e}")
+        
+        return current_bimok, None
+    
+    def _parse_row(self, row: list, item_name: str, semok: str, bimok: str,
+                   unformatted: bool = False) -> dict:
         """단일 행 파싱"""
+        rate = row[8] if len(row) > 8 else 0
+        if unformatted and isinstance(rate, (int, float)):
+            # 서식 없는 백분율 셀은 이미 비율(0.45)이므로 100% 초과도 그대로 사용
+            rate = float(rate)
+        else:
+            rate = self._parse_percentage(rate)
+        
         return {
             "항목명": item_name,
             "비목": bimok,
@@ -180,7 +426,7 @@ class GoogleSheetsClient:
             "사용금액(VAT)": self._parse_number(row[5]) if len(row) > 5 else 0,
             "사용금액(합계)": self._parse_number(row[6]) if len(row) > 6 else 0,
             "잔액": self._parse_number(row[7]) if len(row) > 7 else 0,
-            "집행률": self._parse_percentage(row[8]) if len(row) > 8 else 0,
+            "집행률": rate,
             "2024년예산": self._parse_number(row[9]) if len(row) > 9 else 0,
             "2024년집행": self._parse_number(row[13]) if len(row) > 13 else 0,
             "2025년예산": self._parse_number(row[15]) if len(row) > 15 else 0,
@@ -213,15 +459,50 @@ class GoogleSheetsClient:
             return num / 100 if num > 1 else num
         except:
             return 0.0
+    
+    def compare_read_modes(self) -> List[str]:
+        """bulk / 기존 읽기 방식 결과 비교 → 차이 목록"""
+        bulk = {item["항목명"]: item for item in self.get_budget_data(bulk_read=True)}
+        legacy = {item["항목명"]: item for item in self.get_budget_data(bulk_read=False)}
+        
+        diffs = []
+        for name in sorted(set(bulk) | set(legacy)):
+            if name not in bulk or name not in legacy:
+                diffs.append(f"{name}: {'bulk' if name in bulk else 'legacy'}에만 존재")
+                continue
+            for key, value in legacy[name].items():
+                other = bulk[name][key]
+                if isinstance(value, float) and isinstance(other, float):
+                    same = abs(value - other) < 1e-6
+                else:
+                    same = value == other
+                if not same:
+                    diffs.append(f"{name}.{key}: legacy={value!r} bulk={other!r}")
+        return diffs
 
 
 class BudgetSyncService:
     """예산 동기화 서비스"""
     
-    def __init__(self, notion_client: NotionClient, sheets_client: GoogleSheetsClient):
+    def __init__(self, notion_client: NotionClient, sheets_client: GoogleSheetsClient,
+                 detect_changes: bool = True, concurrency: int = SYNC_CONCURRENCY,
+                 index: Optional[PageIndex] = None, journal: Optional[SyncJournal] = None):
         self.notion = notion_client
         self.sheets = sheets_client
-        self.stats = {"updated": 0, "created": 0, "errors": 0}
+        self.detect_changes = detect_changes
+        self.concurrency = concurrency
+        self.index = index
+        self.journal = journal
+        # --resume: 건너뛸 항목 → 반영된 속성 해시 / --retry-failed: 이 항목만 전송
+        self.skip_items: Dict[str, Optional[str]] = {}
+        self.only_items: Optional[set] = None
+        # bms full: 대시보드 내보내기에 넘길 항목명 → 페이지 (Notion 재조회 대신 사용)
+        self.collect = False
+        self._collected: Dict[str, dict] = {}
+        self._existing_titles: set = set()
+        self.stats = {"updated": 0, "created": 0, "unchanged": 0, "errors": 0}
+        self.timings: Dict[str, float] = {}
+        self.failure: Optional[str] = None
     
     def determine_status(self, execution_rate: float, remaining: float) -> str:
         """상태 자동 결정"""
@@ -234,30 +515,13 @@ class BudgetSyncService:
         return "정상"
     
     def build_properties(self, item: dict) -> dict:
-        """Notion 속성 빌드"""
+        """Notion 속성 빌드 (필드 목록은 notion_schema.BUDGET_FIELDS)"""
         status = self.determine_status(item.get("집행률", 0), item.get("잔액", 0))
         today = datetime.now().strftime("%Y-%m-%d")
         
-        props = {
-            "항목명": {"title": [{"text": {"content": item["항목명"]}}]},
-            "세목": {"rich_text": [{"text": {"content": item.get("세목", "")}}]},
-            "총예산": {"number": item.get("총예산", 0)},
-            "사용금액(공급가)": {"number": item.get("사용금액(공급가)", 0)},
-            "사용금액(VAT)": {"number": item.get("사용금액(VAT)", 0)},
-            "사용금액(합계)": {"number": item.get("사용금액(합계)", 0)},
-            "잔액": {"number": item.get("잔액", 0)},
-            "집행률": {"number": item.get("집행률", 0)},
-            "2024년예산": {"number": item.get("2024년예산", 0)},
-            "2024년집행": {"number": item.get("2024년집행", 0)},
-            "2025년예산": {"number": item.get("2025년예산", 0)},
-            "2025년집행": {"number": item.get("2025년집행", 0)},
-            "상태": {"select": {"name": status}},
-            "최종동기화": {"date": {"start": today}},
-        }
-        
-        if item.get("비목"):
-            props["비목"] = {"select": {"name": item["비목"]}}
-        
+        props = build_budget_properties(item)
+        props["상태"] = {"select": {"name": status}}
+        props["최종동기화"] = {"date": {"start": today}}
         return props
     
     def sync(self) -> dict:
@@ -267,43 +531,214 @@ class BudgetSyncService:
         print(f"   시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S KST')}")
         print(f"{'='*60}\n")
         
-        # 1. Google Sheets 데이터 로드
-        print("📊 Google Sheets 데이터 로드 중...")
-        try:
-            items = self.sheets.get_budget_data()
-            print(f"   ✅ {len(items)}개 항목 로드 완료")
-        except Exception as e:
-            print(f"   ❌ 실패: {e}")
-            return self.stats
+        started = time.perf_counter()
         
-        # 2. 기존 Notion 페이지 조회
-        print("\n📋 Notion 기존 데이터 확인 중...")
-        existing = self.notion.get_existing_pages()
-        print(f"   ✅ {len(existing)}개 기존 항목 확인")
+        # 1~2. Google Sheets 데이터 로드 + 기존 Notion 페이지 조회 (동시 실행)
+        # 인덱스(SQLite)는 메인 스레드 연결이므로 Notion 조회는 메인 스레드에서 실행
+        print("📊 Google Sheets 데이터 로드 / 📋 Notion 기존 데이터 확인 중... (동시 실행)")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            sheet_load = pool.submit(self._timed, "sheets", self.sheets.get_budget_data)
+            existing = self._load_existing()
+            if existing is None:
+                return self.stats
+            print(f"   ✅ Notion: {len(existing)}개 기존 항목 확인")
+            try:
+                items = sheet_load.result()
+                print(f"   ✅ Google Sheets: {len(items)}개 항목 로드 완료")
+            except Exception as e:
+                print(f"   ❌ Google Sheets 로드 실패: {e}")
+                self.failure = f"Google Sheets 로드 실패: {e}"
+                return self.stats
+        self.timings["load"] = time.perf_counter() - started
         
         # 3. 동기화
-        print("\n🔄 데이터 동기화 중...")
-        for item in items:
-            name = item["항목명"]
-            props = self.build_properties(item)
-            
+        print(f"\n🔄 데이터 동기화 중... (동시 {self.concurrency}개)")
+        self._timed("write", self._write_items, items, existing)
+        self.timings["total"] = time.perf_counter() - started
+        
+        # 4. 결과 출력
+        self._print_summary()
+        self._print_timings()
+        get_client().print_stats()
+        return self.stats
+    
+    def sync_streaming(self) -> dict:
+        """스트리밍 동기화 실행
+        
+        시트를 청크 단위로 읽어 파싱한 항목을 제한된 크기의 큐로 넘기고,
+        쓰기 단계가 도착하는 대로 Notion에 반영합니다. 시트 읽기·파싱과
+        네트워크 쓰기가 겹치며, 시트 크기와 관계없이 메모리 사용량이 일정합니다.
+        """
+        print(f"\n{'='*60}")
+        print(f"🔄 예산 데이터 스트리밍 동기화 시작")
+        print(f"   시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S KST')}")
+        print(f"{'='*60}\n")
+        
+        started = time.perf_counter()
+        print("📋 Notion 기존 데이터 확인 중...")
+        existing = self._load_existing()
+        if existing is None:
+            return self.stats
+        print(f"   ✅ {len(existing)}개 기존 항목 확인")
+        
+        print(f"\n🔄 시트 → Notion 스트리밍 중... (동시 {self.concurrency}개)")
+        queue = Queue(maxsize=SYNC_QUEUE_SIZE)
+        end = object()
+        failure = []
+        
+        def produce():
             try:
-                if name in existing:
-                    self.notion.update_page(existing[name], props)
-                    self.stats["updated"] += 1
-                    print(f"   ✏️  업데이트: {name}")
-                else:
-                    self.notion.create_page(props)
-                    self.stats["created"] += 1
-                    print(f"   ✨ 신규생성: {name}")
+                for item in self.sheets.iter_budget_data():
+                    queue.put(item)
             except Exception as e:
-                self.stats["errors"] += 1
-                print(f"   ❌ 오류 ({name}): {e}")
+                failure.append(e)
+            finally:
+                queue.put(end)
+        
+        def consume() -> Iterator[dict]:
+            loaded = 0
+            while True:
+                item = queue.get()
+                if item is end:
+                    return
+                loaded += 1
+                if loaded % SYNC_PROGRESS_EVERY == 0:
+                    done = sum(self.stats.values())
+                    print(f"   ⏳ 로드 {loaded}건 / 처리 {done}건 / 대기열 {queue.qsize()}건")
+                yield item
+        
+        threading.Thread(target=produce, daemon=True).start()
+        self._timed("stream", self._write_items, consume(), existing)
+        self.timings["total"] = time.perf_counter() - started
+        
+        if failure:
+            self.stats["errors"] += 1
+            self.failure = f"시트 로드 중단: {failure[0]}"
+            print(f"   ❌ 시트 로드 중단: {failure[0]} (그 전까지 읽은 항목만 반영됨)")
         
-        # 4. 결과 출력
         self._print_summary()
+        self._print_timings()
+        get_client().print_stats()
         return self.stats
     
+    def _load_existing(self) -> Optional[Dict[str, dict]]:
+        """기존 Notion 페이지 조회 (실패하면 동기화 중단 - 일부 목록으로 쓰면 중복 페이지 생성)"""
+        try:
+            return self._timed("notion", self.notion.get_existing_pages, self.index)
+        except NotionQueryError as e:
+            self.stats["errors"] += 1
+            self.failure = f"Notion 기존 페이지 조회 실패: {e}"
+            print(f"   ❌ {self.failure} (동기화 중단)")
+            return None
+    
+    def _plan_writes(self, items: Iterable[dict], existing: Dict[str, dict],
+                     hashes: Dict[str, str]) -> Iterator[tuple]:
+        """항목 → 쓰기 작업 (변경 없는 항목, 재개/재시도 대상이 아닌 항목은 건너뜀)
+        
+        재개 실행은 중단된 실행에서 반영된 내용과 해시가 같은 항목만 건너뜁니다
+        (그 사이 시트가 바뀐 항목은 다시 씀).
+        """
+        for item in items:
+            name = item["항목명"]
+            if self.only_items is not None and name not in self.only_items:
+                continue
+            props = self.build_properties(item)
+            digest = properties_hash(props)
+            if name in self.skip_items and self.skip_items[name] == digest:
+                continue
+            page = existing.get(name)
+            if page and self.detect_changes and page["hash"] == digest:
+                self.stats["unchanged"] += 1
+                if self.collect:
+                    # 쓰지 않은 페이지는 Notion에 남은 최종동기화 값 그대로 내보냄
+                    props.pop("최종동기화")
+                    if page.get("synced"):
+                        props["최종동기화"] = {"date": {"start": page["synced"]}}
+                    self._collected[name] = {"id": page["id"], "properties": props}
+                continue
+            if self.collect:
+                self._collected[name] = {"id": page["id"] if page else None, "properties": props}
+            hashes[name] = (digest, props["최종동기화"]["date"]["start"])
+            yield name, page["id"] if page else None, props
+    
+    def _write_items(self, items: Iterable[dict], existing: Dict[str, dict]):
+        """변경된 항목을 Notion에 쓰고 결과를 stats / 인덱스에 반영"""
+        hashes = {}
+        written = []
+        self._existing_titles = set(existing)
+        jobs = self._plan_writes(items, existing, hashes)
+        for name, page_id, result, error in self.notion.write_pages(jobs, self.concurrency):
+            digest, synced = hashes.pop(name, (None, None))
+            if self.journal:
+                self.journal.record(name, (result or {}).get("id", page_id), error, digest)
+            if error:
+                self.stats["errors"] += 1
+                print(f"   ❌ 오류 ({name}): {error}")
+                if self.index and page_id and getattr(error, "status_code", None) in (400, 404):
+                    self.index.invalidate(f"{name} 업데이트 실패")
+                continue
+            if page_id:
+                self.stats["updated"] += 1
+                print(f"   ✏️  업데이트: {name}")
+            else:
+                self.stats["created"] += 1
+                print(f"   ✨ 신규생성: {name}")
+            written.append((name, result.get("id", page_id), digest, synced))
+            if self.collect:
+                self._collected[name]["id"] = result.get("id", page_id)
+            if self.index and len(written) >= SYNC_PROGRESS_EVERY:
+                self.index.record_writes(written)
+                written = []
+        
+        if self.index:
+            self.index.record_writes(written)
+    
+    def synced_pages(self) -> Optional[List[dict]]:
+        """이번 실행으로 확인·반영한 페이지 목록 (Notion 조회 응답과 같은 {id, properties} 형태)
+        
+        collect=True로 실행했고 결과가 DB 전체와 같다고 확신할 수 있을 때만 반환합니다.
+        오류, 재개/재시도 실행, 시트에 없는 Notion 페이지가 있으면 None (DB를 다시 조회해야 함)
+        """
+        if not self.collect or self.failure or self.stats["errors"]:
+            return None
+        if self.skip_items or self.only_items is not None:
+            return None
+        if self._existing_titles - set(self._collected):
+            return None
+        return list(self._collected.values())
+    
+    def _timed(self, phase: str, func, *args):
+        """func 실행 시간을 self.timings[phase]에 기록"""
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.timings[phase] = time.perf_counter() - started
+    
+    def _print_timings(self):
+        """단계별 소요시간 출력 (시트 로드 / Notion 조회 동시 실행 절감분 포함)"""
+        t = self.timings
+        print("⏱️  단계별 소요시간")
+        if "load" in t:
+            serial = t.get("sheets", 0) + t.get("notion", 0)
+            print(f"   시트 로드 {t.get('sheets', 0):.2f}s / Notion 조회 {t.get('notion', 0):.2f}s "
+                  f"→ 동시 실행 {t['load']:.2f}s (절감 {max(0, serial - t['load']):.2f}s)")
+        elif "notion" in t:
+            print(f"   Notion 조회 {t['notion']:.2f}s")
+        for phase, label in (("write", "Notion 쓰기"), ("stream", "시트 스트리밍 + 쓰기"), ("total", "전체")):
+            if phase in t:
+                print(f"   {label} {t[phase]:.2f}s")
+        print()
+    
+    def metrics(self) -> dict:
+        """실행 지표 (run_metrics.write_run_metrics 인자)"""
+        return {
+            "phases": dict(self.timings),
+            "counters": dict(self.stats),
+            "items": sum(self.stats.values()),
+            "failure": self.failure,
+        }
+    
     def _print_summary(self):
         """결과 요약 출력"""
         print(f"\n{'='*60}")
@@ -311,6 +746,7 @@ class BudgetSyncService:
         print(f"{'='*60}")
         print(f"   ✏️  업데이트: {self.stats['updated']}건")
         print(f"   ✨ 신규생성: {self.stats['created']}건")
+        print(f"   ⏸️  변경없음: {self.stats['unchanged']}건 (API 호출 절감)")
         print(f"   ❌ 오류: {self.stats['errors']}건")
         print(f"{'='*60}\n")
 
@@ -331,6 +767,7 @@ def notify_slack(webhook_url: str, stats: dict):
                 "fields": [
                     {"type": "mrkdwn", "text": f"*업데이트:* {stats['updated']}건"},
                     {"type": "mrkdwn", "text": f"*신규생성:* {stats['created']}건"},
+                    {"type": "mrkdwn", "text": f"*변경없음:* {stats.get('unchanged', 0)}건"},
                     {"type": "mrkdwn", "text": f"*오류:* {stats['errors']}건"},
                     {"type": "mrkdwn", "text": f"*시간:* {datetime.now().strftime('%Y-%m-%d %H:%M')}"},
                 ]
@@ -354,14 +791,29 @@ def notify_slack(webhook_url: str, stats: dict):
     }
     
     try:
-        requests.post(webhook_url, json=message)
+        get_client().post(webhook_url, json=message)
         print("📨 Slack 알림 전송 완료")
     except Exception as e:
         print(f"⚠️ Slack 알림 실패: {e}")
 
 
-def main():
-    """메인 실행"""
+def add_sync_arguments(parser: argparse.ArgumentParser):
+    """동기화 실행 옵션 (bms.py sync / full 공용)"""
+    parser.add_argument("--stream", action="store_true",
+                        help="시트를 청크 단위로 읽으면서 바로 Notion에 쓰는 스트리밍 모드")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--resume", action="store_true",
+                      help="중단된 지난 실행에서 이미 반영된 항목은 건너뛰고 이어서 동기화")
+    mode.add_argument("--retry-failed", action="store_true",
+                      help="지난 실행에서 오류가 난 항목만 다시 전송")
+
+
+def run_sync(args: argparse.Namespace, collect: bool = False) -> Optional[BudgetSyncService]:
+    """동기화 실행 (저널 / 지표 / Slack 알림 포함)
+    
+    collect=True이면 service.synced_pages()로 대시보드 내보내기에 쓸 페이지를 모읍니다.
+    재전송할 실패 항목이 없어 실행하지 않은 경우 None을 반환합니다.
+    """
     # 환경변수 검증
     if not NOTION_API_KEY:
         print("❌ NOTION_API_KEY 환경변수가 설정되지 않았습니다.")
@@ -371,15 +823,66 @@ def main():
     notion = NotionClient(NOTION_API_KEY, NOTION_DATABASE_ID)
     sheets = GoogleSheetsClient(GOOGLE_SHEETS_ID, GOOGLE_CREDENTIALS_JSON)
     
+    index = PageIndex(NOTION_INDEX_PATH) if NOTION_INDEX_PATH else None
+    journal = SyncJournal(SYNC_JOURNAL_PATH) if SYNC_JOURNAL_PATH else None
+    if (args.resume or args.retry_failed) and not journal:
+        print("❌ --resume / --retry-failed에는 SYNC_JOURNAL_PATH가 필요합니다.")
+        exit(1)
+    
+    service = BudgetSyncService(notion, sheets, detect_changes=not SYNC_FORCE_UPDATE,
+                                index=index, journal=journal)
+    service.collect = collect
+    
+    # 저널: 지난 실행 결과로 재개 / 재시도 대상 결정
+    if journal:
+        last = journal.last_run()
+        if args.resume and last and not last["finished"]:
+            service.skip_items = last["committed"]
+            print(f"⏭️  중단된 실행 {last['run_id']} 재개: 반영된 {len(last['committed'])}건 중 내용이 그대로인 항목 건너뜀")
+            journal.start(mode=last["mode"], resume_run=last["run_id"])
+        elif args.retry_failed:
+            if not last or not last["failed"]:
+                print("✅ 지난 실행에서 실패한 항목이 없습니다.")
+                return None
+            service.only_items = set(last["failed"])
+            print(f"🔁 지난 실행 {last['run_id']}의 실패 항목 {len(last['failed'])}건만 재전송")
+            journal.start(mode="retry-failed")
+        else:
+            if args.resume:
+                print("ℹ️  중단된 실행이 없어 전체 동기화합니다.")
+            journal.start(mode="stream" if args.stream else "full")
+    
     # 동기화 실행
-    service = BudgetSyncService(notion, sheets)
-    stats = service.sync()
+    stats = service.sync_streaming() if args.stream else service.sync()
+    if journal:
+        journal.finish(stats)
+    write_run_metrics("sync", **service.metrics())
     
     # Slack 알림
     notify_slack(SLACK_WEBHOOK_URL, stats)
+    return service
+
+
+def main(argv: Optional[List[str]] = None):
+    """메인 실행"""
+    parser = argparse.ArgumentParser(description="Google Sheets → Notion 예산 동기화")
+    parser.add_argument("--compare-sheets", action="store_true",
+                        help="시트 읽기 방식(bulk/기존) 결과만 비교하고 종료")
+    add_sync_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    if args.compare_sheets:
+        sheets = GoogleSheetsClient(GOOGLE_SHEETS_ID, GOOGLE_CREDENTIALS_JSON)
+        diffs = sheets.compare_read_modes()
+        for diff in diffs:
+            print(f"   ≠ {diff}")
+        print(f"{'✅ 결과 일치' if not diffs else f'❌ 차이 {len(diffs)}건'}")
+        exit(1 if diffs else 0)
+    
+    service = run_sync(args)
     
     # 종료 코드
-    exit(1 if stats["errors"] > 0 else 0)
+    exit(1 if service and service.stats["errors"] > 0 else 0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+동기화 저널 (항목별 처리 결과 기록)
+
+sync() 중 Notion에 쓴 항목마다 결과를 한 줄씩(JSON Lines) 즉시 기록합니다.
+실행이 중간에 끊겨도(429 폭주, 러너 타임아웃, 네트워크 오류) 어디까지 반영됐는지 남습니다.
+
+  {"event": "start", "run_id": "...", "mode": "full", "time": "..."}
+  {"event": "item", "run_id": "...", "name": "항목명", "ok": true, "page_id": "...", "hash": "..."}
+  {"event": "item", "run_id": "...", "name": "항목명", "ok": false, "error": "..."}
+  {"event": "end", "run_id": "...", "stats": {...}, "time": "..."}
+
+파일에는 마지막 실행 하나만 보관합니다. --resume은 같은 실행에 이어서 기록하고,
+그 외 실행은 파일을 새로 씁니다. hash는 쓴 속성 내용 해시로, --resume은 시트 내용이
+그 사이 바뀌지 않은(해시가 같은) 항목만 건너뜁니다.
+
+환경변수:
+  - SYNC_JOURNAL_PATH: (선택) 저널 파일 경로 (기본 .cache/sync_journal.jsonl, 빈 값이면 비활성화)
+"""
+
+import os
+import json
+from datetime import datetime
+from typing import Dict, Optional
+
+SYNC_JOURNAL_PATH = os.getenv("SYNC_JOURNAL_PATH", ".cache/sync_journal.jsonl")
+
+
+class SyncJournal:
+    """JSON Lines 기반 동기화 저널"""
+    
+    def __init__(self, path: str = SYNC_JOURNAL_PATH):
+        self.path = path
+        self.run_id: Optional[str] = None
+        self._file = None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def last_run(self) -> Optional[dict]:
+        """마지막 실행 요약
+        
+        {"run_id", "mode", "finished", "committed": {반영된 항목명: 속성 해시}, "failed": {항목명: 오류}}
+        같은 항목이 여러 번 기록되면 마지막 결과를 따릅니다.
+        """
+        if not os.path.exists(self.path):
+            return None
+        
+        run = None
+        outcomes: Dict[str, dict] = {}
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 강제 종료로 마지막 줄이 잘린 경우
+                    continue
+                if entry["event"] == "start" and not entry.get("resume"):
+                    run = {"run_id": entry["run_id"], "mode": entry.get("mode"), "finished": False}
+                    outcomes = {}
+                elif run is None:
+                    continue
+                elif entry["event"] == "start":
+                    run["finished"] = False
+                elif entry["event"] == "item":
+                    outcomes[entry["name"]] = entry
+                elif entry["event"] == "end":
+                    run["finished"] = True
+        
+        if run is None:
+            return None
+        run["committed"] = {name: entry.get("hash") for name, entry in outcomes.items() if entry["ok"]}
+        run["failed"] = {name: entry.get("error", "") for name, entry in outcomes.items() if not entry["ok"]}
+        return run
+    
+    def _write(self, event: str, **fields):
+        line = json.dumps(dict(event=event, run_id=self.run_id, **fields), ensure_ascii=False)
+        self._file.write(line + "\n")
+        # 프로세스가 죽어도 기록이 남도록 줄마다 flush
+        self._file.flush()
+    
+    def start(self, mode: str = "full", resume_run: Optional[str] = None):
+        """실행 시작 기록 (resume_run이 있으면 그 실행에 이어서 기록)"""
+        self.run_id = resume_run or datetime.now().strftime("%Y%m%d-%H%M%S")
+        self._file = open(self.path, "a" if resume_run else "w", encoding="utf-8")
+        self._write("start", mode=mode, resume=bool(resume_run), time=datetime.now().isoformat())
+    
+    def record(self, name: str, page_id: Optional[str] = None, error: Optional[Exception] = None,
+               digest: Optional[str] = None):
+        """항목 처리 결과 기록 (digest: 쓴 속성 내용 해시)"""
+        if self._file is None:
+            return
+        if error is None:
+            self._write("item", name=name, ok=True, page_id=page_id, hash=digest)
+        else:
+            self._write("item", name=name, ok=False, page_id=page_id, error=str(error))
+    
+    def finish(self, stats: dict):
+        """정상 종료 기록 (이 줄이 없으면 중단된 실행으로 간주)"""
+        if self._file is None:
+            return
+        self._write("end", stats=stats, time=datetime.now().isoformat())
+        self._file.close()
+        self._file = None